@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+GUI 시작 import 시간 예산 검사
+
+새 인터프리터에서 gui.main_window를 import하는 데 걸린 시간을 재고,
+예산을 넘거나 지연 로딩 대상 모듈(openpyxl, selenium 등)이 미리 로드되면 실패(종료 코드 1)합니다.
+
+예) python benchmarks/import_budget.py --budget 1.5 --repeat 3
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# 측정용 자식 프로세스에서 실행하는 코드
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+from utils.lazy_import import DEFERRED_MODULES
+loaded = sorted(name for name in DEFERRED_MODULES if name in sys.modules)
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure(module):
+    """새 프로세스에서 모듈 import 시간(초)과 미리 로드된 지연 대상 모듈 목록을 반환합니다."""
+    code = PROBE.format(src=str(SRC_DIR), module=module)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GUI 시작 import 시간 예산 검사")
+    parser.add_argument("--module", default="gui.main_window", help="측정할 모듈 (기본값: gui.main_window)")
+    parser.add_argument("--budget", type=float, default=1.5, help="허용 import 시간(초)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 횟수 (가장 빠른 값을 사용)")
+    args = parser.parse_args(argv)
+
+    try:
+        results = [measure(args.module) for _ in range(max(1, args.repeat))]
+    except subprocess.CalledProcessError as e:
+        print(f"{args.module} import 실패:\n{e.stderr}")
+        return 1
+
+    best = min(result["elapsed"] for result in results)
+    loaded = sorted({name for result in results for name in result["loaded"]})
+    print(f"{args.module} import: {best * 1000:.0f}ms (예산 {args.budget * 1000:.0f}ms)")
+
+    failed = False
+    if best > args.budget:
+        print("실패: import 시간이 예산을 넘었습니다. `python -X importtime`으로 원인을 확인하세요.")
+        failed = True
+    if loaded:
+        print(f"실패: 시작 시 로드되면 안 되는 모듈이 로드되었습니다: {', '.join(loaded)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+성능 측정용 하이웍스 모의 서버
+
+실제 서버 대신 로컬에서 다음을 흉내 냅니다.
+- 2단계 로그인: 로그인 페이지 → 아이디 확인(회사 도메인 리다이렉트 주소 응답) → 비밀번호 로그인(세션 쿠키 발급)
+- 일정 페이지(schedulemain): 세션이 없거나 만료되면 로그인 페이지로 리다이렉트
+- schedule/json/get_schedule_new: 요청 기간의 합성 일정을 JSON으로 응답, 세션 만료 시 로그인 HTML 응답
+- 세션 만료: --session-ttl초가 지나거나 POST /__bench__/expire 요청을 받으면 모든 세션 만료
+
+합성 일정은 --year 한 해에 고르게 --events개를 배치하며, 제목/내용에 HTML 엔티티가 많이 들어갑니다.
+응답을 빠르게 보내도록 날짜별 JSON 조각을 시작할 때 미리 만들어 두므로, 측정값이 서버의 JSON 생성 속도에 묶이지 않습니다.
+
+예) python benchmarks/mock_hiworks.py --events 100000 --port 8765
+    (클라이언트 설정) hiworks.login_url=http://127.0.0.1:8765/login/
+                     hiworks.auth_api_url=http://127.0.0.1:8765/auth
+                     hiworks.calendar_url=http://127.0.0.1:8765/calendar
+"""
+
+import argparse
+import datetime
+import json
+import secrets
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_USER = "bench"
+DEFAULT_PASSWORD = "bench-password"
+DEFAULT_DOMAIN = "bench.example.com"
+
+SESSION_COOKIE = "HWSESSID"
+IDENTIFY_COOKIE = "hw_identify"
+
+# 실제 서버처럼 회사 도메인이 들어간 로그인 주소를 돌려줌 (클라이언트는 주소에서 도메인만 추출)
+REDIRECT_URL_TEMPLATE = "https://login.office.hiworks.com/{domain}/"
+
+# 카테고리 분포 (schedule이 대부분)
+CATEGORIES = ("schedule",) * 7 + ("spacial", "lunar", "birthday")
+
+# 엔티티가 섞인 제목/내용 조각
+SUBJECTS = (
+    "주간 회의 &amp; 업무 공유",
+    "&lt;긴급&gt; 서버 점검 &#40;야간&#41;",
+    "고객사 미팅&nbsp;&ndash;&nbsp;&quot;신규 계약&quot;",
+    "팀 회식 &#127829;&#127866;",
+    "연차&#47;반차 &middot; 외근",
+)
+PROJECTS = ("", "R&amp;D", "영업&#47;마케팅", "&lt;공통&gt;")
+CONTENT = ("&lt;p&gt;안건: &quot;{subject}&quot;&lt;/p&gt;&lt;p&gt;장소&nbsp;: 본사 3층 &amp; 온라인&lt;/p&gt;"
+           "&lt;ul&gt;&lt;li&gt;준비물&#58; 노트북&lt;/li&gt;&lt;li&gt;&#39;참석 필수&#39;&lt;/li&gt;&lt;/ul&gt;")
+
+LOGIN_PAGE = (
+    "<!DOCTYPE html><html><head><title>하이웍스 로그인</title></head>"
+    "<body><form><input name='id'><input type='password' name='password'></form>"
+    "<p>다시 로그인해 주세요.</p></body></html>"
+).encode("utf-8")
+SCHEDULE_PAGE = b"<!DOCTYPE html><html><head><title>schedule</title></head><body>calendar</body></html>"
+
+
+def make_event(index: int, day: datetime.date) -> dict:
+    """합성 일정 하나를 만듭니다. 같은 번호면 항상 같은 일정입니다."""
+    subject = SUBJECTS[index % len(SUBJECTS)]
+    hour = 8 + index % 10
+    all_day = index % 13 == 0
+    start = f"{day.isoformat()} {hour:02d}:{(index * 7) % 60:02d}:00"
+    end = f"{day.isoformat()} {hour + 1:02d}:00:00"
+    return {
+        "id": str(100000 + index),
+        "category": CATEGORIES[index % len(CATEGORIES)],
+        "subject": f"{subject} #{index}",
+        "project_name": PROJECTS[index % len(PROJECTS)],
+        "content": CONTENT.format(subject=subject),
+        "start_date": day.isoformat() if all_day else start,
+        "end_date": day.isoformat() if all_day else end,
+        "allday": "Y" if all_day else "N",
+        "writer": "벤치&#47;사용자",
+    }
+
+
+def build_calendar(events: int, year: int) -> dict:
+    """날짜별로 일정 JSON 조각(쉼표로 이은 바이트)을 만듭니다. {날짜: (개수, 바이트)}"""
+    first = datetime.date(year, 1, 1)
+    days = (datetime.date(year + 1, 1, 1) - first).days
+    buckets = {}
+    for index in range(events):
+        day = first + datetime.timedelta(days=index * days // events)
+        buckets.setdefault(day, []).append(json.dumps(make_event(index, day), ensure_ascii=False))
+    return {day: (len(items), ",".join(items).encode("utf-8")) for day, items in buckets.items()}
+
+
+def parse_date(value: str):
+    try:
+        return datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class MockHiworksState:
+    """모의 서버가 공유하는 계정, 세션, 일정 데이터"""
+
+    def __init__(self, calendar: dict, user: str, password: str, domain: str,
+                 session_ttl: float = 0, latency: float = 0):
+        self.calendar = calendar
+        self.user = user
+        self.password = password
+        self.domain = domain
+        self.session_ttl = session_ttl  # 0이면 만료되지 않음
+        self.latency = latency
+        self._sessions = {}  # 세션 ID -> 발급 시각
+        self._lock = threading.Lock()
+        self.stats = {"logins": 0, "schedule_requests": 0, "expired_responses": 0, "bytes_sent": 0}
+
+    def create_session(self) -> str:
+        session_id = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[session_id] = time.monotonic()
+            self.stats["logins"] += 1
+        return session_id
+
+    def is_valid(self, session_id) -> bool:
+        with self._lock:
+            issued = self._sessions.get(session_id)
+            if issued is None:
+                return False
+            if self.session_ttl and time.monotonic() - issued > self.session_ttl:
+                del self._sessions[session_id]
+                return False
+            return True
+
+    def expire_all(self) -> int:
+        with self._lock:
+            count = len(self._sessions)
+            self._sessions.clear()
+        return count
+
+    def count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def schedule_parts(self, start: datetime.date, end: datetime.date):
+        """기간에 속한 날짜별 조각 목록과 일정 수"""
+        parts = [self.calendar[day] for day in sorted(self.calendar) if start <= day <= end]
+        return [body for _, body in parts], sum(count for count, _ in parts)
+
+
+class MockHiworksHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (클라이언트 연결 풀 재사용)
+    server_version = "MockHiworks/1.0"
+    disable_nagle_algorithm = True  # 헤더와 본문을 나눠 쓸 때 지연 ACK로 요청마다 수십 ms가 더해지지 않도록
+
+    @property
+    def state(self) -> MockHiworksState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 stderr에 쓰지 않음
+
+    # 공통 처리
+
+    def _cookies(self) -> dict:
+        cookies = {}
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name:
+                cookies[name] = value
+        return cookies
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "text/html; charset=utf-8",
+              headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+            self.state.count("bytes_sent", len(body))
+
+    def _send_json(self, status: int, data, headers: dict = None):
+        self._send(status, json.dumps(data, ensure_ascii=False).encode("utf-8"),
+                   "application/json; charset=utf-8", headers)
+
+    def _logged_in(self) -> bool:
+        return self.state.is_valid(self._cookies().get(SESSION_COOKIE))
+
+    def _route(self, method: str):
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        path = urlsplit(self.path).path
+        parts = [part for part in path.split("/") if part]
+        if method == "GET" and parts[:1] == ["login"]:
+            return self._login_page()
+        if method == "POST" and path.endswith("/office-web/identify"):
+            return self._identify()
+        if method == "POST" and path.endswith("/office-web/login"):
+            return self._login()
+        if parts[:1] == ["calendar"] and len(parts) >= 4:
+            if parts[2:] == ["schedule", "schedulemain"]:
+                return self._schedule_main()
+            if parts[2:] == ["schedule", "json", "get_schedule_new"] and method == "POST":
+                return self._get_schedule_new(parts[1])
+        if method == "POST" and path == "/__bench__/expire":
+            return self._send_json(200, {"expired": self.state.expire_all()})
+        if method == "GET" and path == "/__bench__/stats":
+            return self._send_json(200, self.state.stats)
+        self._send(404, b"not found", "text/plain")
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    # 로그인
+
+    def _login_page(self):
+        self._send(200, LOGIN_PAGE, headers={"Set-Cookie": "hw_lang=ko; Path=/"})
+
+    def _identify(self):
+        try:
+            user_id = json.loads(self._read_body() or b"{}").get("id")
+        except ValueError:
+            user_id = None
+        if user_id != self.state.user:
+            return self._send_json(404, {"code": "NOT_FOUND", "message": "존재하지 않는 아이디입니다."})
+        self._send_json(200, {
+            "code": "SUC",
+            "data": {"redirect_url": REDIRECT_URL_TEMPLATE.format(domain=self.state.domain)},
+        }, headers={"Set-Cookie": f"{IDENTIFY_COOKIE}={user_id}; Path=/"})
+
+    def _login(self):
+        try:
+            data = json.loads(self._read_body() or b"{}")
+        except ValueError:
+            data = {}
+        if self._cookies().get(IDENTIFY_COOKIE) != self.state.user:
+            return self._send_json(400, {"code": "BAD_REQUEST", "message": "아이디 확인이 필요합니다."})
+        if data.get("id") != self.state.user or data.get("password") != self.state.password:
+            return self._send_json(401, {"code": "UNAUTHORIZED", "message": "비밀번호가 일치하지 않습니다."})
+        session_id = self.state.create_session()
+        self._send_json(200, {"code": "SUC", "data": {"result": "ok"}},
+                        headers={"Set-Cookie": f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly"})
+
+    # 일정
+
+    def _schedule_main(self):
+        if not self._logged_in():
+            return self._send(302, headers={"Location": f"/login/{self.state.domain}/"})
+        self._send(200, SCHEDULE_PAGE)
+
+    def _get_schedule_new(self, domain: str):
+        form = parse_qs(self._read_body().decode("utf-8"))
+        self.state.count("schedule_requests")
+        if not self._logged_in() or domain != self.state.domain:
+            # 실제 서버처럼 JSON 대신 로그인 페이지 HTML을 200으로 응답
+            self.state.count("expired_responses")
+            return self._send(200, LOGIN_PAGE)
+        start = parse_date((form.get("start") or [""])[0])
+        end = parse_date((form.get("end") or [""])[0])
+        if start is None or end is None:
+            return self._send_json(200, {"code": "SUC", "total": 0, "data": []})
+
+        parts, total = self.state.schedule_parts(start, end)
+        head = json.dumps({"code": "SUC", "total": total}, ensure_ascii=False).encode("utf-8")[:-1] + b',"data":['
+        tail = b"]}"
+        length = len(head) + sum(len(part) for part in parts) + max(len(parts) - 1, 0) + len(tail)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+        self.wfile.write(head)
+        for index, part in enumerate(parts):
+            if index:
+                self.wfile.write(b",")
+            self.wfile.write(part)
+        self.wfile.write(tail)
+        self.state.count("bytes_sent", length)
+
+
+def create_server(events: int, year: int = 2024, host: str = "127.0.0.1", port: int = 0,
+                  user: str = DEFAULT_USER, password: str = DEFAULT_PASSWORD, domain: str = DEFAULT_DOMAIN,
+                  session_ttl: float = 0, latency: float = 0) -> ThreadingHTTPServer:
+    """모의 서버를 만듭니다. serve_forever()로 실행하고, 주소는 server.server_address에 있습니다."""
+    server = ThreadingHTTPServer((host, port), MockHiworksHandler)
+    server.daemon_threads = True
+    server.state = MockHiworksState(build_calendar(events, year), user, password, domain, session_ttl, latency)
+    return server
+
+
+def client_settings(base_url: str) -> dict:
+    """클라이언트가 모의 서버를 사용하도록 바꿀 hiworks 설정 값"""
+    return {
+        "login_url": f"{base_url}/login/",
+        "auth_api_url": f"{base_url}/auth",
+        "calendar_url": f"{base_url}/calendar",
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="성능 측정용 하이웍스 모의 서버")
+    parser.add_argument("--events", type=int, default=10000, help="한 해 동안의 합성 일정 수 (기본값: 10000)")
+    parser.add_argument("--year", type=int, default=2024, help="일정을 배치할 연도 (기본값: 2024)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0이면 빈 포트를 사용")
+    parser.add_argument("--user", default=DEFAULT_USER)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--domain", default=DEFAULT_DOMAIN, help="아이디 확인 후 알려줄 회사 도메인")
+    parser.add_argument("--session-ttl", type=float, default=0, help="세션 유효 시간(초), 0이면 만료되지 않음")
+    parser.add_argument("--latency", type=float, default=0, help="요청마다 추가할 지연 시간(초)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    server = create_server(args.events, args.year, args.host, args.port, args.user, args.password,
+                           args.domain, args.session_ttl, args.latency)
+    host, port = server.server_address[:2]
+    # 실행한 쪽에서 주소를 읽을 수 있도록 준비 완료를 한 줄로 출력
+    print(f"READY http://{host}:{port} ({args.events}개 일정, 준비 {time.perf_counter() - started:.1f}초)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+일정 수집 파이프라인 성능 측정
+
+일정 수마다 모의 하이웍스 서버(mock_hiworks.py)를 띄우고, 새 프로세스에서 다음 단계를 실제 코드로 실행해
+단계별 소요 시간과 최대 메모리 증가량을 잽니다. 실제 하이웍스 서버에는 접속하지 않습니다.
+
+- login: HTTP 2단계 로그인 (회사 도메인 확인, 세션 확인 포함)
+- fetch: 구간별 병렬 요청과 응답 해석, 병합 (fetch_schedule_range)
+- parse: 한 해 전체 응답 본문의 해석만 따로 (read_schedule_response)
+- decode: HTML 엔티티 변환
+- store: EventStore 생성
+- table: GUI 테이블 모델/카테고리 탭 구성 (PyQt6가 있을 때)
+- export.<형식>: 파일 저장 (csv, jsonl, xlsx, parquet 중 사용 가능한 형식)
+- relogin: 세션 만료 감지 후 다시 로그인하여 한 달 요청
+
+결과를 JSON으로 저장해 두면 다른 리비전의 결과와 비교할 수 있습니다.
+
+예) python benchmarks/pipeline_bench.py --events 1000 10000 100000 --output after.json
+    python benchmarks/pipeline_bench.py --events 1000 10000 100000 --compare before.json --threshold 0.2
+
+다른 리비전 측정: git worktree add ../hiworks-base <리비전> 후
+    python benchmarks/pipeline_bench.py --src ../hiworks-base/src --output before.json
+(hiworks.calendar_url 설정을 지원하는 리비전부터 측정할 수 있습니다.)
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+
+DEFAULT_EVENTS = [1000, 10000, 100000]
+DEFAULT_FORMATS = ["csv", "jsonl", "xlsx", "parquet"]
+
+# 비교할 때 이보다 짧은 단계는 측정 오차가 커서 회귀로 보지 않음 (초)
+COMPARE_MIN_SECONDS = 0.05
+
+
+# ---------------------------------------------------------------- 측정 (자식 프로세스)
+
+_qt_app = None  # table 단계용 QApplication (측정 프로세스 동안 유지)
+
+
+def configure_client(base_url: str, args):
+    """설정 파일을 건드리지 않고 메모리의 설정만 모의 서버용으로 바꿉니다. 다른 모듈보다 먼저 호출해야 합니다."""
+    sys.path.insert(0, str(BENCH_DIR))
+    from mock_hiworks import client_settings
+    from config.settings import settings
+
+    hiworks = settings.config.setdefault("hiworks", {})
+    hiworks.update(client_settings(base_url))
+    hiworks.update({
+        "http_login": True, "retry_count": 0,
+        "chunk_unit": args.unit, "max_workers": args.workers,
+    })
+    settings.config["logging"] = dict(settings.config.get("logging", {}),
+                                      level="WARNING", file_path=tempfile.mkdtemp(prefix="hiworks_bench_logs_"))
+    settings.config["diagnostics"] = {"tracing": True, "max_spans": 100000}
+
+
+class StageRecorder:
+    """단계별 소요 시간과 (memory가 참이면) tracemalloc 최대 메모리 증가량을 기록합니다."""
+
+    def __init__(self, memory: bool):
+        self.memory = memory
+        self.results = {}
+
+    def run(self, name, func, *args, **kwargs):
+        import tracemalloc
+        if self.memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        entry = {"seconds": elapsed}
+        if self.memory:
+            entry["peak_mb"] = (tracemalloc.get_traced_memory()[1] - before) / (1024 * 1024)
+        self.results[name] = entry
+        return result
+
+
+def build_table(store):
+    """메인 창의 display_category_tables와 같은 방식으로 모델과 카테고리별 뷰를 구성합니다."""
+    from PyQt6.QtWidgets import QTableView
+    from gui.schedule_table_model import ScheduleTableModel, fit_columns_to_sample
+
+    views = []
+    for rows in store.indices_by_category().values():
+        model = ScheduleTableModel(store, rows)
+        view = QTableView()
+        view.setModel(model)
+        view.setWordWrap(False)
+        fit_columns_to_sample(view)
+        views.append((model, view))
+    return views
+
+
+def run_pass(base_url: str, args, memory: bool) -> dict:
+    """파이프라인을 한 번 실행하고 {단계: {seconds, peak_mb}}와 검증 값을 반환합니다."""
+    import requests
+    from utils.tracing import tracer
+    from utils.html_entities import decode_json_html_entities
+    from scraper.hiworks_scraper import HiworksScraper
+    from scraper.schedule_api import STREAM_CHUNK_SIZE, build_schedule_request, read_schedule_response
+    from schedule.event_store import EventStore
+    from export.registry import export_store
+
+    start, end = f"{args.year}-01-01", f"{args.year}-12-31"
+    recorder = StageRecorder(memory)
+    info = {}
+    tracer.clear()
+
+    scraper = HiworksScraper(headless=True)
+    try:
+        if not recorder.run("login", scraper.login, args.user, args.password):
+            raise RuntimeError("모의 서버 로그인 실패")
+        info["company_domain"] = scraper.company_domain
+
+        url = build_schedule_request(scraper.company_domain, start, end)[0]
+        if not url.startswith(base_url):
+            raise RuntimeError(f"일정 요청이 모의 서버가 아닌 {url}로 향합니다. (hiworks.calendar_url 미지원 리비전)")
+
+        result = recorder.run("fetch", scraper.fetch_schedule_range, start, end, args.unit, args.workers)
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(f"일정 요청 실패: {result['error']}")
+        fetch_spans = [span for span in tracer.spans() if span.name == "http.schedule"]
+        info["requests"] = len(fetch_spans)
+        info["bytes"] = sum(span.attrs.get("bytes", 0) for span in fetch_spans)
+        info["fetch_parse_seconds"] = sum(span.attrs.get("parse_seconds", 0) for span in fetch_spans)
+
+        # 해석만 따로 재기 위해 한 해 전체 본문을 한 번에 받아 둠 (측정에서 제외)
+        url, payload, headers = build_schedule_request(scraper.company_domain, start, end)
+        body = scraper.session.post(url, data=payload, headers=headers).content
+        chunks = [body[pos:pos + STREAM_CHUNK_SIZE] for pos in range(0, len(body), STREAM_CHUNK_SIZE)]
+        recorder.run("parse", read_schedule_response, chunks, "utf-8")
+        del chunks, body
+
+        decoded = recorder.run("decode", decode_json_html_entities, result)
+        del result
+        store = recorder.run("store", EventStore.from_response, decoded, decode_entities=False)
+        del decoded
+        info["rows"] = len(store)
+
+        if args.table:
+            recorder.run("table", build_table, store)
+
+        with tempfile.TemporaryDirectory(prefix="hiworks_bench_export_") as export_dir:
+            info["export_bytes"] = {}
+            for format_name in args.formats:
+                file_path = os.path.join(export_dir, f"schedule.{format_name}")
+                try:
+                    recorder.run(f"export.{format_name}", export_store, store, file_path, format_name)
+                except ImportError as e:  # pyarrow 등 선택 의존성이 없으면 건너뜀
+                    info.setdefault("skipped", []).append(f"export.{format_name}: {e}")
+                    continue
+                info["export_bytes"][format_name] = os.path.getsize(file_path)
+
+        # 세션 만료 후 첫 요청에서 감지하고 다시 로그인하여 한 달을 받는 데 걸리는 시간
+        requests.post(f"{base_url}/__bench__/expire")
+
+        def relogin():
+            expired = scraper.fetch_schedule_json(start, f"{args.year}-01-31")
+            if not (isinstance(expired, dict) and expired.get("need_relogin")):
+                raise RuntimeError("세션 만료를 감지하지 못했습니다.")
+            scraper.session.cookies.clear()
+            if not scraper.login(args.user, args.password):
+                raise RuntimeError("다시 로그인 실패")
+            retried = scraper.fetch_schedule_json(start, f"{args.year}-01-31")
+            if isinstance(retried, dict) and "error" in retried:
+                raise RuntimeError(f"다시 로그인한 뒤 요청 실패: {retried['error']}")
+
+        recorder.run("relogin", relogin)
+    finally:
+        scraper.close()
+    return {"stages": recorder.results, "info": info}
+
+
+def child_main(args) -> int:
+    """측정 프로세스: 결과를 마지막 줄에 JSON으로 출력합니다."""
+    global _qt_app
+    sys.path.insert(0, str(Path(args.src).resolve()))
+    configure_client(args.url, args)
+    if args.table:
+        try:
+            from PyQt6.QtWidgets import QApplication
+        except ImportError:
+            args.table = False
+        else:
+            _qt_app = QApplication.instance() or QApplication([sys.argv[0], "-platform", "offscreen"])
+
+    # 시간 측정은 tracemalloc 없이 여러 번 실행해 가장 빠른 값을 사용
+    passes = [run_pass(args.url, args, memory=False) for _ in range(max(1, args.repeat))]
+    stages = {
+        name: {"seconds": min(result["stages"][name]["seconds"] for result in passes)}
+        for name in passes[0]["stages"]
+    }
+    if args.memory:
+        import tracemalloc
+        tracemalloc.start()
+        memory_pass = run_pass(args.url, args, memory=True)
+        tracemalloc.stop()
+        for name, entry in memory_pass["stages"].items():
+            stages.setdefault(name, {})["peak_mb"] = entry["peak_mb"]
+
+    output = {"stages": stages, "info": passes[0]["info"]}
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        output["max_rss_mb"] = max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    except ImportError:  # Windows
+        pass
+    print(json.dumps(output, ensure_ascii=False))
+    return 0
+
+
+# ---------------------------------------------------------------- 실행/비교 (부모 프로세스)
+
+def start_server(events: int, args):
+    """모의 서버를 새 프로세스로 띄우고 (프로세스, 주소)를 반환합니다."""
+    command = [sys.executable, str(BENCH_DIR / "mock_hiworks.py"), "--events", str(events),
+               "--year", str(args.year), "--user", args.user, "--password", args.password,
+               "--latency", str(args.latency)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("READY "):
+        process.kill()
+        raise RuntimeError(f"모의 서버를 시작하지 못했습니다: {line!r}")
+    return process, line.split()[1]
+
+
+def measure(events: int, args) -> dict:
+    """일정 수 하나를 측정합니다. 모의 서버와 측정 프로세스를 새로 띄웁니다."""
+    server, base_url = start_server(events, args)
+    try:
+        command = [sys.executable, str(Path(__file__).resolve()), "--child", "--url", base_url,
+                   "--src", str(args.src), "--year", str(args.year), "--unit", args.unit,
+                   "--workers", str(args.workers), "--repeat", str(args.repeat),
+                   "--user", args.user, "--password", args.password,
+                   "--formats", *args.formats]
+        if not args.memory:
+            command.append("--no-memory")
+        if not args.table:
+            command.append("--no-table")
+        env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+        output = subprocess.run(command, capture_output=True, text=True, env=env)
+        if output.returncode != 0:
+            raise RuntimeError(f"측정 실패 ({events}개):\n{output.stderr}")
+        return json.loads(output.stdout.strip().splitlines()[-1])
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def git_revision(src: Path) -> dict:
+    """측정한 소스의 리비전과 수정 여부"""
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=src,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--", "."], cwd=src,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"revision": None, "dirty": None}
+    return {"revision": revision, "dirty": dirty}
+
+
+def print_results(report: dict):
+    for events, result in report["results"].items():
+        info = result["info"]
+        print(f"\n일정 {int(events):,}개: 행 {info.get('rows', 0):,}, 요청 {info.get('requests', 0)}회, "
+              f"응답 {info.get('bytes', 0) / (1024 * 1024):.1f}MB"
+              + (f", 최대 RSS {result['max_rss_mb']:.0f}MB" if "max_rss_mb" in result else ""))
+        for name, entry in result["stages"].items():
+            memory = f"{entry['peak_mb']:9.1f}MB" if "peak_mb" in entry else ""
+            print(f"  {name:<16}{entry['seconds'] * 1000:10.1f}ms{memory}")
+        for skipped in info.get("skipped", []):
+            print(f"  (건너뜀) {skipped}")
+
+
+def compare(report: dict, baseline: dict, threshold) -> bool:
+    """기준 결과와 단계별 시간을 비교해 출력합니다. threshold를 넘게 느려진 단계가 있으면 False"""
+    print(f"\n비교: {baseline.get('revision')} → {report.get('revision')} (비율 = 현재/기준)")
+    ok = True
+    for events, result in report["results"].items():
+        base_result = baseline.get("results", {}).get(events)
+        if base_result is None:
+            continue
+        print(f"일정 {int(events):,}개")
+        for name, entry in result["stages"].items():
+            base_entry = base_result["stages"].get(name)
+            if not base_entry or not base_entry["seconds"]:
+                continue
+            ratio = entry["seconds"] / base_entry["seconds"]
+            mark = ""
+            if threshold is not None and ratio > 1 + threshold and base_entry["seconds"] >= COMPARE_MIN_SECONDS:
+                mark = "  ← 느려짐"
+                ok = False
+            print(f"  {name:<16}{base_entry['seconds'] * 1000:10.1f}ms → {entry['seconds'] * 1000:10.1f}ms"
+                  f"  x{ratio:.2f}{mark}")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="일정 수집 파이프라인 성능 측정 (모의 하이웍스 서버 사용)")
+    parser.add_argument("--events", type=int, nargs="+", default=DEFAULT_EVENTS,
+                        help="측정할 한 해 일정 수 (여러 개 가능, 기본값: 1000 10000 100000, 최대 1000000 권장)")
+    parser.add_argument("--year", type=int, default=2024, help="조회할 연도 (기본값: 2024)")
+    parser.add_argument("--unit", choices=["month", "week"], default="month", help="구간 분할 단위")
+    parser.add_argument("--workers", type=int, default=4, help="동시 요청 수")
+    parser.add_argument("--repeat", type=int, default=1, help="시간 측정 반복 횟수 (가장 빠른 값을 사용)")
+    parser.add_argument("--formats", nargs="+", default=DEFAULT_FORMATS, help="측정할 내보내기 형식")
+    parser.add_argument("--latency", type=float, default=0, help="모의 서버 요청당 지연 시간(초)")
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="tracemalloc 최대 메모리 측정을 생략 (측정 시간이 약 절반)")
+    parser.add_argument("--no-table", dest="table", action="store_false", help="GUI 테이블 구성 단계를 생략")
+    parser.add_argument("--src", default=str(SRC_DIR), help="측정할 소스 디렉토리 (다른 리비전의 worktree)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", metavar="FILE", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float,
+                        help="--compare에서 이 비율보다 더 느려진 단계가 있으면 실패 (예: 0.2 = 20%%)")
+    parser.add_argument("--user", default="bench", help=argparse.SUPPRESS)
+    parser.add_argument("--password", default="bench-password", help=argparse.SUPPRESS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return child_main(args)
+
+    src = Path(args.src).resolve()
+    report = {
+        **git_revision(src),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"year": args.year, "unit": args.unit, "workers": args.workers, "repeat": args.repeat,
+                   "latency": args.latency, "formats": args.formats},
+        "results": {},
+    }
+    try:
+        for events in args.events:
+            print(f"일정 {events:,}개 측정 중...", flush=True)
+            report["results"][str(events)] = measure(events, args)
+    except RuntimeError as e:
+        print(e)
+        return 1
+
+    print_results(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과를 저장했습니다 -> {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(report, baseline, args.threshold):
+            print("실패: 기준보다 느려진 단계가 있습니다.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
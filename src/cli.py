@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+하이웍스 스케줄 관리자 - 명령줄(배치) 실행 파일
+
+PyQt 없이 저장된 자격 증명으로 로그인하여 일정을 받아 파일로 저장합니다.
+예) python src/cli.py --range 2024-01-01:2024-12-31 --format csv --workers 4
+"""
+
+import argparse
+import datetime
+import getpass
+import json
+import os
+import re
+import signal
+import sys
+import threading
+from pathlib import Path
+
+# 현재 파일의 디렉토리를 Python 경로에 추가
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))
+
+# 응답 원본을 그대로 저장하는 형식 (나머지는 export.registry의 내보내기 형식)
+RAW_FORMAT = "json"
+
+
+def parse_range(value):
+    """'YYYY-MM-DD:YYYY-MM-DD' 형식의 조회 기간을 해석합니다."""
+    try:
+        start, end = value.split(":", 1)
+        datetime.datetime.strptime(start, "%Y-%m-%d")
+        datetime.datetime.strptime(end, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"기간 형식이 올바르지 않습니다 (YYYY-MM-DD:YYYY-MM-DD): {value}")
+    if start > end:
+        raise argparse.ArgumentTypeError(f"시작일이 종료일보다 늦습니다: {value}")
+    return start, end
+
+
+def build_parser():
+    from config.settings import settings
+    from export.registry import EXPORTERS
+
+    parser = argparse.ArgumentParser(description="하이웍스 일정을 받아 파일로 저장합니다. (GUI 없이 실행)")
+    parser.add_argument("--range", dest="ranges", type=parse_range, action="append",
+                        help="조회 기간 YYYY-MM-DD:YYYY-MM-DD (여러 번 지정 가능, 기본값: 이번 달)")
+    parser.add_argument("--format", choices=[RAW_FORMAT] + sorted(EXPORTERS),
+                        help="출력 형식 (기본값: json 응답 원본, --sync에서는 data.excel_format)")
+    parser.add_argument("--output", default=settings.get("data.export_path", "./data/exports/"),
+                        help="출력 디렉토리 (기본값: 설정의 data.export_path)")
+    parser.add_argument("--workers", type=int, default=settings.get("hiworks.max_workers", 4),
+                        help="구간별 동시 요청 수")
+    parser.add_argument("--unit", choices=["month", "week"], default=settings.get("hiworks.chunk_unit", "month"),
+                        help="긴 기간을 나눌 단위")
+    parser.add_argument("--no-cache", action="store_true", help="로컬 일정 캐시를 사용하지 않습니다.")
+    parser.add_argument("--sync", action="store_true",
+                        help="이번 달부터 data.sync_months_ahead개월 뒤까지를 주기적으로 받아 바뀌었을 때만 내보냅니다.")
+    parser.add_argument("--interval", type=int, default=settings.get("data.sync_interval", 1800),
+                        help="--sync 동기화 주기(초)")
+    parser.add_argument("--once", action="store_true", help="--sync를 한 번만 실행하고 종료합니다.")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="로그인/요청/해석/저장 구간별 소요 시간을 파일로 저장합니다. (종료 시)")
+    parser.add_argument("--trace-format", choices=["chrome", "json"], default="chrome",
+                        help="--trace 형식: chrome(chrome://tracing, Perfetto) 또는 json(요약 포함)")
+
+    accounts = parser.add_argument_group("여러 계정")
+    accounts.add_argument("--all-accounts", action="store_true",
+                          help="계정 레지스트리의 모든 계정 일정을 병렬로 받아 계정 태그와 함께 저장합니다.")
+    accounts.add_argument("--list-accounts", action="store_true", help="등록된 계정 목록을 표시합니다.")
+    accounts.add_argument("--add-account", metavar="NAME", help="계정을 등록합니다. (아이디/비밀번호는 입력 받음)")
+    accounts.add_argument("--domain", help="--add-account로 등록할 계정의 회사 도메인 (예: example.com)")
+    accounts.add_argument("--remove-account", metavar="NAME", help="등록된 계정을 삭제합니다.")
+    return parser
+
+
+def current_month_range():
+    today = datetime.date.today()
+    first_day = today.replace(day=1)
+    next_month = (first_day + datetime.timedelta(days=32)).replace(day=1)
+    return first_day.strftime("%Y-%m-%d"), (next_month - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def safe_file_name(name):
+    """계정 이름 등을 파일 이름에 쓸 수 있게 바꿉니다. (경로 구분자, 예약 문자, 공백 -> _)"""
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", name).strip("._") or "account"
+
+
+def write_output(result, store, file_path, output_format):
+    """일정을 지정한 형식으로 저장합니다."""
+    from export.registry import export_store
+
+    if output_format == RAW_FORMAT:
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        return
+    export_store(store, file_path, output_format)
+
+
+def run_sync(args, credentials, credential_manager):
+    """동기화 모드: 로그인 세션을 유지하며 주기적으로 일정을 받아 변경 시 내보냅니다."""
+    from utils.logger import logger
+    from utils.session_store import SessionStore
+    from scraper.hiworks_scraper import HiworksScraper
+    from schedule.sync import ScheduleSyncer
+
+    stop_event = threading.Event()
+    # 서비스로 실행할 때 SIGTERM으로도 정상 종료
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    with HiworksScraper(headless=True, session_store=SessionStore(credential_manager)) as scraper:
+        syncer = ScheduleSyncer(scraper, credentials["username"], credentials["password"],
+                                export_path=args.output, format_name=args.format, interval=args.interval)
+        if args.once:
+            summary = syncer.sync_once()
+            if "error" in summary:
+                return 1
+            print(f"{summary['range'][0]} ~ {summary['range'][1]}: {summary['count']}개 일정, "
+                  f"{'변경됨 -> ' + str(summary['file_path']) if summary['changed'] else '변경 없음'}")
+            return 0
+        try:
+            syncer.run(stop_event)
+        except KeyboardInterrupt:
+            logger.info("사용자에 의해 동기화가 중단되었습니다.")
+    return 0
+
+
+def manage_accounts(args, credential_manager):
+    """계정 레지스트리 관리 명령을 처리합니다."""
+    from utils.account_registry import AccountRegistry
+
+    registry = AccountRegistry(credential_manager)
+    if args.add_account:
+        username = input("아이디: ").strip()
+        password = getpass.getpass("비밀번호: ")
+        return 0 if registry.save_account(args.add_account, username, password, args.domain) else 1
+    if args.remove_account:
+        if not registry.delete_account(args.remove_account):
+            print(f"등록되지 않은 계정입니다: {args.remove_account}")
+            return 1
+        return 0
+    for account in registry.list_accounts():
+        state = "" if account.get("enabled", True) else " (사용 안 함)"
+        print(f"{account['name']}: {account['username']} @ {account.get('company_domain') or '자동 확인'}{state}")
+    return 0
+
+
+def run_all_accounts(args, credential_manager, output_format, ranges, cache):
+    """등록된 모든 계정의 일정을 병렬로 받아 저장합니다."""
+    from utils.logger import logger
+    from utils.account_registry import AccountRegistry
+    from utils.html_entities import decode_json_html_entities
+    from scraper.multi_account import ACCOUNT_KEY, MultiAccountCollector
+    from schedule.event_store import EventStore
+    from export.registry import get_exporter
+
+    accounts = AccountRegistry(credential_manager).list_accounts(enabled_only=True)
+    if not accounts:
+        logger.error("등록된 계정이 없습니다. --add-account로 계정을 등록하세요.")
+        return 1
+
+    collector = MultiAccountCollector(accounts, credential_manager, max_workers=args.workers)
+    exit_code = 0
+    for start, end in ranges:
+        collected = decode_json_html_entities(collector.collect(start, end, unit=args.unit, cache=cache))
+        if output_format == RAW_FORMAT:
+            # 모든 계정을 합친 목록 하나 (일정마다 account/company_domain 태그)
+            file_path = os.path.join(args.output, f"accounts_{start}_{end}.json")
+            write_output(collected, None, file_path, output_format)
+            print(f"{start} ~ {end}: {len(collected['data'])}개 일정 -> {file_path}")
+        for name, summary in collected["accounts"].items():
+            if "error" in summary:
+                print(f"{start} ~ {end} [{name}]: 실패 - {summary['error']}")
+                exit_code = 1
+                continue
+            if output_format == RAW_FORMAT:
+                continue
+            # 표 형식은 계정별 파일로 저장 (같은 회사의 계정끼리 덮어쓰지 않도록 계정 이름 사용)
+            store = EventStore.from_response(
+                [schedule for schedule in collected["data"] if schedule[ACCOUNT_KEY] == name], decode_entities=False
+            )
+            file_path = os.path.join(args.output, f"{safe_file_name(name)}_{start}_{end}{get_exporter(output_format).extension}")
+            write_output(None, store, file_path, output_format)
+            print(f"{start} ~ {end} [{name}]: {len(store)}개 일정 -> {file_path}")
+    return exit_code
+
+
+def main(argv=None):
+    """명령줄 메인 함수"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.sync and args.format == RAW_FORMAT:
+        parser.error("--sync는 json 원본 형식을 지원하지 않습니다. xlsx, csv, jsonl, parquet 중에서 선택하세요.")
+
+    if not args.trace:
+        return run(args)
+    from utils.tracing import tracer
+    try:
+        return run(args)
+    finally:
+        count = tracer.dump(args.trace, args.trace_format)
+        print(f"구간 {count}개를 기록했습니다 -> {args.trace}")
+
+
+def run(args):
+    """인자에 따라 계정 관리, 여러 계정 수집, 동기화, 기간별 저장 중 하나를 실행합니다."""
+    from utils.logger import logger
+    from utils.credential_manager import CredentialManager
+    from utils.session_store import SessionStore
+    from utils.html_entities import decode_json_html_entities
+    from scraper.hiworks_scraper import HiworksScraper
+    from schedule.cache import ScheduleCache
+    from schedule.event_store import EventStore
+    from export.registry import get_exporter
+    from utils.tracing import tracer
+
+    credential_manager = CredentialManager()
+    if args.list_accounts or args.add_account or args.remove_account:
+        return manage_accounts(args, credential_manager)
+
+    output_format = args.format or RAW_FORMAT
+    ranges = args.ranges or [current_month_range()]
+    if args.all_accounts:
+        os.makedirs(args.output, exist_ok=True)
+        cache = None if args.no_cache else ScheduleCache()
+        try:
+            return run_all_accounts(args, credential_manager, output_format, ranges, cache)
+        finally:
+            if cache is not None:
+                cache.close()
+
+    credentials = credential_manager.load_credentials()
+    if not credentials:
+        logger.error("저장된 자격 증명이 없습니다. GUI에서 '자격 증명 저장'을 선택하고 한 번 로그인하세요.")
+        return 1
+
+    if args.sync:
+        return run_sync(args, credentials, credential_manager)
+
+    os.makedirs(args.output, exist_ok=True)
+    cache = None if args.no_cache else ScheduleCache()
+
+    try:
+        with HiworksScraper(headless=True, session_store=SessionStore(credential_manager)) as scraper:
+            if not scraper.login(credentials["username"], credentials["password"]):
+                logger.error("로그인에 실패했습니다.")
+                return 1
+
+            for start, end in ranges:
+                result = scraper.fetch_schedule_range(start, end, unit=args.unit, max_workers=args.workers, cache=cache)
+                if isinstance(result, dict) and "error" in result:
+                    logger.error(f"일정 요청 실패 ({start} ~ {end}): {result.get('error')}")
+                    return 1
+
+                with tracer.span("decode.entities", "process"):
+                    decoded = decode_json_html_entities(result)
+                with tracer.span("store.build", "process") as span:
+                    store = EventStore.from_response(decoded, decode_entities=False)
+                    span.set(rows=len(store))
+                domain = scraper.company_domain or "hiworks"
+                extension = ".json" if output_format == RAW_FORMAT else get_exporter(output_format).extension
+                file_path = os.path.join(args.output, f"{domain}_{start}_{end}{extension}")
+                write_output(decoded, store, file_path, output_format)
+                print(f"{start} ~ {end}: {len(store)}개 일정 -> {file_path}")
+    finally:
+        if cache is not None:
+            cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,11 @@
 # 하이웍스 관련 상수
 HIWORKS_LOGIN_URL = "https://login.office.hiworks.com/"
 HIWORKS_DOMAIN = "office.hiworks.com"
+HIWORKS_AUTH_API_URL = "https://auth-api.office.hiworks.com"
+HIWORKS_CALENDAR_URL = "https://calendar.office.hiworks.com"
+
+# HTTP 요청 관련 상수
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
 # GUI 관련 상수
 APP_NAME = "하이웍스 스케줄 관리자"
@@ -16,6 +21,8 @@ THEME_LIGHT = "light"
 # 파일 확장자
 EXCEL_EXTENSIONS = [".xlsx", ".xls"]
 CSV_EXTENSIONS = [".csv"]
+JSONL_EXTENSIONS = [".jsonl"]
+PARQUET_EXTENSIONS = [".parquet"]
 
 # 로그 레벨
 LOG_LEVELS = {
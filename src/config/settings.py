@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import threading
 from typing import Dict, Any
 
 
@@ -29,6 +30,8 @@ class Settings:
         else:
             self.config_file = config_file
             
+        # 로그인 작업 스레드와 GUI 스레드가 함께 값을 바꾸고 저장하므로 변경/저장을 이 잠금으로 묶음
+        self.lock = threading.RLock()
         self.config = self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
@@ -49,7 +52,23 @@ class Settings:
             "hiworks": {
                 "login_url": "https://login.office.hiworks.com/",
                 "timeout": 30,
-                "retry_count": 3
+                "connect_timeout": 10,
+                "retry_count": 3,
+                "pool_connections": 4,
+                "pool_maxsize": 8,
+                "chunk_unit": "month",
+                "max_workers": 4,
+                "max_accounts": 4,
+                "http_login": True,
+                "async_fetch": True,
+                "driver_pool_size": 1,
+                "driver_max_uses": 20,
+                "prewarm_driver": False,
+                "chromedriver_path": "",
+                "selector_hints": {},
+                "session_max_age": 28800,
+                "auth_api_url": "https://auth-api.office.hiworks.com",
+                "calendar_url": "https://calendar.office.hiworks.com"
             },
             "gui": {
                 "theme": "dark",
@@ -59,21 +78,35 @@ class Settings:
             "data": {
                 "export_path": "./data/exports/",
                 "auto_save": True,
-                "excel_format": "xlsx"
+                "excel_format": "xlsx",
+                "use_cache": True,
+                "cache_ttl": 600,
+                "cache_past_ttl": 86400,
+                "sync_interval": 1800,
+                "sync_months_ahead": 1
             },
             "logging": {
                 "level": "INFO",
-                "file_path": "./logs/"
+                "file_path": "./logs/",
+                "rotation": "size",
+                "max_bytes": 10485760,
+                "backup_count": 5,
+                "when": "midnight"
+            },
+            "diagnostics": {
+                "tracing": True,
+                "max_spans": 10000
             }
         }
     
     def save_config(self):
         """설정을 파일에 저장합니다."""
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"설정 파일 저장 중 오류: {e}")
+        with self.lock:
+            try:
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.config, f, indent=2, ensure_ascii=False)
+            except Exception as e:
+                print(f"설정 파일 저장 중 오류: {e}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """설정 값을 가져옵니다."""
@@ -91,15 +124,16 @@ class Settings:
     def set(self, key: str, value: Any):
         """설정 값을 설정합니다."""
         keys = key.split('.')
-        config = self.config
-        
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        
-        config[keys[-1]] = value
-        self.save_config()
+        with self.lock:
+            config = self.config
+            
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            
+            config[keys[-1]] = value
+            self.save_config()
 
 
 # 전역 설정 인스턴스
@@ -0,0 +1 @@
+# Export Package 
\ No newline at end of file
@@ -0,0 +1,85 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from schedule.event_store import EventStore
+
+
+# 한 번에 기록하는 행 수 (진행 상황도 이 단위로 알림)
+CHUNK_SIZE = 1000
+
+# 기록 중인 파일에 붙이는 확장자 (완료되면 원래 이름으로 바꿈)
+PARTIAL_SUFFIX = ".part"
+
+ProgressCallback = Callable[[int, int], Optional[bool]]
+
+
+class ExportCancelled(Exception):
+    """progress 콜백이 False를 반환해 내보내기가 중단됨"""
+
+
+class ProgressTracker:
+    """기록한 행 수를 세고 progress 콜백을 호출합니다. 콜백이 False를 반환하면 ExportCancelled를 발생시킵니다."""
+
+    def __init__(self, total: int, callback: Optional[ProgressCallback] = None):
+        self.total = total
+        self.done = 0
+        self.callback = callback
+
+    def advance(self, count: int):
+        self.done += count
+        if self.callback is not None and self.callback(self.done, self.total) is False:
+            raise ExportCancelled()
+
+
+class Exporter(ABC):
+    """
+    내보내기 형식의 기본 클래스.
+
+    하위 클래스는 format_name, description, extensions와 write()를 정의합니다.
+    write()는 카테고리별 행 번호를 chunk_size 단위로 읽어 바로 기록해야 합니다.
+    """
+    format_name = ""
+    description = ""  # 파일 대화상자에 표시할 이름
+    extensions: List[str] = []
+    chunk_size = CHUNK_SIZE
+
+    @property
+    def extension(self) -> str:
+        return self.extensions[0]
+
+    def export(self, store: EventStore, file_path: str, categories: Optional[Sequence[str]] = None,
+               progress: Optional[ProgressCallback] = None) -> int:
+        """
+        일정을 파일로 내보냅니다. categories가 없으면 모든 카테고리를 내보냅니다.
+        임시 파일에 기록한 뒤 완료되면 file_path로 바꾸므로, 중단되어도 기존 파일은 그대로 남습니다.
+        기록한 행 수를 반환하며, 중단되면 -1을 반환합니다.
+        """
+        groups = [(category, store.indices_for_category(category))
+                  for category in (categories if categories is not None else store.categories)]
+        tracker = ProgressTracker(sum(len(rows) for _, rows in groups), progress)
+        partial_path = file_path + PARTIAL_SUFFIX
+        try:
+            self.write(store, partial_path, groups, tracker)
+        except ExportCancelled:
+            self._remove(partial_path)
+            return -1
+        except Exception:
+            self._remove(partial_path)
+            raise
+        os.replace(partial_path, file_path)
+        return tracker.done
+
+    @abstractmethod
+    def write(self, store: EventStore, file_path: str, groups: List[Tuple[str, Sequence[int]]],
+              tracker: ProgressTracker):
+        """groups의 행을 file_path에 기록합니다. 청크마다 tracker.advance()를 호출합니다."""
+
+    def iter_chunks(self, rows: Sequence[int]) -> Iterator[Sequence[int]]:
+        """행 번호를 chunk_size 단위로 나눕니다."""
+        for offset in range(0, len(rows), self.chunk_size):
+            yield rows[offset:offset + self.chunk_size]
+
+    @staticmethod
+    def _remove(path: str):
+        if os.path.exists(path):
+            os.remove(path)
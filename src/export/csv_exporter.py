@@ -0,0 +1,23 @@
+import csv
+from typing import List, Sequence, Tuple
+from config.constants import CSV_EXTENSIONS
+from export.base import Exporter, ProgressTracker
+from schedule.event_store import COLUMN_HEADERS, EventStore
+
+
+class CsvExporter(Exporter):
+    """모든 카테고리를 한 파일에 기록하는 CSV 내보내기 (첫 컬럼: 카테고리)"""
+    format_name = "csv"
+    description = "CSV"
+    extensions = CSV_EXTENSIONS
+
+    def write(self, store: EventStore, file_path: str, groups: List[Tuple[str, Sequence[int]]],
+              tracker: ProgressTracker):
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["카테고리"] + COLUMN_HEADERS)
+            for category, rows in groups:
+                for chunk in self.iter_chunks(rows):
+                    writer.writerows((category,) + store.row(row) for row in chunk)
+                    tracker.advance(len(chunk))
@@ -0,0 +1,27 @@
+import json
+import os
+from export.base import PARTIAL_SUFFIX
+from export.jsonl_exporter import JSONL_FIELDS
+from schedule.diff import REMOVED, ChangeSet, changed_rows, event_key
+from schedule.event_store import EventStore
+
+
+def export_delta(store: EventStore, changes: ChangeSet, file_path: str) -> int:
+    """
+    변경된 일정만 JSON Lines로 기록합니다.
+    추가/수정된 일정은 {"change", "key", id, category, start, ...} 전체를, 삭제된 일정은 {"change", "key"}만 씁니다.
+    기록한 줄 수를 반환합니다.
+    """
+    partial_path = file_path + PARTIAL_SUFFIX
+    written = 0
+    with open(partial_path, "w", encoding="utf-8") as f:
+        for row, kind in changed_rows(store, changes).items():
+            record = {"change": kind, "key": event_key(store, row)}
+            record.update(zip(JSONL_FIELDS, (store.ids[row], store.category_of(row)) + store.row(row)))
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            written += 1
+        for key in changes.removed:
+            f.write(json.dumps({"change": REMOVED, "key": key}, ensure_ascii=False) + "\n")
+            written += 1
+    os.replace(partial_path, file_path)
+    return written
@@ -0,0 +1,28 @@
+import json
+from typing import List, Sequence, Tuple
+from config.constants import JSONL_EXTENSIONS
+from export.base import Exporter, ProgressTracker
+from schedule.event_store import EventStore
+
+
+# 한 줄(일정 하나)에 기록하는 키 (id, category 다음은 EventStore 표시 컬럼 순서)
+JSONL_FIELDS = ("id", "category", "start", "end", "subject", "project", "content")
+
+
+class JsonlExporter(Exporter):
+    """일정 하나를 JSON 한 줄로 기록하는 JSON Lines 내보내기"""
+    format_name = "jsonl"
+    description = "JSON Lines"
+    extensions = JSONL_EXTENSIONS
+
+    def write(self, store: EventStore, file_path: str, groups: List[Tuple[str, Sequence[int]]],
+              tracker: ProgressTracker):
+        with open(file_path, "w", encoding="utf-8") as f:
+            for category, rows in groups:
+                for chunk in self.iter_chunks(rows):
+                    f.writelines(
+                        json.dumps(dict(zip(JSONL_FIELDS, (store.ids[row], category) + store.row(row))),
+                                   ensure_ascii=False) + "\n"
+                        for row in chunk
+                    )
+                    tracker.advance(len(chunk))
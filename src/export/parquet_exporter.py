@@ -0,0 +1,61 @@
+from typing import List, Sequence, Tuple
+from config.constants import PARQUET_EXTENSIONS
+from export.base import Exporter, ProgressTracker
+from schedule.event_store import EventStore
+from utils.datetime_parser import MISSING_TIMESTAMP
+
+
+class ParquetExporter(Exporter):
+    """
+    타입이 있는 컬럼으로 기록하는 Parquet 내보내기 (pyarrow 필요).
+    시작/종료 일시는 timestamp(초), 카테고리는 dictionary 문자열이며 chunk_size 행마다 row group 하나를 씁니다.
+    """
+    format_name = "parquet"
+    description = "Parquet"
+    extensions = PARQUET_EXTENSIONS
+    chunk_size = 65536
+
+    @staticmethod
+    def schema():
+        import pyarrow as pa
+        return pa.schema([
+            ("id", pa.string()),
+            ("category", pa.dictionary(pa.int32(), pa.string())),
+            ("start", pa.timestamp("s")),
+            ("end", pa.timestamp("s")),
+            ("subject", pa.string()),
+            ("project", pa.string()),
+            ("content", pa.string()),
+        ])
+
+    def write(self, store: EventStore, file_path: str, groups: List[Tuple[str, Sequence[int]]],
+              tracker: ProgressTracker):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet으로 내보내려면 pyarrow가 필요합니다. (pip install pyarrow)")
+
+        schema = self.schema()
+        texts = store.text_table.values
+        with pq.ParquetWriter(file_path, schema) as writer:
+            for category, rows in groups:
+                for chunk in self.iter_chunks(rows):
+                    columns = [
+                        pa.array([store.ids[row] for row in chunk], pa.string()),
+                        pa.DictionaryArray.from_arrays(pa.array([0] * len(chunk), pa.int32()),
+                                                       pa.array([category], pa.string())),
+                        self._timestamps(pa, store.starts, chunk),
+                        self._timestamps(pa, store.ends, chunk),
+                        pa.array([texts[store.subjects[row]] for row in chunk], pa.string()),
+                        pa.array([texts[store.projects[row]] for row in chunk], pa.string()),
+                        pa.array([texts[store.contents[row]] for row in chunk], pa.string()),
+                    ]
+                    writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+                    tracker.advance(len(chunk))
+
+    @staticmethod
+    def _timestamps(pa, column, chunk):
+        """해석하지 못한 일시(MISSING_TIMESTAMP)는 null로 기록합니다."""
+        values = (column[row] for row in chunk)
+        return pa.array([None if value == MISSING_TIMESTAMP else value for value in values], pa.timestamp("s"))
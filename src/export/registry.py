@@ -0,0 +1,61 @@
+import os
+from typing import Dict, Optional, Sequence, Type
+from config.settings import settings
+from export.base import Exporter, ProgressCallback
+from export.csv_exporter import CsvExporter
+from export.jsonl_exporter import JsonlExporter
+from export.parquet_exporter import ParquetExporter
+from export.xlsx_exporter import XlsxExporter
+from schedule.event_store import EventStore
+from utils.tracing import tracer
+
+
+# 형식 이름별 내보내기 클래스 (register_exporter로 추가)
+EXPORTERS: Dict[str, Type[Exporter]] = {}
+
+
+def register_exporter(exporter_class: Type[Exporter]) -> Type[Exporter]:
+    """내보내기 형식을 등록합니다. 클래스 데코레이터로도 사용할 수 있습니다."""
+    EXPORTERS[exporter_class.format_name] = exporter_class
+    return exporter_class
+
+
+for _exporter_class in (XlsxExporter, CsvExporter, JsonlExporter, ParquetExporter):
+    register_exporter(_exporter_class)
+
+
+def get_exporter(format_name: str) -> Exporter:
+    exporter_class = EXPORTERS.get(format_name)
+    if exporter_class is None:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {format_name}")
+    return exporter_class()
+
+
+def format_for_path(file_path: str) -> Optional[str]:
+    """파일 확장자에 맞는 형식 이름을 반환합니다. 없으면 None을 반환합니다."""
+    extension = os.path.splitext(file_path)[1].lower()
+    for format_name, exporter_class in EXPORTERS.items():
+        if extension in exporter_class.extensions:
+            return format_name
+    return None
+
+
+def file_dialog_filters() -> str:
+    """QFileDialog에 넘길 형식 필터 문자열 (예: "Excel (*.xlsx);;CSV (*.csv)")"""
+    return ";;".join(
+        f"{exporter_class.description} ({' '.join('*' + ext for ext in exporter_class.extensions)})"
+        for exporter_class in EXPORTERS.values()
+    )
+
+
+def export_store(store: EventStore, file_path: str, format_name: Optional[str] = None,
+                 categories: Optional[Sequence[str]] = None, progress: Optional[ProgressCallback] = None) -> int:
+    """
+    일정을 파일로 내보냅니다. 형식을 지정하지 않으면 확장자, 그다음 data.excel_format 설정을 따릅니다.
+    기록한 행 수를 반환하며, progress가 False를 반환해 중단되면 -1을 반환합니다.
+    """
+    format_name = format_name or format_for_path(file_path) or settings.get("data.excel_format", "xlsx")
+    with tracer.span("export", "export", format=format_name) as span:
+        written = get_exporter(format_name).export(store, file_path, categories, progress)
+        span.set(rows=written, bytes=os.path.getsize(file_path) if written >= 0 else 0)
+    return written
@@ -0,0 +1,75 @@
+import re
+from typing import List, Sequence, Tuple
+from config.constants import EXCEL_EXTENSIONS
+from export.base import Exporter, ProgressTracker
+from schedule.event_store import COLUMN_HEADERS, EventStore
+from utils.logger import logger
+
+
+# 시트 이름에 쓸 수 없는 문자와 최대 길이
+INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+MAX_SHEET_TITLE = 31
+
+# xlsx 셀에 쓸 수 없는 제어 문자 (openpyxl.cell.cell.ILLEGAL_CHARACTERS_RE와 동일)
+ILLEGAL_CHARACTERS = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
+
+
+def sheet_title(name: str, used: set) -> str:
+    """카테고리 이름을 엑셀 시트 이름 규칙에 맞게 바꿉니다. 이미 쓰인 이름이면 번호를 붙입니다."""
+    base = INVALID_SHEET_CHARS.sub('_', str(name)).strip("'")[:MAX_SHEET_TITLE] or "Sheet"
+    title, number = base, 2
+    while title.lower() in used:
+        suffix = f" ({number})"
+        title = base[:MAX_SHEET_TITLE - len(suffix)] + suffix
+        number += 1
+    used.add(title.lower())
+    return title
+
+
+def _clean_cell(value: str) -> str:
+    if value and ILLEGAL_CHARACTERS.search(value):
+        return ILLEGAL_CHARACTERS.sub('', value)
+    return value
+
+
+def _discard(workbook):
+    """
+    저장하지 않을 write-only 워크북의 시트 임시 파일을 닫습니다.
+    열린 채로 버리면 가비지 컬렉션 때 시트마다 닫힌 파일에 쓰려다 stderr에 오류가 출력됨
+    """
+    for sheet in workbook.worksheets:
+        if not sheet.closed:
+            try:
+                sheet.close()
+            except Exception as e:  # 디스크 부족 등으로 닫지 못해도 원래 오류를 전달
+                logger.debug(f"엑셀 시트 임시 파일 정리 실패: {e}")
+
+
+class XlsxExporter(Exporter):
+    """카테고리마다 시트 하나를 만드는 엑셀 내보내기 (openpyxl write-only 모드)"""
+    format_name = "xlsx"
+    description = "Excel"
+    extensions = [EXCEL_EXTENSIONS[0]]
+
+    def write(self, store: EventStore, file_path: str, groups: List[Tuple[str, Sequence[int]]],
+              tracker: ProgressTracker):
+        from openpyxl import Workbook  # 내보낼 때만 불러옴
+
+        # write-only 워크북은 행을 임시 파일로 바로 내보내므로 메모리 사용량이 행 수와 무관
+        workbook = Workbook(write_only=True)
+        used_titles = set()
+        try:
+            for category, rows in groups:
+                sheet = workbook.create_sheet(sheet_title(category, used_titles))
+                sheet.append(COLUMN_HEADERS)
+                for chunk in self.iter_chunks(rows):
+                    for row in chunk:
+                        sheet.append([_clean_cell(value) for value in store.row(row)])
+                    tracker.advance(len(chunk))
+        except Exception:
+            # 중단(ExportCancelled)이나 기록 오류는 저장하지 않고 그대로 전달 (.part 파일은 export()에서 지움)
+            _discard(workbook)
+            raise
+        if not groups:
+            workbook.create_sheet("일정").append(COLUMN_HEADERS)
+        workbook.save(file_path)
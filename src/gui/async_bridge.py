@@ -0,0 +1,52 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+from utils.logger import logger
+
+try:
+    import qasync
+except ImportError:  # qasync가 없으면 install_event_loop()가 None을 반환
+    qasync = None
+
+
+def install_event_loop(app) -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Qt 이벤트 루프 위에서 동작하는 asyncio 이벤트 루프를 설치합니다.
+    qasync가 설치되어 있지 않으면 None을 반환합니다.
+    """
+    if qasync is None:
+        logger.warning("qasync가 설치되어 있지 않아 비동기 이벤트 루프를 사용할 수 없습니다.")
+        return None
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    logger.info("Qt 비동기 이벤트 루프를 설치했습니다.")
+    return loop
+
+
+def run_coroutine(coro: Awaitable[Any],
+                  on_done: Optional[Callable[[Any], None]] = None,
+                  on_error: Optional[Callable[[BaseException], None]] = None,
+                  on_cancelled: Optional[Callable[[], None]] = None) -> asyncio.Task:
+    """
+    코루틴을 Qt 이벤트 루프에서 실행합니다.
+    콜백은 GUI 스레드에서 호출되므로 위젯을 바로 갱신할 수 있습니다.
+    반환된 Task의 cancel()로 요청을 취소할 수 있습니다.
+    """
+    task = asyncio.ensure_future(coro)
+
+    def _on_task_done(finished: asyncio.Task):
+        if finished.cancelled():
+            logger.info("비동기 작업이 취소되었습니다.")
+            if on_cancelled:
+                on_cancelled()
+            return
+        error = finished.exception()
+        if error is not None:
+            logger.error(f"비동기 작업 중 오류: {error}")
+            if on_error:
+                on_error(error)
+            return
+        if on_done:
+            on_done(finished.result())
+
+    task.add_done_callback(_on_task_done)
+    return task
@@ -0,0 +1,120 @@
+import datetime
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton,
+    QLabel, QTabWidget, QHeaderView, QFileDialog, QMessageBox
+)
+from utils.tracing import tracer, TRACE_FORMAT_CHROME, TRACE_FORMAT_JSON
+from utils.logger import logger
+
+
+# 요약 표 컬럼 헤더
+SUMMARY_HEADERS = ["구간", "분류", "횟수", "합계(ms)", "평균(ms)", "최대(ms)", "오류", "값 합계"]
+
+# 최근 구간 표 컬럼 헤더
+RECENT_HEADERS = ["시작(초)", "구간", "소요(ms)", "스레드", "값"]
+
+# 최근 구간 표에 보여줄 최대 행 수
+RECENT_LIMIT = 500
+
+
+def _format_attrs(attrs: dict) -> str:
+    return ", ".join(f"{key}={value}" for key, value in attrs.items())
+
+
+class DiagnosticsDialog(QDialog):
+    """로그인/요청/해석/저장 구간별 소요 시간을 보여주고 trace 파일로 저장하는 창"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("진단 정보")
+        self.resize(900, 520)
+
+        layout = QVBoxLayout(self)
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        tabs = QTabWidget()
+        self.summary_table = self._create_table(SUMMARY_HEADERS)
+        tabs.addTab(self.summary_table, "요약")
+        self.recent_table = self._create_table(RECENT_HEADERS)
+        tabs.addTab(self.recent_table, "최근 구간")
+        layout.addWidget(tabs)
+
+        button_layout = QHBoxLayout()
+        refresh_button = QPushButton("새로 고침")
+        refresh_button.clicked.connect(self.refresh)
+        clear_button = QPushButton("기록 지우기")
+        clear_button.clicked.connect(self.clear_spans)
+        save_button = QPushButton("trace 저장...")
+        save_button.clicked.connect(self.save_trace)
+        close_button = QPushButton("닫기")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(refresh_button)
+        button_layout.addWidget(clear_button)
+        button_layout.addStretch()
+        button_layout.addWidget(save_button)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+        self.refresh()
+
+    @staticmethod
+    def _create_table(headers) -> QTableWidget:
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setAlternatingRowColors(True)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    @staticmethod
+    def _fill_table(table: QTableWidget, rows):
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(str(value)))
+
+    def refresh(self):
+        """현재까지 기록된 구간으로 표를 다시 채웁니다."""
+        summary = tracer.summary()
+        self._fill_table(self.summary_table, [
+            (group["name"], group["category"], group["count"],
+             f"{group['total'] * 1000:.1f}", f"{group['avg'] * 1000:.1f}", f"{group['max'] * 1000:.1f}",
+             group["errors"], _format_attrs(group["totals"]))
+            for group in summary
+        ])
+        records = tracer.to_records()[-RECENT_LIMIT:]
+        records.reverse()  # 최근 것부터
+        self._fill_table(self.recent_table, [
+            (f"{record['start']:.3f}", record["name"], f"{record['duration'] * 1000:.1f}",
+             record["thread"], _format_attrs(record["attrs"]))
+            for record in records
+        ])
+        if tracer.enabled:
+            self.status_label.setText(f"기록된 구간 {sum(group['count'] for group in summary)}개")
+        else:
+            self.status_label.setText("구간 기록이 꺼져 있습니다. (config.json의 diagnostics.tracing)")
+
+    def clear_spans(self):
+        tracer.clear()
+        self.refresh()
+
+    def save_trace(self):
+        default_name = f"hiworks_trace_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        chrome_filter = "Chrome trace (*.json)"
+        json_filter = "요약 포함 JSON (*.json)"
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "trace 저장", default_name, f"{chrome_filter};;{json_filter}"
+        )
+        if not file_path:
+            return
+        format_name = TRACE_FORMAT_JSON if selected_filter == json_filter else TRACE_FORMAT_CHROME
+        try:
+            count = tracer.dump(file_path, format_name)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"trace 저장 실패: {e}")
+            QMessageBox.warning(self, "오류", f"trace 저장 중 오류가 발생했습니다:\n{e}")
+            return
+        QMessageBox.information(self, "완료", f"구간 {count}개를 저장했습니다:\n{file_path}")
@@ -0,0 +1,320 @@
+import itertools
+import json
+import threading
+from typing import Any, List, Optional
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, QObject, QThread, pyqtSignal
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTreeView, QPlainTextEdit, QPushButton, QLabel
+)
+
+
+# 트리 컬럼 헤더
+JSON_TREE_HEADERS = ["키", "값", "타입"]
+
+# 값 컬럼에 표시할 최대 글자 수
+PREVIEW_LENGTH = 200
+
+
+class JsonNode:
+    """JSON 값 하나. 자식 노드는 펼칠 때 FETCH_BATCH개씩 만듭니다."""
+    __slots__ = ("key", "value", "parent", "row", "children", "_items")
+
+    def __init__(self, key: Any, value: Any, parent: Optional["JsonNode"] = None, row: int = 0):
+        self.key = key
+        self.value = value
+        self.parent = parent
+        self.row = row
+        self.children: List["JsonNode"] = []
+        self._items = None  # 객체 자식을 이어서 읽는 items() 이터레이터
+
+    def total_children(self) -> int:
+        return len(self.value) if isinstance(self.value, (dict, list)) else 0
+
+    def load_more(self, count: int) -> int:
+        """자식 노드를 count개까지 더 만들고 만든 수를 반환합니다."""
+        start = len(self.children)
+        if isinstance(self.value, list):
+            # 배열은 바로 잘라 읽고, 객체는 지난번에 멈춘 곳부터 이어서 읽음 (매번 처음부터 건너뛰지 않도록)
+            items = enumerate(self.value[start:start + count], start)
+        else:
+            if self._items is None:
+                self._items = iter(self.value.items())
+            items = itertools.islice(self._items, count)
+        for row, (key, value) in enumerate(items, start):
+            self.children.append(JsonNode(key, value, self, row))
+        return len(self.children) - start
+
+    def preview(self) -> str:
+        if isinstance(self.value, dict):
+            return f"{{{len(self.value)}개 항목}}"
+        if isinstance(self.value, list):
+            return f"[{len(self.value)}개]"
+        text = self.value if isinstance(self.value, str) else json.dumps(self.value, ensure_ascii=False)
+        return text if len(text) <= PREVIEW_LENGTH else text[:PREVIEW_LENGTH] + "…"
+
+    def type_name(self) -> str:
+        if isinstance(self.value, dict):
+            return "object"
+        if isinstance(self.value, list):
+            return "array"
+        if isinstance(self.value, str):
+            return "string"
+        if isinstance(self.value, bool):
+            return "boolean"
+        if self.value is None:
+            return "null"
+        return "number"
+
+
+class JsonTreeModel(QAbstractItemModel):
+    """
+    JSON 응답을 트리로 보여주는 모델.
+    노드는 펼칠 때 만들어지고, 자식이 많으면 스크롤에 따라 FETCH_BATCH 단위로 추가됩니다 (canFetchMore/fetchMore).
+    """
+    FETCH_BATCH = 200
+
+    def __init__(self, data: Any = None, parent=None):
+        super().__init__(parent)
+        self._root = JsonNode(None, None)
+        self.set_data(data)
+
+    def set_data(self, data: Any):
+        self.beginResetModel()
+        # 최상위가 객체/배열이 아니면 한 행으로 표시
+        self._root = JsonNode(None, data if isinstance(data, (dict, list)) else [data])
+        self._root.load_more(self.FETCH_BATCH)
+        self.endResetModel()
+
+    def _node(self, index: QModelIndex) -> JsonNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if 0 <= row < len(node.children) and 0 <= column < len(JSON_TREE_HEADERS):
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(JSON_TREE_HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        # 자식을 만들지 않고도 펼침 표시가 나오도록 값의 크기로 판단
+        return self._node(parent).total_children() > 0
+
+    def canFetchMore(self, parent=QModelIndex()):
+        node = self._node(parent)
+        return len(node.children) < node.total_children()
+
+    def fetchMore(self, parent=QModelIndex()):
+        node = self._node(parent)
+        count = min(self.FETCH_BATCH, node.total_children() - len(node.children))
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, len(node.children), len(node.children) + count - 1)
+        node.load_more(count)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        if column == 0:
+            return str(node.key)
+        if column == 1:
+            return node.preview()
+        return node.type_name()
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return JSON_TREE_HEADERS[section]
+        return None
+
+
+class JsonTextWorker(QObject):
+    """JSON을 들여쓰기한 원문을 PAGE_LINES줄 단위 페이지로 나누어 백그라운드에서 만드는 작업자"""
+    PAGE_LINES = 2000
+    page_ready = pyqtSignal(int, str)  # (페이지 번호, 텍스트)
+    finished = pyqtSignal(int)  # 전체 페이지 수
+
+    def __init__(self, data: Any, page_lines: Optional[int] = None):
+        super().__init__()
+        self.data = data
+        self.page_lines = page_lines or self.PAGE_LINES
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def run(self):
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        buffer: List[str] = []
+        lines = 0
+        page = 0
+        for chunk in encoder.iterencode(self.data):
+            if self._cancel_event.is_set():
+                return
+            buffer.append(chunk)
+            lines += chunk.count("\n")
+            if lines >= self.page_lines:
+                # 줄 중간에서 자르지 않도록 마지막 줄바꿈까지만 내보냄
+                text = "".join(buffer)
+                cut = text.rfind("\n")
+                self.page_ready.emit(page, text[:cut])
+                page += 1
+                buffer = [text[cut + 1:]]
+                lines = 0
+        if buffer or page == 0:
+            self.page_ready.emit(page, "".join(buffer))
+            page += 1
+        self.finished.emit(page)
+
+
+class JsonResultView(QWidget):
+    """
+    "JSON 결과" 탭. 트리 보기와 페이지 단위 원문 보기를 제공합니다.
+    set_data()는 데이터만 보관하고, 트리 모델과 원문 페이지는 탭이 실제로 보일 때 만듭니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._data = None
+        self._tree_dirty = False
+        self._pages: List[str] = []
+        self._page_count = 0  # 원문 생성이 끝나기 전에는 0
+        self._current_page = 0
+        self._text_thread = None
+        self._text_worker = None
+        self._text_started = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.view_tabs = QTabWidget()
+        layout.addWidget(self.view_tabs)
+
+        self.tree_model = JsonTreeModel(parent=self)
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.tree_model)
+        self.tree_view.setUniformRowHeights(True)  # 행 높이 계산 생략
+        self.tree_view.setAlternatingRowColors(True)
+        self.tree_view.setColumnWidth(0, 220)
+        self.tree_view.setColumnWidth(1, 480)
+        self.view_tabs.addTab(self.tree_view, "트리")
+
+        raw_widget = QWidget()
+        raw_layout = QVBoxLayout(raw_widget)
+        raw_layout.setContentsMargins(0, 0, 0, 0)
+        nav_layout = QHBoxLayout()
+        self.prev_page_button = QPushButton("◀ 이전")
+        self.prev_page_button.clicked.connect(lambda: self.show_page(self._current_page - 1))
+        self.next_page_button = QPushButton("다음 ▶")
+        self.next_page_button.clicked.connect(lambda: self.show_page(self._current_page + 1))
+        self.page_label = QLabel()
+        nav_layout.addWidget(self.prev_page_button)
+        nav_layout.addWidget(self.page_label)
+        nav_layout.addWidget(self.next_page_button)
+        nav_layout.addStretch()
+        raw_layout.addLayout(nav_layout)
+        self.raw_text = QPlainTextEdit()
+        self.raw_text.setReadOnly(True)
+        self.raw_text.setFont(QFont("Consolas", 10))
+        self.raw_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        raw_layout.addWidget(self.raw_text)
+        self.view_tabs.addTab(raw_widget, "원문")
+
+        self.view_tabs.currentChanged.connect(lambda _: self._refresh())
+        self._update_page_controls()
+
+    def set_data(self, data: Any):
+        """표시할 JSON 데이터를 바꿉니다. 보이지 않는 동안에는 아무것도 만들지 않습니다."""
+        self.stop()
+        self._data = data
+        self._tree_dirty = True
+        self._pages = []
+        self._page_count = 0
+        self._current_page = 0
+        self._text_started = False
+        self.raw_text.clear()
+        self._update_page_controls()
+        if self.isVisible():
+            self._refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh()
+
+    def _refresh(self):
+        if self.view_tabs.currentIndex() == 0:
+            if self._tree_dirty:
+                self._tree_dirty = False
+                self.tree_model.set_data(self._data)
+        elif not self._text_started and self._data is not None:
+            self._start_text_worker()
+
+    def _start_text_worker(self):
+        self._text_started = True
+        self.page_label.setText("원문 만드는 중...")
+        self._text_thread = QThread()
+        self._text_worker = JsonTextWorker(self._data)
+        self._text_worker.moveToThread(self._text_thread)
+        self._text_thread.started.connect(self._text_worker.run)
+        self._text_worker.page_ready.connect(self.on_page_ready)
+        self._text_worker.finished.connect(self.on_text_finished)
+        self._text_thread.start()
+
+    def on_page_ready(self, page, text):
+        if self.sender() is not self._text_worker:
+            return  # set_data()로 중단된 이전 작업의 신호
+        self._pages.append(text)
+        if page == 0:
+            self.show_page(0)
+        else:
+            self._update_page_controls()
+
+    def on_text_finished(self, page_count):
+        if self.sender() is not self._text_worker:
+            return
+        self._page_count = page_count
+        self.stop()
+        self._update_page_controls()
+
+    def show_page(self, page):
+        if not 0 <= page < len(self._pages):
+            return
+        self._current_page = page
+        self.raw_text.setPlainText(self._pages[page])
+        self._update_page_controls()
+
+    def _update_page_controls(self):
+        loaded = len(self._pages)
+        if loaded:
+            total = str(self._page_count) if self._page_count else f"{loaded}+"
+            self.page_label.setText(f"페이지 {self._current_page + 1}/{total}")
+        elif not self._text_started:
+            self.page_label.setText("")
+        self.prev_page_button.setEnabled(self._current_page > 0)
+        self.next_page_button.setEnabled(self._current_page + 1 < loaded)
+
+    def stop(self):
+        """원문을 만드는 중이면 중단하고 작업 스레드를 정리합니다."""
+        if self._text_worker is not None:
+            self._text_worker.cancel()
+        if self._text_thread is not None:
+            self._text_thread.quit()
+            self._text_thread.wait()
+        self._text_thread = None
+        self._text_worker = None
@@ -1,9 +1,9 @@
 import sys
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QProgressBar, QMessageBox,
+    QPushButton, QLabel, QProgressBar, QMessageBox,
     QStatusBar, QMenuBar, QMenu, QSplitter, QCheckBox, QLineEdit,
-    QTableWidget, QTableWidgetItem, QHeaderView, QDateEdit, QTabWidget, QSizePolicy
+    QTableView, QHeaderView, QDateEdit, QTabWidget, QSizePolicy
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QDate, QObject
 from PyQt6.QtGui import QFont, QIcon, QAction
@@ -12,37 +12,152 @@ from config.settings import settings
 from config.constants import WINDOW_TITLE, DARK_COLORS, LIGHT_COLORS
 from utils.logger import logger
 from utils.credential_manager import CredentialManager
-from scraper.hiworks_scraper import HiworksScraper
+from utils.session_store import SessionStore
+from schedule.parser import extract_schedules
+from schedule.cache import ScheduleCache
+from gui.json_view import JsonResultView
+from gui.schedule_table_model import (
+    ScheduleTableModel, fit_columns_to_sample
+)
+from schedule.event_store import EventStore
+from schedule.diff import changed_rows, diff_stores
+from utils.html_entities import decode_json_html_entities
+from utils.lazy_import import prewarm_modules
+from utils.tracing import traced, tracer
+import asyncio
 import datetime
-import json
-from collections import defaultdict
-import pandas as pd
+import os
 from PyQt6.QtWidgets import QFileDialog
-import re
+import threading
 
 
 class LoginWorker(QObject):
     finished = pyqtSignal(bool)
-    def __init__(self, user_id, user_pw, headless=True):
+    def __init__(self, user_id, user_pw, headless=True, session_store=None):
         super().__init__()
         from scraper.hiworks_scraper import HiworksScraper
         self.user_id = user_id
         self.user_pw = user_pw
         self.headless = headless
-        self.scraper = HiworksScraper(headless=self.headless)
+        self.scraper = HiworksScraper(headless=self.headless, session_store=session_store)
     def run(self):
         result = self.scraper.login(self.user_id, self.user_pw)
         self.finished.emit(result)
 
 
+def build_fetch_payload(result, previous_store=None):
+    """받은 일정 응답으로 화면에 표시할 결과를 만듭니다. (엔티티 변환, 저장소 생성, 이전 조회와 비교)"""
+    # HTML 엔티티는 한 번만 변환하고 JSON 뷰와 테이블이 함께 사용 (JSON 원문은 탭을 열 때 만듦)
+    with tracer.span("decode.entities", "process"):
+        decoded = decode_json_html_entities(result)
+    with tracer.span("store.build", "process") as span:
+        store = EventStore.from_response(decoded, decode_entities=False)
+        span.set(rows=len(store), categories=len(store.category_counts()))
+    changes, row_changes = None, {}
+    if previous_store is not None:
+        with tracer.span("store.diff", "process") as span:
+            changes = diff_stores(previous_store, store)
+            row_changes = changed_rows(store, changes)
+            span.set(changes=len(changes))
+    return {"result": result, "decoded": decoded, "store": store,
+            "changes": changes, "row_changes": row_changes}
+
+
+class FetchWorker(QObject):
+    """일정 요청, 파싱, 엔티티 변환, 카테고리 분류를 백그라운드에서 처리하는 작업자"""
+    progress = pyqtSignal(int, int)  # (완료 구간 수, 전체 구간 수)
+    partial = pyqtSignal(int)  # 지금까지 받은 일정 수
+    finished = pyqtSignal(object)  # {"result", "decoded", "store", "changes", "row_changes"}
+    failed = pyqtSignal(str)
+    need_relogin = pyqtSignal()
+    cancelled = pyqtSignal()
+    def __init__(self, scraper, start_date, end_date, cache=None, previous_store=None):
+        super().__init__()
+        self.scraper = scraper
+        self.start_date = start_date
+        self.end_date = end_date
+        self.cache = cache
+        self.previous_store = previous_store  # 같은 기간을 다시 조회할 때 변경 비교 대상
+        self._cancel_event = threading.Event()
+        self._received = 0
+    def cancel(self):
+        """진행 중인 요청을 취소합니다. 남은 구간 요청은 시작되지 않습니다."""
+        self._cancel_event.set()
+    def _on_chunk(self, window, result, done, total):
+        self._received += len(extract_schedules(result))
+        self.progress.emit(done, total)
+        self.partial.emit(self._received)
+        return not self._cancel_event.is_set()
+    def run(self):
+        try:
+            result = self.scraper.fetch_schedule_range(
+                self.start_date, self.end_date, cache=self.cache, on_chunk=self._on_chunk
+            )
+            if self._cancel_event.is_set() or (isinstance(result, dict) and result.get("cancelled")):
+                self.cancelled.emit()
+                return
+            if isinstance(result, dict) and result.get("need_relogin"):
+                self.need_relogin.emit()
+                return
+            if isinstance(result, dict) and "error" in result:
+                self.failed.emit(result.get("error", "알 수 없는 오류"))
+                return
+            self.finished.emit(build_fetch_payload(result, self.previous_store))
+        except Exception as e:
+            logger.error(f"일정 데이터 처리 중 오류: {e}")
+            self.failed.emit(str(e))
+
+
+class ExportWorker(QObject):
+    """EventStore의 행을 파일로 스트리밍 저장하는 작업자 (형식은 확장자로 결정)"""
+    progress = pyqtSignal(int, int)  # (저장한 행 수, 전체 행 수)
+    finished = pyqtSignal(str, int)  # (파일 경로, 저장한 행 수)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    def __init__(self, store, file_path, categories=None):
+        super().__init__()
+        self.store = store
+        self.file_path = file_path
+        self.categories = categories  # None이면 모든 카테고리
+        self._cancel_event = threading.Event()
+    def cancel(self):
+        self._cancel_event.set()
+    def _on_progress(self, done, total):
+        self.progress.emit(done, total)
+        return not self._cancel_event.is_set()
+    def run(self):
+        try:
+            from export.registry import export_store
+            written = export_store(self.store, self.file_path, categories=self.categories, progress=self._on_progress)
+            if written < 0:
+                self.cancelled.emit()
+                return
+            self.finished.emit(self.file_path, written)
+        except Exception as e:
+            logger.error(f"파일 저장 중 오류: {e}")
+            self.failed.emit(str(e))
+
+
 class MainWindow(QMainWindow):
     """메인 애플리케이션 창"""
     
-    def __init__(self):
+    def __init__(self, event_loop=None):
         super().__init__()
+        self.event_loop = event_loop  # qasync 이벤트 루프 (있으면 일정을 비동기로 요청)
         self.credential_manager = CredentialManager()
+        self.session_store = SessionStore(self.credential_manager)
+        self.schedule_cache = ScheduleCache() if settings.get("data.use_cache", True) else None
         self.worker = None  # 로그인 성공 시 할당되는 scraper
         self.category_tabs = {}  # 지연 초기화를 위해 미리 선언
+        self.schedule_store = None  # 현재 표시 중인 일정 저장소 (schedule.event_store.EventStore)
+        self.fetch_thread = None  # 일정 요청 작업 스레드
+        self.fetch_worker = None
+        self.fetch_task = None  # 비동기 일정 요청 (asyncio.Task)
+        self.async_scraper = None  # 로그인한 scraper의 쿠키를 넘겨받은 AsyncHiworksScraper
+        self.fetch_range = None  # 진행 중인 요청 기간
+        self.last_fetch_range = None  # 화면에 표시된 일정의 기간
+        self.export_thread = None  # 파일 저장 작업 스레드
+        self.export_worker = None
         
         # 기본 UI만 먼저 초기화
         self.init_basic_ui()
@@ -135,6 +250,12 @@ class MainWindow(QMainWindow):
         self.request_button.setMinimumHeight(40)
         main_layout.addWidget(self.request_button)
         
+        # 요청 취소 버튼 (요청 중에만 표시)
+        self.cancel_button = QPushButton("요청 취소")
+        self.cancel_button.clicked.connect(self.cancel_schedule_request)
+        self.cancel_button.setVisible(False)
+        main_layout.addWidget(self.cancel_button)
+        
         # 나머지 UI는 필요할 때 초기화
         self._setup_placeholder_for_advanced_ui(main_layout)
     
@@ -165,10 +286,8 @@ class MainWindow(QMainWindow):
         self.category_tab_widget = QTabWidget()
         self.tab_widget.addTab(self.category_tab_widget, "테이블")
         
-        # JSON 뷰 탭을 나중에 추가 (오른쪽에 위치)
-        self.json_view = QTextEdit()
-        self.json_view.setReadOnly(True)
-        self.json_view.setFont(QFont("Consolas", 10))
+        # JSON 뷰 탭을 나중에 추가 (오른쪽에 위치), 트리/원문은 탭을 열 때 만듦
+        self.json_view = JsonResultView()
         self.tab_widget.addTab(self.json_view, "JSON 결과")
         
         # 카테고리별 탭은 데이터가 있을 때 생성
@@ -217,6 +336,11 @@ class MainWindow(QMainWindow):
         # 파일 메뉴
         file_menu = menubar.addMenu("파일")
         
+        export_action = QAction("모든 카테고리 내보내기...", self)
+        export_action.triggered.connect(self.export_all_categories)
+        file_menu.addAction(export_action)
+        file_menu.addSeparator()
+        
         exit_action = QAction("종료", self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
@@ -236,6 +360,14 @@ class MainWindow(QMainWindow):
         clear_credentials_action.triggered.connect(self.clear_saved_credentials)
         credentials_menu.addAction(clear_credentials_action)
         
+        clear_cache_action = QAction("일정 캐시 비우기", self)
+        clear_cache_action.triggered.connect(self.clear_schedule_cache)
+        tools_menu.addAction(clear_cache_action)
+        
+        diagnostics_action = QAction("진단 정보...", self)
+        diagnostics_action.triggered.connect(self.show_diagnostics)
+        tools_menu.addAction(diagnostics_action)
+        
         # 도움말 메뉴
         help_menu = menubar.addMenu("도움말")
         
@@ -278,7 +410,7 @@ class MainWindow(QMainWindow):
         QCheckBox::indicator:checked {{ background-color: {colors['primary']}; border-color: {primary}; }}
         QCheckBox::indicator:unchecked {{ background-color: {colors['surface']}; border-color: {colors['border']}; }}
         QLineEdit {{ background-color: {colors['surface']}; color: {colors['text']}; border: 1px solid {colors['border']}; border-radius: 4px; padding: 4px; }}
-        QTextEdit {{ background-color: {colors['surface']}; color: {colors['text']}; border: 1px solid {colors['border']}; border-radius: 4px; }}
+        QTextEdit, QPlainTextEdit, QTreeView {{ background-color: {colors['surface']}; color: {colors['text']}; border: 1px solid {colors['border']}; border-radius: 4px; }}
         QProgressBar {{ border: 1px solid {colors['border']}; border-radius: 4px; text-align: center; }}
         QProgressBar::chunk {{ background-color: {colors['primary']}; border-radius: 3px; }}
         QStatusBar {{ background-color: {colors['surface']}; color: {colors['text']}; }}
@@ -326,7 +458,7 @@ class MainWindow(QMainWindow):
         self.login_thread = QThread()
         headless_mode = self.headless_checkbox.isChecked()
         logger.info(f"백그라운드 모드 설정: {headless_mode}")
-        self.login_worker = LoginWorker(user_id, user_pw, headless=headless_mode)
+        self.login_worker = LoginWorker(user_id, user_pw, headless=headless_mode, session_store=self.session_store)
         self.login_worker.moveToThread(self.login_thread)
         self.login_thread.started.connect(self.login_worker.run)
         def on_finished(result):
@@ -336,6 +468,7 @@ class MainWindow(QMainWindow):
                 self.start_date_input.setEnabled(True)
                 self.end_date_input.setEnabled(True)
                 self.request_button.setEnabled(True)
+                self._drop_async_scraper()  # 이전 로그인의 쿠키를 쓰지 않도록
                 self.worker = self.login_worker.scraper
                 
                 # 자격 증명 저장 체크박스가 체크되어 있으면 저장
@@ -347,6 +480,8 @@ class MainWindow(QMainWindow):
             else:
                 logger.error("로그인 실패")
                 self.status_label.setText("로그인 실패")
+                # 실패한 로그인의 브라우저/연결은 바로 정리 (드라이버는 풀로 반납)
+                self.login_worker.scraper.close()
                 QMessageBox.critical(self, "오류", "로그인에 실패했습니다.")
             self.progress_bar.setVisible(False)
             self.connect_button.setEnabled(True)
@@ -365,56 +500,9 @@ class MainWindow(QMainWindow):
     
 
 
-    def display_category_tables(self, json_data):
-        """카테고리별로 하위 탭에 테이블 표시 (카테고리/상태 컬럼 제외)"""
-        def format_datetime(dt_str):
-            if not dt_str:
-                return ''
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
-                try:
-                    dt = datetime.datetime.strptime(dt_str, fmt)
-                    return dt.strftime("%Y-%m-%d %H:%M")
-                except Exception:
-                    continue
-            return dt_str
-        
-        def decode_html_entities(text):
-            """HTML 엔티티를 실제 문자로 변환합니다."""
-            if not text:
-                return text
-            
-            # HTML 엔티티 변환
-            html_entities = {
-                '&lt;': '<',
-                '&gt;': '>',
-                '&amp;': '&',
-                '&quot;': '"',
-                '&#39;': "'",
-                '&apos;': "'",
-                '&nbsp;': ' ',
-                '&copy;': '©',
-                '&reg;': '®',
-                '&trade;': '™',
-                '&hellip;': '…',
-                '&mdash;': '—',
-                '&ndash;': '–',
-                '&lsquo;': ''',
-                '&rsquo;': ''',
-                '&ldquo;': '"',
-                '&rdquo;': '"',
-            }
-            
-            decoded_text = text
-            for entity, char in html_entities.items():
-                decoded_text = decoded_text.replace(entity, char)
-            
-            # 숫자 엔티티 변환 (예: &#60; -> <)
-            import re
-            decoded_text = re.sub(r'&#(\d+);', lambda m: chr(int(m.group(1))), decoded_text)
-            decoded_text = re.sub(r'&#x([0-9a-fA-F]+);', lambda m: chr(int(m.group(1), 16)), decoded_text)
-            
-            return decoded_text
-        
+    @traced("table.build", "gui")
+    def display_category_tables(self, store, row_changes=None):
+        """카테고리별로 하위 탭에 테이블 표시 (카테고리/상태 컬럼 제외), row_changes의 행은 강조"""
         # 고급 UI 초기화 (필요시)
         self._init_advanced_ui()
         
@@ -424,63 +512,32 @@ class MainWindow(QMainWindow):
             self.category_tab_widget.removeTab(0)
         self.category_tabs.clear()
         
-        # 데이터 분류
-        schedules = []
-        if isinstance(json_data, list):
-            schedules = json_data
-        elif isinstance(json_data, dict):
-            possible_keys = ['schedules', 'data', 'events', 'items', 'list']
-            for key in possible_keys:
-                if key in json_data and isinstance(json_data[key], list):
-                    schedules = json_data[key]
-                    break
-            if not schedules:
-                schedules = [json_data]
-        
-        # 카테고리별 분류
-        cat_dict = defaultdict(list)
-        for sch in schedules:
-            if isinstance(sch, dict):
-                cat = sch.get('category', '기타')
-                cat_dict[cat].append(sch)
+        # 탭마다 자기 카테고리의 행 번호만 지연 로드하는 모델을 가짐
+        self.schedule_store = store
+        category_rows = store.indices_by_category()
         
         # 각 카테고리별로 탭 생성
-        for cat, sch_list in cat_dict.items():
-            if not sch_list:
-                continue
-                
+        for cat, count in store.category_counts().items():
             # 탭 위젯 생성
             tab = QWidget()
             layout = QVBoxLayout(tab)
             
             # 테이블 라벨
-            table_label = QLabel(f"{cat} 일정 ({len(sch_list)}개)")
+            table_label = QLabel(f"{cat} 일정 ({count}개)")
             table_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
             layout.addWidget(table_label)
             
             # 테이블 생성
-            table = QTableWidget()
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(["시작일시", "종료일시", "제목", "프로젝트", "내용"])
-            table.setRowCount(len(sch_list))
-            
-            # 테이블 데이터 채우기
-            for row, schedule in enumerate(sch_list):
-                start_date = format_datetime(schedule.get('start_date', schedule.get('start', '')))
-                end_date = format_datetime(schedule.get('end_date', schedule.get('end', '')))
-                subject = decode_html_entities(schedule.get('subject', schedule.get('title', schedule.get('name', ''))))
-                project = decode_html_entities(schedule.get('project_name', schedule.get('project', '')))
-                content = decode_html_entities(schedule.get('content', schedule.get('description', schedule.get('desc', ''))))
-                
-                table.setItem(row, 0, QTableWidgetItem(str(start_date)))
-                table.setItem(row, 1, QTableWidgetItem(str(end_date)))
-                table.setItem(row, 2, QTableWidgetItem(str(subject)))
-                table.setItem(row, 3, QTableWidgetItem(str(project)))
-                table.setItem(row, 4, QTableWidgetItem(str(content)))
+            model = ScheduleTableModel(parent=tab)
+            model.set_store(store, row_changes, category_rows[cat])
+            table = QTableView()
+            table.setModel(model)
+            table.setWordWrap(False)
+            table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             
-            # 테이블 크기 조정
+            # 테이블 크기 조정 (일부 행만 측정)
             table.horizontalHeader().setStretchLastSection(True)
-            table.resizeColumnsToContents()
+            fit_columns_to_sample(table)
             layout.addWidget(table, 1)  # stretch=1로 추가
             
             # 엑셀 저장 버튼을 테이블 아래로 이동
@@ -499,36 +556,100 @@ class MainWindow(QMainWindow):
         logger.info(f"카테고리별 테이블 생성 완료: {len(self.category_tabs)}개 카테고리")
 
     def save_table_to_excel(self, cat):
-        tab, table_label, table = self.category_tabs[cat]
-        headers = []
-        for i in range(table.columnCount()):
-            h = table.horizontalHeaderItem(i)
-            val = h.text() if h and h.text() else f"컬럼{i+1}"
-            headers.append(str(val))
-        data = []
-        for row in range(table.rowCount()):
-            row_data = []
-            for col in range(table.columnCount()):
-                item = table.item(row, col)
-                row_data.append(item.text() if item else "")
-            data.append(row_data)
-        # 모든 header가 str임을 보장
-        headers = [str(h) for h in headers]
-        df = pd.DataFrame(data, columns=headers)
+        """카테고리 전체 행을 백그라운드에서 엑셀로 저장합니다. (화면에 로드된 행과 무관)"""
         now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         default_name = f"{cat}_일정_{now}.xlsx"
         file_path, _ = QFileDialog.getSaveFileName(self, "엑셀로 저장", default_name, "Excel Files (*.xlsx)")
-        if file_path:
-            if not file_path.lower().endswith('.xlsx'):
-                file_path += '.xlsx'
-            df.to_excel(file_path, index=False)
-            QMessageBox.information(self, "저장 완료", f"엑셀 파일로 저장되었습니다:\n{file_path}")
+        if not file_path:
+            return
+        if not file_path.lower().endswith('.xlsx'):
+            file_path += '.xlsx'
+        self._start_export(file_path, [cat])
+    
+    def export_all_categories(self):
+        """모든 카테고리를 선택한 형식(엑셀 시트별, CSV, JSONL, Parquet)으로 내보냅니다."""
+        from export.registry import EXPORTERS, file_dialog_filters
+        
+        if self.schedule_store is None or len(self.schedule_store) == 0:
+            QMessageBox.information(self, "알림", "내보낼 일정이 없습니다. 먼저 일정을 요청하세요.")
+            return
+        format_name = settings.get("data.excel_format", "xlsx")
+        exporter_class = EXPORTERS.get(format_name, EXPORTERS["xlsx"])
+        now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_name = os.path.join(settings.get("data.export_path", "./data/exports/"), f"일정_{now}{exporter_class.extensions[0]}")
+        filters = file_dialog_filters()
+        selected = next((f for f in filters.split(";;") if f.startswith(exporter_class.description + " (")), "")
+        file_path, selected_filter = QFileDialog.getSaveFileName(self, "모든 카테고리 내보내기", default_name, filters, selected)
+        if not file_path:
+            return
+        # 확장자가 없으면 선택한 필터의 형식을 사용
+        if not os.path.splitext(file_path)[1]:
+            for exporter_class in EXPORTERS.values():
+                if selected_filter.startswith(exporter_class.description + " ("):
+                    file_path += exporter_class.extensions[0]
+                    break
+        self._start_export(file_path, None)
+    
+    def _start_export(self, file_path, categories):
+        """ExportWorker를 백그라운드 스레드에서 시작합니다."""
+        if self.export_thread is not None:
+            QMessageBox.information(self, "알림", "이미 파일 저장이 진행 중입니다.")
+            return
+        
+        self.status_bar.showMessage(f"파일 저장 중... {os.path.basename(file_path)}")
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+        
+        self.export_thread = QThread()
+        self.export_worker = ExportWorker(self.schedule_store, file_path, categories)
+        self.export_worker.moveToThread(self.export_thread)
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.failed.connect(self.on_export_failed)
+        self.export_worker.cancelled.connect(self.on_export_cancelled)
+        self.export_thread.start()
+    
+    def _finish_export(self):
+        """파일 저장 작업 스레드를 정리합니다."""
+        if self.export_thread is not None:
+            self.export_thread.quit()
+            self.export_thread.wait()
+        self.export_thread = None
+        self.export_worker = None
+        if self.fetch_thread is None:
+            self.progress_bar.setVisible(False)
+    
+    def on_export_progress(self, done, total):
+        """파일 저장 진행 상황 표시"""
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+        self.status_bar.showMessage(f"파일 저장 중... ({done}/{total}행)")
+    
+    def on_export_finished(self, file_path, written):
+        self._finish_export()
+        self.status_bar.showMessage(f"파일 저장 완료: {written}행")
+        QMessageBox.information(self, "저장 완료", f"파일로 저장되었습니다:\n{file_path}")
+    
+    def on_export_failed(self, error_msg):
+        self._finish_export()
+        self.status_bar.showMessage("파일 저장 실패")
+        QMessageBox.critical(self, "오류", f"파일 저장 중 오류가 발생했습니다:\n{error_msg}")
+    
+    def on_export_cancelled(self):
+        self._finish_export()
+        self.status_bar.showMessage("파일 저장이 취소되었습니다.")
 
 
     def show_settings(self):
         """설정 창 표시"""
         QMessageBox.information(self, "설정", "설정 기능은 추후 구현 예정입니다.")
     
+    def show_diagnostics(self):
+        """구간별 소요 시간을 보여주는 진단 창 표시"""
+        from gui.diagnostics_dialog import DiagnosticsDialog
+        DiagnosticsDialog(self).exec()
+    
     def show_about(self):
         """정보 창 표시"""
         QMessageBox.about(self, "정보", 
@@ -602,6 +723,7 @@ class MainWindow(QMainWindow):
     def clear_saved_credentials(self):
         """저장된 자격 증명을 삭제합니다."""
         try:
+            self.session_store.delete_session()
             if self.credential_manager.delete_credentials():
                 self.id_input.clear()
                 self.pw_input.clear()
@@ -614,11 +736,40 @@ class MainWindow(QMainWindow):
             logger.error(f"자격 증명 삭제 중 오류: {e}")
             QMessageBox.critical(self, "오류", f"자격 증명 삭제 중 오류가 발생했습니다: {e}")
     
+    def clear_schedule_cache(self):
+        """로컬 일정 캐시를 비웁니다."""
+        if self.schedule_cache is None:
+            QMessageBox.information(self, "알림", "일정 캐시를 사용하지 않도록 설정되어 있습니다.")
+            return
+        self.schedule_cache.invalidate()
+        QMessageBox.information(self, "완료", "일정 캐시를 비웠습니다.")
+    
     def closeEvent(self, event):
         """창 종료 이벤트"""
+        # 진행 중인 일정 요청이 있으면 취소 후 대기
+        if self.fetch_task is not None:
+            self.fetch_task.cancel()
+        if self.fetch_worker is not None:
+            self.fetch_worker.cancel()
+            self.fetch_thread.quit()
+            self.fetch_thread.wait()
+        # 진행 중인 파일 저장이 있으면 중단 (기존 파일은 그대로 유지)
+        if self.export_worker is not None:
+            self.export_worker.cancel()
+            self.export_thread.quit()
+            self.export_thread.wait()
+        # JSON 원문을 만드는 중이면 중단
+        if self._advanced_ui_initialized:
+            self.json_view.stop()
         # 웹 브라우저가 열려있으면 종료
         if hasattr(self, 'worker') and self.worker:
-            self.worker.close_driver()
+            self.worker.close()
+        if self.schedule_cache is not None:
+            self.schedule_cache.close()
+        # 미리 띄워 둔 Chrome이 있으면 종료 (selenium을 불러오지 않았다면 풀도 없음)
+        driver_pool = sys.modules.get("scraper.driver_pool")
+        if driver_pool is not None:
+            driver_pool.close_driver_pools()
         event.accept()
 
 
@@ -638,84 +789,133 @@ class MainWindow(QMainWindow):
         if self.worker is None:
             QMessageBox.warning(self, "오류", "로그인 후에만 요청할 수 있습니다.")
             return
+        
+        if self.fetch_thread is not None or self.fetch_task is not None:
+            return
             
         self.status_label.setText("일정 JSON 요청 중...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
-        self.repaint()
+        self.request_button.setEnabled(False)
+        self.cancel_button.setVisible(True)
+        
+        # 같은 기간을 다시 조회하면 이전 결과와 비교해 바뀐 일정을 강조
+        previous_store = None
+        if self.schedule_store is not None and self.last_fetch_range == (start, end):
+            previous_store = self.schedule_store
+        self.fetch_range = (start, end)
+        
+        # Qt 이벤트 루프에서 비동기로 요청 (qasync/aiohttp가 없으면 작업 스레드 사용)
+        if self.event_loop is not None and self._start_async_fetch(start, end, previous_store):
+            return
+        
+        # QThread + Worker로 요청/파싱/분류 처리
+        self.fetch_thread = QThread()
+        self.fetch_worker = FetchWorker(self.worker, start, end, cache=self.schedule_cache,
+                                        previous_store=previous_store)
+        self.fetch_worker.moveToThread(self.fetch_thread)
+        self.fetch_thread.started.connect(self.fetch_worker.run)
+        self.fetch_worker.progress.connect(self.on_fetch_progress)
+        self.fetch_worker.partial.connect(self.on_fetch_partial)
+        self.fetch_worker.finished.connect(self.on_fetch_finished)
+        self.fetch_worker.failed.connect(self.on_fetch_failed)
+        self.fetch_worker.need_relogin.connect(self.on_fetch_need_relogin)
+        self.fetch_worker.cancelled.connect(self.on_fetch_cancelled)
+        self.fetch_thread.start()
+    
+    def _start_async_fetch(self, start, end, previous_store):
+        """일정 요청을 Qt 이벤트 루프의 비동기 작업으로 시작합니다. aiohttp가 없으면 False를 반환합니다."""
+        from gui.async_bridge import run_coroutine
+        
+        if self.async_scraper is None:
+            from scraper.async_scraper import AsyncHiworksScraper
+            try:
+                self.async_scraper = AsyncHiworksScraper.from_scraper(self.worker)
+            except ImportError as e:
+                logger.warning(f"비동기 요청을 사용할 수 없어 작업 스레드로 요청합니다: {e}")
+                return False
+        self.fetch_task = run_coroutine(
+            self._fetch_schedule_async(start, end, previous_store),
+            on_error=lambda error: self.on_fetch_failed(str(error)),
+            on_cancelled=self.on_fetch_cancelled,
+        )
+        return True
+    
+    async def _fetch_schedule_async(self, start, end, previous_store):
+        """구간별 응답을 받는 대로 진행 상황을 표시하고, 끝나면 결과 처리 슬롯을 호출합니다."""
+        received = 0
+        
+        def on_chunk(window, result, done, total):
+            nonlocal received
+            received += len(extract_schedules(result))
+            self.on_fetch_progress(done, total)
+            self.on_fetch_partial(received)
+        
+        result = await self.async_scraper.fetch_schedule_range(
+            start, end, cache=self.schedule_cache, on_chunk=on_chunk
+        )
+        if isinstance(result, dict) and result.get("need_relogin"):
+            self.session_store.delete_session()
+            self.on_fetch_need_relogin()
+            return
+        if isinstance(result, dict) and "error" in result:
+            self.on_fetch_failed(result.get("error", "알 수 없는 오류"))
+            return
+        # 엔티티 변환/저장소 생성은 화면이 멈추지 않도록 스레드 풀에서 처리
+        payload = await asyncio.get_running_loop().run_in_executor(None, build_fetch_payload, result, previous_store)
+        self.on_fetch_finished(payload)
+    
+    def _drop_async_scraper(self):
+        """비동기 스크래퍼의 HTTP 세션을 닫습니다. 다음 요청에서 현재 로그인 쿠키로 다시 만듭니다."""
+        if self.async_scraper is None:
+            return
+        from gui.async_bridge import run_coroutine
         
+        async_scraper, self.async_scraper = self.async_scraper, None
+        run_coroutine(async_scraper.close())
+    
+    def cancel_schedule_request(self):
+        """진행 중인 일정 요청을 취소합니다."""
+        if self.fetch_task is not None:
+            self.status_label.setText("요청 취소 중...")
+            self.cancel_button.setEnabled(False)
+            self.fetch_task.cancel()
+        if self.fetch_worker is not None:
+            self.status_label.setText("요청 취소 중...")
+            self.cancel_button.setEnabled(False)
+            self.fetch_worker.cancel()
+    
+    def _finish_fetch(self):
+        """일정 요청 작업 스레드를 정리하고 UI를 원래 상태로 되돌립니다."""
+        if self.fetch_thread is not None:
+            self.fetch_thread.quit()
+            self.fetch_thread.wait()
+        self.fetch_thread = None
+        self.fetch_worker = None
+        self.fetch_task = None
+        self.progress_bar.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self.cancel_button.setEnabled(True)
+        self.request_button.setEnabled(self.worker is not None)
+    
+    def on_fetch_progress(self, done, total):
+        """구간별 요청 진행 상황 표시"""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+    
+    def on_fetch_partial(self, received):
+        """지금까지 받은 일정 수 표시"""
+        self.status_label.setText(f"일정 JSON 요청 중... ({received}개 수신)")
+    
+    def on_fetch_finished(self, payload):
+        """백그라운드에서 처리된 결과를 화면에 반영합니다."""
+        self._finish_fetch()
         try:
-            import json
-            result = self.worker.fetch_schedule_json(start, end)
-            
-            # 세션 만료 체크 및 재로그인 시도
-            if isinstance(result, dict) and result.get("need_relogin"):
-                logger.info("세션이 만료되었습니다. 사용자에게 재로그인을 요청합니다.")
-                self.status_label.setText("세션 만료")
-                
-                QMessageBox.information(
-                    self, 
-                    "세션 만료", 
-                    "로그인 세션이 만료되었습니다.\n\n"
-                    "아이디와 비밀번호를 다시 입력하고 로그인 버튼을 클릭해주세요."
-                )
-                
-                # 로그인 관련 UI를 다시 활성화
-                self.connect_button.setEnabled(True)
-                self.start_date_input.setEnabled(False)
-                self.end_date_input.setEnabled(False)
-                self.request_button.setEnabled(False)
-                self.worker = None
-                
-                return
-            
-            # 오류 응답 체크
-            if isinstance(result, dict) and "error" in result:
-                error_msg = result.get("error", "알 수 없는 오류")
-                logger.error(f"일정 요청 실패: {error_msg}")
-                QMessageBox.critical(self, "오류", f"일정 데이터 요청 실패:\n{error_msg}")
-                self.status_label.setText("일정 요청 실패")
-                return
-            
-            # JSON 데이터 표시
-            pretty = json.dumps(result, ensure_ascii=False, indent=2)
-            
-            # JSON 뷰에 표시할 때도 HTML 엔티티 변환
-            def decode_json_html_entities(obj):
-                """JSON 객체 내의 모든 문자열에서 HTML 엔티티를 변환합니다."""
-                if isinstance(obj, dict):
-                    return {k: decode_json_html_entities(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [decode_json_html_entities(item) for item in obj]
-                elif isinstance(obj, str):
-                    # HTML 엔티티 변환
-                    html_entities = {
-                        '&lt;': '<', '&gt;': '>', '&amp;': '&', '&quot;': '"',
-                        '&#39;': "'", '&apos;': "'", '&nbsp;': ' ',
-                        '&copy;': '©', '&reg;': '®', '&trade;': '™',
-                        '&hellip;': '…', '&mdash;': '—', '&ndash;': '–',
-                        '&lsquo;': ''', '&rsquo;': ''', '&ldquo;': '"', '&rdquo;': '"',
-                    }
-                    decoded_text = obj
-                    for entity, char in html_entities.items():
-                        decoded_text = decoded_text.replace(entity, char)
-                    
-                    # 숫자 엔티티 변환
-                    decoded_text = re.sub(r'&#(\d+);', lambda m: chr(int(m.group(1))), decoded_text)
-                    decoded_text = re.sub(r'&#x([0-9a-fA-F]+);', lambda m: chr(int(m.group(1), 16)), decoded_text)
-                    
-                    return decoded_text
-                else:
-                    return obj
-            
-            # JSON 데이터의 HTML 엔티티 변환
-            decoded_result = decode_json_html_entities(result)
-            pretty = json.dumps(decoded_result, ensure_ascii=False, indent=2)
-            
-            self.json_view.setPlainText(pretty)
+            self.json_view.set_data(payload["decoded"])
             
             # JSON 데이터를 카테고리별로 분리하여 테이블로 표시
-            self.display_category_tables(result)
+            self.display_category_tables(payload["store"], payload["row_changes"])
+            self.last_fetch_range = self.fetch_range
             
             # 요청 후 테이블 탭을 기본으로 활성화
             if hasattr(self, 'category_tab_widget'):
@@ -736,14 +936,52 @@ class MainWindow(QMainWindow):
                 # 카테고리 탭 위젯이 없으면 JSON 탭으로 이동
                 self.tab_widget.setCurrentIndex(0)
             
-            self.status_label.setText("일정 JSON 응답 표시 완료")
+            changes = payload["changes"]
+            if changes is not None:
+                self.status_label.setText(f"일정 JSON 응답 표시 완료 (이전 조회 대비 {changes.summary()})")
+            else:
+                self.status_label.setText("일정 JSON 응답 표시 완료")
             
         except Exception as e:
-            logger.error(f"일정 데이터 요청 중 오류: {e}")
-            QMessageBox.critical(self, "오류", f"일정 데이터 요청 중 오류가 발생했습니다: {e}")
+            logger.error(f"일정 데이터 표시 중 오류: {e}")
+            QMessageBox.critical(self, "오류", f"일정 데이터 표시 중 오류가 발생했습니다: {e}")
             self.status_label.setText("일정 요청 실패")
-        finally:
-            self.progress_bar.setVisible(False)
+    
+    def on_fetch_failed(self, error_msg):
+        """일정 요청 실패 처리"""
+        self._finish_fetch()
+        logger.error(f"일정 요청 실패: {error_msg}")
+        QMessageBox.critical(self, "오류", f"일정 데이터 요청 실패:\n{error_msg}")
+        self.status_label.setText("일정 요청 실패")
+    
+    def on_fetch_cancelled(self):
+        """일정 요청 취소 처리"""
+        self._finish_fetch()
+        self.status_label.setText("일정 요청이 취소되었습니다.")
+    
+    def on_fetch_need_relogin(self):
+        """세션 만료 시 재로그인 요청"""
+        self._finish_fetch()
+        logger.info("세션이 만료되었습니다. 사용자에게 재로그인을 요청합니다.")
+        self.status_label.setText("세션 만료")
+        
+        QMessageBox.information(
+            self, 
+            "세션 만료", 
+            "로그인 세션이 만료되었습니다.\n\n"
+            "아이디와 비밀번호를 다시 입력하고 로그인 버튼을 클릭해주세요."
+        )
+        
+        # 로그인 관련 UI를 다시 활성화
+        self.connect_button.setEnabled(True)
+        self.start_date_input.setEnabled(False)
+        self.end_date_input.setEnabled(False)
+        self.request_button.setEnabled(False)
+        # 만료된 세션의 HTTP 연결과 드라이버도 정리 (드라이버는 풀로 반납)
+        if self.worker is not None:
+            self.worker.close()
+        self.worker = None
+        self._drop_async_scraper()
 
     def save_headless_setting(self):
         """백그라운드 모드 체크박스 상태가 변경될 때 설정을 저장합니다."""
@@ -765,12 +1003,35 @@ def main():
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("Hiworks Schedule Manager")
     
+    # 일정 요청을 await할 수 있도록 Qt 이벤트 루프 위에 asyncio 루프 설치 (qasync가 없으면 None)
+    event_loop = None
+    if settings.get("hiworks.async_fetch", True):
+        from gui.async_bridge import install_event_loop
+        event_loop = install_event_loop(app)
+    
     # 메인 창 생성 및 표시
-    window = MainWindow()
+    window = MainWindow(event_loop)
     window.show()
     
+    # 창이 표시된 뒤 HTTP/스크래퍼/엑셀 모듈을 백그라운드에서 미리 불러오기
+    QTimer.singleShot(0, prewarm_modules)
+    
+    # Selenium 로그인을 쓰는 설정이면 Chrome도 미리 띄워 첫 로그인 대기 시간을 줄임
+    if settings.get("hiworks.prewarm_driver", False) or not settings.get("hiworks.http_login", True):
+        def prewarm_driver():
+            from scraper.driver_pool import get_driver_pool
+            get_driver_pool(window.headless_checkbox.isChecked()).prewarm()
+        QTimer.singleShot(0, prewarm_driver)
+    
     # 이벤트 루프 시작
-    sys.exit(app.exec())
+    if event_loop is None:
+        sys.exit(app.exec())
+    with event_loop:
+        exit_code = event_loop.run_forever()
+        # 창이 닫힌 뒤 비동기 HTTP 세션 정리
+        if window.async_scraper is not None:
+            event_loop.run_until_complete(window.async_scraper.close())
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+from typing import Dict, Optional, Sequence
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor
+from PyQt6.QtWidgets import QTableView
+from schedule.diff import ADDED, MODIFIED
+from schedule.event_store import COLUMN_HEADERS, EventStore
+
+
+# 테이블 컬럼 헤더
+SCHEDULE_HEADERS = COLUMN_HEADERS
+
+# 이전 조회 대비 추가/수정된 행의 배경색
+CHANGE_COLORS = {
+    ADDED: QColor(46, 160, 67, 70),
+    MODIFIED: QColor(210, 153, 34, 70),
+}
+
+
+class ScheduleTableModel(QAbstractTableModel):
+    """
+    일정 테이블 모델. rows(저장소 행 번호 목록)를 주면 그 행만 보여줍니다. (카테고리 탭마다 하나)
+    행은 스크롤에 따라 FETCH_BATCH 단위로 지연 로드됩니다 (canFetchMore/fetchMore).
+    """
+    FETCH_BATCH = 500
+
+    def __init__(self, store: Optional[EventStore] = None, rows: Optional[Sequence[int]] = None, parent=None):
+        super().__init__(parent)
+        self._store = store if store is not None else EventStore()
+        self._rows = rows  # None이면 저장소 전체
+        self._loaded = min(self.FETCH_BATCH, self._total())
+        self._row_changes: Dict[int, str] = {}  # 저장소 행 번호 -> 변경 종류 (schedule.diff)
+
+    def set_store(self, store: EventStore, row_changes: Optional[Dict[int, str]] = None,
+                  rows: Optional[Sequence[int]] = None):
+        """데이터를 교체합니다. row_changes가 있으면 추가/수정된 행을 강조합니다."""
+        self.beginResetModel()
+        self._store = store
+        self._rows = rows
+        self._loaded = min(self.FETCH_BATCH, self._total())
+        self._row_changes = row_changes or {}
+        self.endResetModel()
+
+    def store(self) -> EventStore:
+        return self._store
+
+    def _total(self) -> int:
+        return len(self._store) if self._rows is None else len(self._rows)
+
+    def store_row(self, row: int) -> int:
+        """테이블 행 번호를 저장소 행 번호로 바꿉니다."""
+        return row if self._rows is None else self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(SCHEDULE_HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._store.value(self.store_row(index.row()), index.column())
+        if role == Qt.ItemDataRole.BackgroundRole and self._row_changes:
+            change = self._row_changes.get(self.store_row(index.row()))
+            if change is not None:
+                return QBrush(CHANGE_COLORS[change])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return SCHEDULE_HEADERS[section]
+        return section + 1
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < self._total()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, self._total() - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+
+def fit_columns_to_sample(view: QTableView, sample_size: int = 200, max_width: int = 400):
+    """
+    앞쪽 일부 행만 측정해 컬럼 너비를 정합니다.
+    resizeColumnsToContents()처럼 모든 행을 측정하지 않으므로 데이터 크기와 무관하게 빠릅니다.
+    """
+    model = view.model()
+    metrics = view.fontMetrics()
+    header = view.horizontalHeader()
+    padding = 24
+    rows = min(model.rowCount(), sample_size)
+    for col in range(model.columnCount()):
+        title = model.headerData(col, Qt.Orientation.Horizontal)
+        width = metrics.horizontalAdvance(str(title))
+        for row in range(rows):
+            text = model.data(model.index(row, col))
+            if text:
+                width = max(width, metrics.horizontalAdvance(text))
+                if width >= max_width:
+                    break
+        if col < model.columnCount() - 1 or not header.stretchLastSection():
+            view.setColumnWidth(col, min(width + padding, max_width))
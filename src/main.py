@@ -86,4 +86,8 @@ def main():
         logger.info("프로그램을 종료합니다.")
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # 인자가 있으면 GUI 없이 명령줄 모드로 실행
+        from cli import main as cli_main
+        sys.exit(cli_main())
     main() 
\ No newline at end of file
@@ -0,0 +1 @@
+# Schedule Data Package 
\ No newline at end of file
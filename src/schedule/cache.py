@@ -0,0 +1,178 @@
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config.settings import settings
+from config.constants import DEFAULT_DATE_FORMAT
+from utils.credential_manager import get_app_data_dir
+from schedule.parser import SCHEDULE_LIST_KEYS, schedule_key
+from utils.logger import logger
+
+# 캐시 유효 시간 기본값 (초)
+DEFAULT_CACHE_TTL = 10 * 60  # 오늘 이후 기간이 포함된 구간
+DEFAULT_PAST_CACHE_TTL = 24 * 60 * 60  # 이미 지난 구간
+
+# 캐시 형식 버전 (PRAGMA user_version). 1: 빈 구간의 응답 dict가 일정으로 저장된 캐시 정리
+SCHEMA_VERSION = 1
+
+Window = Tuple[str, str]
+
+
+class ScheduleCache:
+    """
+    계정(로그인 아이디)/회사 도메인/구간별로 받아온 일정을 SQLite에 보관하는 로컬 캐시.
+    같은 회사의 다른 계정이나 같은 PC의 다른 사용자는 서로의 캐시를 보지 않습니다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, ttl: Optional[int] = None,
+                 past_ttl: Optional[int] = None):
+        if db_path is None:
+            data_dir = get_app_data_dir()
+            os.makedirs(data_dir, exist_ok=True)
+            db_path = os.path.join(data_dir, "schedule_cache.db")
+        self.db_path = db_path
+        self.ttl = ttl if ttl is not None else settings.get("data.cache_ttl", DEFAULT_CACHE_TTL)
+        self.past_ttl = past_ttl if past_ttl is not None else settings.get("data.cache_past_ttl", DEFAULT_PAST_CACHE_TTL)
+
+        # 작업 스레드에서도 사용하므로 연결을 공유하고 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # 계정 컬럼이 없던 이전 형식의 캐시는 누구의 것인지 알 수 없으므로 버림
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(windows)")]
+            if columns and "account" not in columns:
+                logger.info("이전 형식의 일정 캐시를 삭제합니다.")
+                self._conn.execute("DROP TABLE IF EXISTS events")
+                self._conn.execute("DROP TABLE IF EXISTS windows")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS windows (
+                    account TEXT NOT NULL,
+                    company_domain TEXT NOT NULL,
+                    window_start TEXT NOT NULL,
+                    window_end TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (account, company_domain, window_start, window_end)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS events (
+                    account TEXT NOT NULL,
+                    company_domain TEXT NOT NULL,
+                    window_start TEXT NOT NULL,
+                    window_end TEXT NOT NULL,
+                    category TEXT,
+                    event_key TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (account, company_domain, window_start, window_end, event_key)
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_category ON events (account, company_domain, category)"
+            )
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+                self._drop_wrapper_windows()
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _drop_wrapper_windows(self):
+        """
+        일정이 없는 구간의 응답 dict({"result": ..., "data": []})가 일정 한 건으로 저장된 구간을 지웁니다.
+        지운 구간은 다음 조회 때 다시 받아옵니다.
+        """
+        wrapper_windows = set()
+        for account, company_domain, window_start, window_end, data in self._conn.execute(
+            "SELECT account, company_domain, window_start, window_end, data FROM events"
+        ):
+            schedule = json.loads(data)
+            if isinstance(schedule, dict) and any(isinstance(schedule.get(key), list) for key in SCHEDULE_LIST_KEYS):
+                wrapper_windows.add((account, company_domain, window_start, window_end))
+        if not wrapper_windows:
+            return
+        logger.info("응답 dict가 일정으로 저장된 캐시 구간 %d개를 삭제합니다.", len(wrapper_windows))
+        for table in ("events", "windows"):
+            self._conn.executemany(
+                f"DELETE FROM {table}"
+                " WHERE account = ? AND company_domain = ? AND window_start = ? AND window_end = ?",
+                sorted(wrapper_windows),
+            )
+
+    def _window_ttl(self, window: Window) -> int:
+        """이미 지난 구간은 바뀔 일이 적으므로 더 오래 보관합니다."""
+        today = datetime.date.today().strftime(DEFAULT_DATE_FORMAT)
+        return self.past_ttl if window[1] < today else self.ttl
+
+    def get_stale_windows(self, account: str, company_domain: str, windows: Iterable[Window]) -> List[Window]:
+        """캐시에 없거나 유효 시간이 지난 구간을 반환합니다."""
+        now = time.time()
+        stale = []
+        with self._lock:
+            for window in windows:
+                row = self._conn.execute(
+                    "SELECT fetched_at FROM windows"
+                    " WHERE account = ? AND company_domain = ? AND window_start = ? AND window_end = ?",
+                    (account, company_domain, window[0], window[1]),
+                ).fetchone()
+                if row is None or now - row[0] > self._window_ttl(window):
+                    stale.append(window)
+        return stale
+
+    def store_window(self, account: str, company_domain: str, window: Window, schedules: List[Dict[str, Any]]):
+        """구간의 일정을 통째로 교체하여 저장합니다."""
+        rows = [
+            (account, company_domain, window[0], window[1], sch.get('category'),
+             json.dumps(schedule_key(sch), ensure_ascii=False, default=str),
+             json.dumps(sch, ensure_ascii=False))
+            for sch in schedules
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM events WHERE account = ? AND company_domain = ? AND window_start = ? AND window_end = ?",
+                (account, company_domain, window[0], window[1]),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO windows VALUES (?, ?, ?, ?, ?)",
+                (account, company_domain, window[0], window[1], time.time()),
+            )
+        logger.info("일정 캐시 저장: %s@%s %s ~ %s (%d개)", account, company_domain, window[0], window[1], len(rows))
+
+    def load_windows(self, account: str, company_domain: str, windows: Iterable[Window],
+                     categories: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """구간들의 캐시된 일정을 반환합니다. categories를 지정하면 해당 카테고리만 반환합니다."""
+        category_filter = set(categories) if categories is not None else None
+        schedules = []
+        with self._lock:
+            for window in windows:
+                cursor = self._conn.execute(
+                    "SELECT category, data FROM events"
+                    " WHERE account = ? AND company_domain = ? AND window_start = ? AND window_end = ?",
+                    (account, company_domain, window[0], window[1]),
+                )
+                for category, data in cursor:
+                    if category_filter is None or category in category_filter:
+                        schedules.append(json.loads(data))
+        return schedules
+
+    def invalidate(self, company_domain: Optional[str] = None):
+        """캐시를 비웁니다. company_domain을 지정하면 해당 회사만 비웁니다."""
+        with self._lock, self._conn:
+            if company_domain is None:
+                self._conn.execute("DELETE FROM events")
+                self._conn.execute("DELETE FROM windows")
+            else:
+                self._conn.execute("DELETE FROM events WHERE company_domain = ?", (company_domain,))
+                self._conn.execute("DELETE FROM windows WHERE company_domain = ?", (company_domain,))
+        logger.info(f"일정 캐시를 비웠습니다: {company_domain or '전체'}")
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
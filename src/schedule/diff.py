@@ -0,0 +1,113 @@
+import hashlib
+from typing import Any, Dict, List, Optional
+from schedule.event_store import EventStore
+from utils.datetime_parser import MISSING_TIMESTAMP
+
+
+# 변경 종류
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+
+# 지문 계산 시 필드 구분자 (일정 텍스트에 나오지 않는 제어 문자)
+FIELD_SEPARATOR = "\x1f"
+
+Snapshot = Dict[str, str]  # 일정 키 -> 내용 지문
+
+
+def _digest(*values: Any) -> str:
+    text = FIELD_SEPARATOR.join(str(value) for value in values)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _datetime_value(store: EventStore, row: int, column: int) -> Any:
+    """epoch 초, 해석하지 못한 일시는 원문"""
+    timestamp = (store.starts if column == 0 else store.ends)[row]
+    return timestamp if timestamp != MISSING_TIMESTAMP else store.value(row, column)
+
+
+def event_key(store: EventStore, row: int) -> str:
+    """일정을 구분하는 키 (카테고리 + ID, ID가 없으면 카테고리 + 기간/제목 해시)"""
+    category = store.category_of(row)
+    schedule_id = store.ids[row]
+    if schedule_id is not None:
+        return f"{category}:{schedule_id}"
+    return f"{category}:#" + _digest(_datetime_value(store, row, 0), _datetime_value(store, row, 1),
+                                     store.text_table[store.subjects[row]])
+
+
+def event_fingerprint(store: EventStore, row: int) -> str:
+    """제목/프로젝트/내용/시작/종료로 만든 내용 지문. 이 중 하나라도 바뀌면 값이 달라집니다."""
+    texts = store.text_table.values
+    return _digest(
+        texts[store.subjects[row]], texts[store.projects[row]], texts[store.contents[row]],
+        _datetime_value(store, row, 0), _datetime_value(store, row, 1),
+    )
+
+
+def take_snapshot(store: EventStore) -> Snapshot:
+    """저장소 전체의 {키: 지문} 스냅샷을 만듭니다. JSON으로 그대로 저장할 수 있습니다."""
+    return {event_key(store, row): event_fingerprint(store, row) for row in range(len(store))}
+
+
+class ChangeSet:
+    """두 스냅샷 사이에 추가/삭제/수정된 일정 키 목록"""
+
+    def __init__(self, added: Optional[List[str]] = None, removed: Optional[List[str]] = None,
+                 modified: Optional[List[str]] = None):
+        self.added = added or []
+        self.removed = removed or []
+        self.modified = modified or []
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.modified)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def status_of(self) -> Dict[str, str]:
+        """키별 변경 종류 (삭제된 일정 포함)"""
+        status = dict.fromkeys(self.added, ADDED)
+        status.update(dict.fromkeys(self.modified, MODIFIED))
+        status.update(dict.fromkeys(self.removed, REMOVED))
+        return status
+
+    def summary(self) -> str:
+        return f"추가 {len(self.added)}개, 수정 {len(self.modified)}개, 삭제 {len(self.removed)}개"
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {ADDED: self.added, REMOVED: self.removed, MODIFIED: self.modified}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[str]]) -> "ChangeSet":
+        return cls(data.get(ADDED), data.get(REMOVED), data.get(MODIFIED))
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> ChangeSet:
+    """두 스냅샷을 비교합니다. 키를 해시로 한 번씩만 조회하므로 일정 수에 비례하는 시간이 걸립니다."""
+    changes = ChangeSet()
+    for key, fingerprint in new.items():
+        previous = old.get(key)
+        if previous is None:
+            changes.added.append(key)
+        elif previous != fingerprint:
+            changes.modified.append(key)
+    changes.removed = [key for key in old if key not in new]
+    return changes
+
+
+def diff_stores(old_store: EventStore, new_store: EventStore) -> ChangeSet:
+    return diff_snapshots(take_snapshot(old_store), take_snapshot(new_store))
+
+
+def changed_rows(store: EventStore, changes: ChangeSet) -> Dict[int, str]:
+    """저장소에 있는 행 중 추가/수정된 행의 {행 번호: 변경 종류} (화면 강조용)"""
+    status = changes.status_of()
+    if not status:
+        return {}
+    result = {}
+    for row in range(len(store)):
+        kind = status.get(event_key(store, row))
+        if kind is not None:
+            result[row] = kind
+    return result
@@ -0,0 +1,188 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from schedule.parser import extract_schedules, get_schedule_id
+from utils.datetime_parser import MISSING_TIMESTAMP, TimestampParser, format_timestamp
+from utils.html_entities import decode_html_entities
+
+
+# 표시/내보내기 컬럼 헤더 (EventStore.value의 컬럼 순서)
+COLUMN_HEADERS = ["시작일시", "종료일시", "제목", "프로젝트", "내용"]
+
+
+class StringTable:
+    """중복 문자열을 한 번만 보관하고 행에는 번호만 저장하는 문자열 테이블"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.values)
+            self._index[value] = code
+            self.values.append(value)
+        return code
+
+    def get(self, value: str) -> Optional[int]:
+        """문자열의 번호를 반환합니다. 없으면 None을 반환합니다."""
+        return self._index.get(value)
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self):
+        return len(self.values)
+
+
+class EventStore:
+    """
+    정규화된 일정을 컬럼 단위로 보관하는 저장소.
+
+    카테고리는 코드 배열, 시작/종료 일시는 epoch 초 배열, 제목/프로젝트/내용은 문자열 테이블 번호로 저장합니다.
+    응답 하나당 한 번 만들어 분류, 정렬, 테이블 표시, 내보내기에서 함께 사용합니다.
+    """
+
+    # 표시 컬럼 순서: 시작일시, 종료일시, 제목, 프로젝트, 내용
+    COLUMN_COUNT = 5
+
+    def __init__(self, decode_entities: bool = True):
+        self.decode_entities = decode_entities  # 이미 변환된 데이터면 False
+        self.category_table = StringTable()
+        self.text_table = StringTable()
+        self.ids: List[Optional[str]] = []
+        self.category_codes = array('I')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.subjects = array('I')
+        self.projects = array('I')
+        self.contents = array('I')
+        self._raw_datetimes: Dict[Tuple[int, int], str] = {}  # 해석하지 못한 일시 원문 (행, 컬럼)
+        self._category_counts: Dict[int, int] = {}
+        self._timestamp_parser = TimestampParser()  # 같은 일시 문자열은 한 번만 해석
+
+    @classmethod
+    def from_response(cls, json_data: Any, decode_entities: bool = True) -> "EventStore":
+        """get_schedule_new 응답(또는 일정 목록)으로 저장소를 만듭니다."""
+        store = cls(decode_entities)
+        store.extend(extract_schedules(json_data))
+        return store
+
+    def extend(self, schedules: Iterable[Dict[str, Any]]):
+        """일정 여러 개를 추가합니다. 시작/종료 일시는 컬럼 단위로 한 번에 해석합니다."""
+        schedules = list(schedules)
+        raw_starts = [sch.get('start_date', sch.get('start', '')) for sch in schedules]
+        raw_ends = [sch.get('end_date', sch.get('end', '')) for sch in schedules]
+        starts = self._timestamp_parser.parse_column(raw_starts)
+        ends = self._timestamp_parser.parse_column(raw_ends)
+        for index, schedule in enumerate(schedules):
+            self._append_row(schedule, starts[index], ends[index], raw_starts[index], raw_ends[index])
+
+    def append(self, schedule: Dict[str, Any]):
+        """일정 dict 하나를 정규화하여 추가합니다."""
+        self.extend([schedule])
+
+    def _append_row(self, schedule: Dict[str, Any], start: int, end: int, raw_start: Any, raw_end: Any):
+        """HTML 엔티티는 이때 한 번만 변환됩니다."""
+        row = len(self.ids)
+        category_code = self.category_table.intern(str(schedule.get('category', '기타')))
+        self.ids.append(get_schedule_id(schedule))
+        self.category_codes.append(category_code)
+        self._category_counts[category_code] = self._category_counts.get(category_code, 0) + 1
+
+        self.starts.append(start)
+        self.ends.append(end)
+        # 해석하지 못한 일시는 원문을 그대로 표시
+        if start == MISSING_TIMESTAMP and raw_start:
+            self._raw_datetimes[(row, 0)] = str(raw_start)
+        if end == MISSING_TIMESTAMP and raw_end:
+            self._raw_datetimes[(row, 1)] = str(raw_end)
+
+        subject = schedule.get('subject', schedule.get('title', schedule.get('name', '')))
+        project = schedule.get('project_name', schedule.get('project', ''))
+        content = schedule.get('content', schedule.get('description', schedule.get('desc', '')))
+        self.subjects.append(self._intern_text(subject))
+        self.projects.append(self._intern_text(project))
+        self.contents.append(self._intern_text(content))
+
+    def _intern_text(self, value: Any) -> int:
+        text = str(value) if value else ''
+        if self.decode_entities:
+            text = decode_html_entities(text)
+        return self.text_table.intern(text)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def categories(self) -> List[str]:
+        """카테고리 이름 목록 (처음 등장한 순서)"""
+        return list(self.category_table.values)
+
+    def category_code(self, category: str) -> Optional[int]:
+        return self.category_table.get(category)
+
+    def category_of(self, row: int) -> str:
+        return self.category_table[self.category_codes[row]]
+
+    def category_counts(self) -> Dict[str, int]:
+        """카테고리별 일정 수 (처음 등장한 순서)"""
+        return {self.category_table[code]: count for code, count in self._category_counts.items()}
+
+    def indices_for_category(self, category: str) -> array:
+        """카테고리에 속한 행 번호 배열"""
+        code = self.category_code(category)
+        if code is None:
+            return array('I')
+        return array('I', (row for row, row_code in enumerate(self.category_codes) if row_code == code))
+
+    def indices_by_category(self) -> Dict[str, array]:
+        """카테고리별 행 번호 배열 (처음 등장한 순서). 전체 행을 한 번만 훑습니다."""
+        groups: Dict[int, array] = {code: array('I') for code in self._category_counts}
+        for row, code in enumerate(self.category_codes):
+            groups[code].append(row)
+        return {self.category_table[code]: rows for code, rows in groups.items()}
+
+    def indices_in_range(self, start: int, end: int) -> array:
+        """[start, end] (epoch 초) 기간과 겹치는 행 번호 배열. 일시가 없는 행은 포함합니다."""
+        result = array('I')
+        for row in range(len(self.ids)):
+            row_start = self.starts[row]
+            row_end = self.ends[row] if self.ends[row] != MISSING_TIMESTAMP else row_start
+            if row_start != MISSING_TIMESTAMP and row_start > end:
+                continue
+            if row_end != MISSING_TIMESTAMP and row_end < start:
+                continue
+            result.append(row)
+        return result
+
+    def sorted_indices(self, rows: Optional[Iterable[int]] = None, by: str = 'start') -> List[int]:
+        """행 번호를 시작/종료 일시 순으로 정렬합니다."""
+        column = self.starts if by == 'start' else self.ends
+        rows = range(len(self.ids)) if rows is None else rows
+        return sorted(rows, key=column.__getitem__)
+
+    def value(self, row: int, column: int) -> str:
+        """표시용 값 (0: 시작일시, 1: 종료일시, 2: 제목, 3: 프로젝트, 4: 내용)"""
+        if column == 0 or column == 1:
+            timestamp = (self.starts if column == 0 else self.ends)[row]
+            if timestamp == MISSING_TIMESTAMP:
+                return self._raw_datetimes.get((row, column), '')
+            return format_timestamp(timestamp)
+        if column == 2:
+            return self.text_table[self.subjects[row]]
+        if column == 3:
+            return self.text_table[self.projects[row]]
+        return self.text_table[self.contents[row]]
+
+    def row(self, row: int) -> Tuple[str, str, str, str, str]:
+        return tuple(self.value(row, column) for column in range(self.COLUMN_COUNT))
+
+    def rows(self, indices: Optional[Iterable[int]] = None) -> Iterator[Tuple[str, str, str, str, str]]:
+        """표시용 행을 순서대로 반환합니다."""
+        indices = range(len(self.ids)) if indices is None else indices
+        for row in indices:
+            yield self.row(row)
+
+    def rows_for_category(self, category: str) -> Iterator[Tuple[str, str, str, str, str]]:
+        return self.rows(self.indices_for_category(category))
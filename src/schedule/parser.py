@@ -0,0 +1,77 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# 응답 dict에서 일정 목록이 들어있을 수 있는 키
+SCHEDULE_LIST_KEYS = ['schedules', 'data', 'events', 'items', 'list']
+
+# 일정 고유 ID로 사용할 수 있는 키
+SCHEDULE_ID_KEYS = ['id', 'schedule_id', 'no', 'seq']
+
+
+def extract_schedules(json_data: Any) -> List[Dict[str, Any]]:
+    """
+    get_schedule_new 응답에서 일정 dict 목록을 꺼냅니다.
+    일정 목록 키가 있으면 비어 있어도 그 목록을 사용하고, 목록 키가 없는 dict만 일정 하나로 봅니다.
+    """
+    schedules = []
+    if isinstance(json_data, list):
+        schedules = json_data
+    elif isinstance(json_data, dict):
+        for key in SCHEDULE_LIST_KEYS:
+            if isinstance(json_data.get(key), list):
+                schedules = json_data[key]
+                break
+        else:
+            schedules = [json_data]
+    return [sch for sch in schedules if isinstance(sch, dict)]
+
+
+def get_schedule_id(schedule: Dict[str, Any]) -> Optional[str]:
+    """일정의 고유 ID를 반환합니다. ID가 없으면 None을 반환합니다."""
+    for key in SCHEDULE_ID_KEYS:
+        value = schedule.get(key)
+        if value not in (None, ''):
+            return str(value)
+    return None
+
+
+def schedule_key(schedule: Dict[str, Any]) -> tuple:
+    """중복 제거에 사용할 키 (ID가 없으면 카테고리/기간/제목 조합)"""
+    schedule_id = get_schedule_id(schedule)
+    if schedule_id is not None:
+        return (schedule.get('category'), schedule_id)
+    return (
+        schedule.get('category'),
+        schedule.get('start_date', schedule.get('start')),
+        schedule.get('end_date', schedule.get('end')),
+        schedule.get('subject', schedule.get('title', schedule.get('name'))),
+    )
+
+
+def merge_schedules(chunks: Iterable[Any]) -> List[Dict[str, Any]]:
+    """여러 구간의 응답을 하나의 일정 목록으로 합치고 중복을 제거합니다."""
+    merged = []
+    seen = set()
+    for chunk in chunks:
+        for schedule in extract_schedules(chunk):
+            key = schedule_key(schedule)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(schedule)
+    return merged
+
+
+def filter_schedules_by_range(schedules: Iterable[Dict[str, Any]], start_date: str,
+                              end_date: str) -> List[Dict[str, Any]]:
+    """조회 기간(YYYY-MM-DD)과 겹치는 일정만 남깁니다. 날짜가 없는 일정은 유지합니다."""
+    result = []
+    for schedule in schedules:
+        sch_start = str(schedule.get('start_date', schedule.get('start', '')) or '')[:10]
+        sch_end = str(schedule.get('end_date', schedule.get('end', '')) or '')[:10] or sch_start
+        if sch_start and sch_start > end_date:
+            continue
+        if sch_end and sch_end < start_date:
+            continue
+        result.append(schedule)
+    return result
@@ -0,0 +1,149 @@
+import datetime
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+from config.settings import settings
+from config.constants import DEFAULT_DATE_FORMAT
+from schedule.diff import diff_snapshots, take_snapshot
+from schedule.event_store import EventStore
+from utils.html_entities import decode_json_html_entities
+from utils.logger import logger
+
+
+# 동기화 기본값
+DEFAULT_SYNC_INTERVAL = 30 * 60  # 초
+DEFAULT_MONTHS_AHEAD = 1  # 이번 달 + 다음 달
+
+# 마지막으로 내보낸 스냅샷 정보를 기록하는 파일 (export_path 아래)
+SYNC_STATE_FILE = ".sync_state.json"
+
+
+def rolling_window(today: Optional[datetime.date] = None, months_ahead: int = DEFAULT_MONTHS_AHEAD) -> Tuple[str, str]:
+    """이번 달 1일부터 months_ahead개월 뒤 달의 말일까지의 기간을 반환합니다."""
+    today = today or datetime.date.today()
+    start = today.replace(day=1)
+    month_index = start.month - 1 + months_ahead + 1
+    after_end = datetime.date(start.year + month_index // 12, month_index % 12 + 1, 1)
+    end = after_end - datetime.timedelta(days=1)
+    return start.strftime(DEFAULT_DATE_FORMAT), end.strftime(DEFAULT_DATE_FORMAT)
+
+
+class ScheduleSyncer:
+    """
+    로그인한 HiworksScraper로 기간을 주기적으로 받아, 이전 스냅샷과 달라졌을 때만 내보내는 동기화 작업.
+    전체 파일과 함께 변경분만 담은 delta 파일(JSON Lines)도 씁니다.
+
+    세션이 만료되면(need_relogin) 저장한 자격 증명으로 다시 로그인한 뒤 한 번 더 요청합니다.
+    data.auto_save가 False면 변경 여부만 기록하고 파일은 쓰지 않습니다.
+    """
+
+    def __init__(self, scraper, user_id: str, user_pw: str, export_path: Optional[str] = None,
+                 format_name: Optional[str] = None, interval: Optional[int] = None,
+                 months_ahead: Optional[int] = None):
+        self.scraper = scraper
+        self.user_id = user_id
+        self.user_pw = user_pw
+        self.export_path = export_path or settings.get("data.export_path", "./data/exports/")
+        self.format_name = format_name or settings.get("data.excel_format", "xlsx")
+        self.interval = interval if interval is not None else settings.get("data.sync_interval", DEFAULT_SYNC_INTERVAL)
+        self.months_ahead = months_ahead if months_ahead is not None else settings.get("data.sync_months_ahead", DEFAULT_MONTHS_AHEAD)
+        self.auto_save = settings.get("data.auto_save", True)
+        self.state_path = os.path.join(self.export_path, SYNC_STATE_FILE)
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        os.makedirs(self.export_path, exist_ok=True)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False)
+
+    def _ensure_login(self) -> bool:
+        if self.scraper.is_logged_in:
+            return True
+        logger.info("동기화를 위해 로그인합니다.")
+        return self.scraper.login(self.user_id, self.user_pw)
+
+    def fetch(self, start_date: str, end_date: str) -> Any:
+        """기간 일정을 받아옵니다. 세션이 만료되었으면 다시 로그인하여 한 번 더 요청합니다."""
+        if not self._ensure_login():
+            return {"error": "로그인 실패"}
+        # 최신 상태를 비교해야 하므로 로컬 캐시는 사용하지 않음
+        result = self.scraper.fetch_schedule_range(start_date, end_date)
+        if isinstance(result, dict) and result.get("need_relogin"):
+            logger.info("세션이 만료되어 다시 로그인합니다.")
+            self.scraper.is_logged_in = False
+            if not self._ensure_login():
+                return {"error": "재로그인 실패"}
+            result = self.scraper.fetch_schedule_range(start_date, end_date)
+        return result
+
+    def sync_once(self, today: Optional[datetime.date] = None) -> Dict[str, Any]:
+        """
+        한 번 동기화합니다.
+        반환값: {"range", "count", "changed", "changes", "file_path", "delta_path"} 또는 오류 시 {"error"}
+        """
+        from export.delta import export_delta
+        from export.registry import export_store, get_exporter
+
+        start_date, end_date = rolling_window(today, self.months_ahead)
+        result = self.fetch(start_date, end_date)
+        if isinstance(result, dict) and "error" in result:
+            logger.error(f"동기화 요청 실패 ({start_date} ~ {end_date}): {result.get('error')}")
+            return {"error": result.get("error")}
+
+        store = EventStore.from_response(decode_json_html_entities(result), decode_entities=False)
+        snapshot = take_snapshot(store)
+        summary = {"range": [start_date, end_date], "count": len(store), "changed": False,
+                   "changes": None, "file_path": None, "delta_path": None}
+        # 기간이 바뀌면(월이 넘어가면) 이전 스냅샷과 비교하지 않고 전체를 새로 내보냄
+        same_range = self.state.get("range") == summary["range"] and "snapshot" in self.state
+        changes = diff_snapshots(self.state["snapshot"], snapshot) if same_range else None
+        if changes is not None and not changes:
+            logger.info(f"동기화: 변경 없음 ({start_date} ~ {end_date}, {len(store)}개)")
+            return summary
+
+        summary["changed"] = True
+        summary["changes"] = changes.to_dict() if changes is not None else None
+        change_text = changes.summary() if changes is not None else "새 기간"
+        if self.auto_save:
+            extension = get_exporter(self.format_name).extension
+            file_path = os.path.join(self.export_path, f"schedule_{start_date}_{end_date}{extension}")
+            os.makedirs(self.export_path, exist_ok=True)
+            export_store(store, file_path, self.format_name)
+            summary["file_path"] = file_path
+            if changes is not None:
+                stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                delta_path = os.path.join(self.export_path, f"schedule_{start_date}_{end_date}_delta_{stamp}.jsonl")
+                export_delta(store, changes, delta_path)
+                summary["delta_path"] = delta_path
+            logger.info(f"동기화: 변경된 일정을 내보냈습니다 ({change_text}) -> {file_path}")
+        else:
+            logger.info(f"동기화: 변경 감지 ({start_date} ~ {end_date}, {change_text}), data.auto_save가 꺼져 있어 저장하지 않습니다.")
+
+        self.state = {
+            "range": summary["range"],
+            "snapshot": snapshot,
+            "count": len(store),
+            "synced_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        self._save_state()
+        return summary
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """stop_event가 설정될 때까지 interval초마다 동기화합니다. 실패해도 다음 주기에 다시 시도합니다."""
+        stop_event = stop_event or threading.Event()
+        logger.info(f"일정 동기화를 시작합니다. (주기 {self.interval}초, {self.format_name})")
+        while not stop_event.is_set():
+            try:
+                self.sync_once()
+            except Exception as e:
+                logger.error(f"동기화 중 오류: {e}")
+            stop_event.wait(self.interval)
+        logger.info("일정 동기화를 종료합니다.")
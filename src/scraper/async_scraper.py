@@ -0,0 +1,267 @@
+import asyncio
+import json
+from http.cookies import SimpleCookie
+from typing import Optional, Any, AsyncIterator, Callable, List, Tuple
+from config.settings import settings
+from config.constants import DEFAULT_USER_AGENT, DEFAULT_TIMEOUT
+from utils.logger import logger
+from scraper.http_login import (
+    build_identify_payload, build_login_payload, extract_company_domain, find_company_domain,
+    get_login_endpoints, get_session_check_url, is_login_page,
+)
+from scraper.range_planner import plan_date_ranges
+from scraper.schedule_api import (
+    UNKNOWN_DOMAIN_ERROR, STREAM_CHUNK_SIZE, ScheduleStreamParser, build_schedule_request,
+)
+from schedule.parser import merge_schedules, extract_schedules, filter_schedules_by_range
+
+try:
+    import aiohttp
+    import yarl  # aiohttp 의존성
+except ImportError:  # aiohttp가 없으면 AsyncHiworksScraper 생성 시 오류 안내
+    aiohttp = None
+
+
+class AsyncHiworksScraper:
+    """asyncio 기반 하이웍스 스크래퍼 (HTTP 로그인 전용)"""
+
+    def __init__(self, timeout: Optional[float] = None, max_concurrency: Optional[int] = None):
+        if aiohttp is None:
+            raise ImportError("AsyncHiworksScraper를 사용하려면 aiohttp가 필요합니다. (pip install aiohttp)")
+        self.timeout = timeout or settings.get("hiworks.timeout", DEFAULT_TIMEOUT)
+        self.max_concurrency = max_concurrency or settings.get("hiworks.max_workers", 4)
+        self.company_domain: Optional[str] = None
+        self.user_id: Optional[str] = None  # 로그인한 아이디 (일정 캐시를 계정별로 나누는 데 사용)
+        self.is_logged_in = False
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._pending_cookies: List[Tuple[SimpleCookie, str]] = []  # 세션을 만들 때 넣을 (쿠키, 받은 주소)
+
+    @classmethod
+    def from_scraper(cls, scraper) -> "AsyncHiworksScraper":
+        """
+        로그인된 HiworksScraper의 쿠키와 회사 도메인을 넘겨받습니다.
+        Selenium 로그인이나 저장된 세션으로 로그인한 경우에도 다시 로그인하지 않고 비동기로 요청할 수 있습니다.
+        """
+        async_scraper = cls(timeout=scraper.timeout)
+        for cookie in scraper.session.cookies:
+            morsel = SimpleCookie()
+            morsel[cookie.name] = cookie.value
+            morsel[cookie.name]["path"] = cookie.path or "/"
+            if cookie.domain_specified:
+                morsel[cookie.name]["domain"] = cookie.domain
+            # Domain 속성 없이 받은 쿠키는 받은 호스트에만 보내도록 호스트 주소와 함께 넘김
+            async_scraper._pending_cookies.append((morsel, f"https://{cookie.domain.lstrip('.')}/"))
+        async_scraper.company_domain = scraper.company_domain
+        async_scraper.user_id = scraper.user_id
+        async_scraper.is_logged_in = scraper.is_logged_in
+        return async_scraper
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """keep-alive 연결 풀을 가진 aiohttp 세션을 반환합니다."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=settings.get("hiworks.pool_connections", 4) * settings.get("hiworks.pool_maxsize", 8),
+                limit_per_host=settings.get("hiworks.pool_maxsize", 8),
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.timeout,
+                    connect=settings.get("hiworks.connect_timeout", 10),
+                ),
+                headers={"User-Agent": DEFAULT_USER_AGENT},
+            )
+            for cookies, response_url in self._pending_cookies:
+                self._session.cookie_jar.update_cookies(cookies, response_url=yarl.URL(response_url))
+            self._pending_cookies = []
+        return self._session
+
+    async def login(self, user_id: str, user_pw: str) -> bool:
+        """HTTP 2단계 로그인 (아이디 확인 → 비밀번호 로그인 → 세션 확인)"""
+        self.user_id = user_id
+        session = await self._get_session()
+        endpoints = get_login_endpoints()
+        try:
+            logger.info("비동기 HTTP 2단계 로그인 프로세스를 시작합니다.")
+            async with session.get(endpoints["login_page"]):
+                pass
+
+            # 1단계: 아이디 확인 및 회사 도메인 확인
+            async with session.post(endpoints["identify"], json=build_identify_payload(user_id),
+                                    headers={"Referer": endpoints["login_page"]}) as resp:
+                if resp.status >= 400:
+                    logger.error(f"아이디 확인 실패 (상태 코드: {resp.status})")
+                    return False
+                data = await self._json_or_none(resp)
+                domain = find_company_domain(data) or extract_company_domain(str(resp.url))
+            if not domain:
+                logger.warning("응답에서 회사 도메인을 찾을 수 없습니다.")
+                return False
+            self.company_domain = domain
+
+            # 2단계: 비밀번호 로그인
+            referer = f"{endpoints['login_page'].rstrip('/')}/{self.company_domain}/"
+            async with session.post(endpoints["login"], json=build_login_payload(user_id, user_pw),
+                                    headers={"Referer": referer}) as resp:
+                if resp.status >= 400:
+                    logger.error(f"비밀번호 로그인 실패 (상태 코드: {resp.status})")
+                    return False
+                domain = find_company_domain(await self._json_or_none(resp))
+                if domain:
+                    self.company_domain = domain
+
+            # 세션 확인
+            async with session.get(get_session_check_url(self.company_domain)) as resp:
+                if resp.status >= 400 or is_login_page(str(resp.url)):
+                    logger.warning("세션 확인 실패: 로그인 페이지로 이동되었습니다.")
+                    return False
+
+            self.is_logged_in = True
+            logger.info(f"비동기 HTTP 로그인이 성공했습니다. 회사 도메인: {self.company_domain}")
+            return True
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"비동기 HTTP 로그인 요청 오류: {e}")
+            return False
+
+    async def fetch_schedule_json(self, start_date: str, end_date: str,
+                                  deadline: Optional[float] = None) -> Any:
+        """
+        일정 JSON을 요청합니다. deadline(초)을 넘기면 요청을 취소하고 오류 dict를 반환합니다.
+        본문은 받는 대로 해석하며, 작업이 취소되면 asyncio.CancelledError가 그대로 전파됩니다.
+        """
+        if not self.company_domain:
+            logger.error("회사 도메인을 알 수 없어 일정을 요청할 수 없습니다. 다시 로그인하세요.")
+            return dict(UNKNOWN_DOMAIN_ERROR)
+
+        url, payload, headers = build_schedule_request(self.company_domain, start_date, end_date)
+        session = await self._get_session()
+
+        async def _request():
+            async with session.post(url, data=payload, headers=headers) as resp:
+                resp.raise_for_status()
+                parser = ScheduleStreamParser(resp.charset)
+                items = []
+                async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    items.extend(parser.feed(chunk))
+                items.extend(parser.close())
+                return parser.build_response(items)
+
+        try:
+            logger.info(f"비동기 일정 JSON 요청: {start_date} ~ {end_date}")
+            return await asyncio.wait_for(_request(), timeout=deadline)
+        except asyncio.TimeoutError:
+            logger.error(f"일정 요청 시간 초과 ({start_date} ~ {end_date})")
+            return {"error": "요청 시간 초과"}
+        except aiohttp.ClientError as req_error:
+            logger.error(f"HTTP 요청 오류: {req_error}")
+            return {"error": f"HTTP 요청 오류: {req_error}"}
+
+    async def iter_schedule_windows(self, windows: List[Tuple[str, str]], deadline: Optional[float] = None
+                                    ) -> AsyncIterator[Tuple[Tuple[str, str], Any]]:
+        """
+        주어진 구간들을 동시에 요청하고, 완료되는 순서대로 ((시작일, 종료일), 응답)을 반환합니다.
+        반복을 중단하거나 작업이 취소되면 남은 요청도 모두 취소됩니다.
+        """
+        if not windows:
+            return
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _fetch(window):
+            async with semaphore:
+                return window, await self.fetch_schedule_json(window[0], window[1], deadline)
+
+        tasks = [asyncio.ensure_future(_fetch(window)) for window in windows]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iter_schedule_chunks(self, start_date: str, end_date: str, unit: Optional[str] = None,
+                                   deadline: Optional[float] = None) -> AsyncIterator[Tuple[Tuple[str, str], Any]]:
+        """조회 기간을 월/주 단위로 나누어 동시에 요청하고 완료되는 순서대로 ((시작일, 종료일), 응답)을 반환합니다."""
+        unit = unit or settings.get("hiworks.chunk_unit", "month")
+        windows = plan_date_ranges(start_date, end_date, unit)
+        logger.info("일정 구간 분할: %d개 구간 (%s)", len(windows), unit)
+        async for window, result in self.iter_schedule_windows(windows, deadline):
+            yield window, result
+
+    async def fetch_schedule_range(self, start_date: str, end_date: str, unit: Optional[str] = None,
+                                   deadline: Optional[float] = None, cache=None,
+                                   on_chunk: Optional[Callable[[Tuple[str, str], Any, int, int], Any]] = None) -> Any:
+        """
+        구간별 응답을 합쳐 중복을 제거한 일정 목록을 반환합니다. 한 구간이라도 실패하면 해당 오류 응답을 반환합니다.
+        cache(schedule.cache.ScheduleCache)를 지정하면 캐시에 없거나 오래된 구간만 요청합니다.
+        on_chunk(구간, 응답, 완료 구간 수, 전체 구간 수)는 구간 응답을 받을 때마다 호출됩니다.
+        """
+        unit = unit or settings.get("hiworks.chunk_unit", "month")
+        if cache is not None:
+            return await self._fetch_schedule_range_cached(start_date, end_date, unit, deadline, cache, on_chunk)
+
+        windows = plan_date_ranges(start_date, end_date, unit)
+        chunks = []
+        done = 0
+        async for window, result in self.iter_schedule_windows(windows, deadline):
+            if isinstance(result, dict) and "error" in result:
+                logger.error(f"구간 요청 실패 ({window[0]} ~ {window[1]}): {result.get('error')}")
+                return result
+            chunks.append(result)
+            done += 1
+            if on_chunk:
+                on_chunk(window, result, done, len(windows))
+        if len(chunks) == 1:
+            return chunks[0]
+        return merge_schedules(chunks)
+
+    async def _fetch_schedule_range_cached(self, start_date: str, end_date: str, unit: str,
+                                           deadline: Optional[float], cache, on_chunk=None) -> Any:
+        """달력 단위 구간으로 캐시를 조회하고 빠진 구간만 받아와 채웁니다. (SQLite 작업은 스레드 풀에서 실행)"""
+        if not self.company_domain or not self.user_id:
+            logger.error("회사 도메인 또는 로그인 아이디를 알 수 없어 일정 캐시를 사용할 수 없습니다.")
+            return dict(UNKNOWN_DOMAIN_ERROR)
+
+        loop = asyncio.get_running_loop()
+        windows = plan_date_ranges(start_date, end_date, unit, align=True)
+        stale_windows = await loop.run_in_executor(
+            None, cache.get_stale_windows, self.user_id, self.company_domain, windows
+        )
+        logger.info("일정 캐시 조회: 전체 %d개 구간 중 %d개 구간 요청 필요", len(windows), len(stale_windows))
+
+        done = 0
+        async for window, result in self.iter_schedule_windows(stale_windows, deadline):
+            if isinstance(result, dict) and "error" in result:
+                logger.error(f"구간 요청 실패 ({window[0]} ~ {window[1]}): {result.get('error')}")
+                return result
+            await loop.run_in_executor(
+                None, cache.store_window, self.user_id, self.company_domain, window, extract_schedules(result)
+            )
+            done += 1
+            if on_chunk:
+                on_chunk(window, result, done, len(stale_windows))
+
+        cached = await loop.run_in_executor(None, cache.load_windows, self.user_id, self.company_domain, windows)
+        return filter_schedules_by_range(merge_schedules([cached]), start_date, end_date)
+
+    async def close(self):
+        """HTTP 세션을 종료합니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @staticmethod
+    async def _json_or_none(resp) -> Any:
+        """응답을 JSON으로 파싱하고 실패하면 None을 반환합니다."""
+        try:
+            return json.loads(await resp.text())
+        except ValueError:
+            return None
+
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료"""
+        await self.close()
@@ -0,0 +1,84 @@
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from config.settings import settings
+from utils.logger import logger
+
+
+Locator = Tuple[str, str]  # (By.XXX, 값)
+
+# 조건 확인 간격(초). 조건을 만족하는 즉시 반환하므로 고정 대기와 달리 서버 속도만큼만 기다림
+POLL_INTERVAL = 0.1
+
+# 후보 선택자 중 마지막으로 찾은 것을 기억하는 설정 키 ({이름: [By, 값]})
+SELECTOR_HINTS_KEY = "hiworks.selector_hints"
+
+
+def ordered_candidates(name: str, candidates: Sequence[Locator]) -> List[Locator]:
+    """지난번에 찾은 선택자를 맨 앞으로 옮긴 후보 목록을 반환합니다."""
+    ordered = [tuple(locator) for locator in candidates]
+    hint = (settings.get(SELECTOR_HINTS_KEY) or {}).get(name)
+    if hint and tuple(hint) in ordered:
+        ordered.remove(tuple(hint))
+        ordered.insert(0, tuple(hint))
+    return ordered
+
+
+def remember_winner(name: str, locator: Locator):
+    """찾은 선택자를 기록합니다. 바뀐 경우에만 설정 파일에 저장합니다."""
+    # 설정 저장과 같은 잠금을 잡아 다른 스레드의 settings.set과 config.json 쓰기가 겹치지 않게 함
+    with settings.lock:
+        hints = dict(settings.get(SELECTOR_HINTS_KEY) or {})
+        if hints.get(name) == list(locator):
+            return
+        hints[name] = list(locator)
+        settings.set(SELECTOR_HINTS_KEY, hints)
+    logger.debug(f"선택자 기록: {name} -> {locator}")
+
+
+def find_first(driver, candidates: Sequence[Locator], clickable: bool = False) -> Optional[Tuple[Locator, Any]]:
+    """
+    후보 선택자를 한 번씩 확인하여 처음 찾은 (선택자, 요소)를 반환합니다. 기다리지 않습니다.
+    clickable이면 화면에 보이고 활성화된 요소만 인정합니다.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    for locator in candidates:
+        try:
+            elements = driver.find_elements(*locator)
+            for element in elements:
+                if not clickable or (element.is_displayed() and element.is_enabled()):
+                    return locator, element
+        except WebDriverException:
+            continue  # 잘못된 선택자, 사라진 요소 등은 다음 후보로
+    return None
+
+
+def wait_until(driver, condition: Callable[[Any], Any], timeout: float) -> Any:
+    """condition(driver)이 참 값을 반환할 때까지 기다려 그 값을 반환합니다. 시간이 지나면 None"""
+    deadline = time.monotonic() + timeout
+    while True:
+        result = condition(driver)
+        if result:
+            return result
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(POLL_INTERVAL)
+
+
+def race_selectors(driver, name: str, candidates: Sequence[Locator], timeout: float,
+                   clickable: bool = False):
+    """
+    모든 후보 선택자를 동시에 기다려 가장 먼저 나타난 요소를 반환합니다. 시간이 지나면 None
+    후보마다 timeout씩 차례로 기다리지 않으므로 최대 대기 시간은 후보 수와 무관하게 timeout입니다.
+    """
+    ordered = ordered_candidates(name, candidates)
+    started = time.monotonic()
+    found = wait_until(driver, lambda d: find_first(d, ordered, clickable), timeout)
+    if not found:
+        logger.warning(f"{name}: {timeout}초 동안 후보 선택자 {len(ordered)}개 중 일치하는 요소가 없습니다.")
+        return None
+    locator, element = found
+    logger.info(f"{name}: {locator[0]}: {locator[1]}로 찾았습니다. ({time.monotonic() - started:.2f}초)")
+    remember_winner(name, locator)
+    return element
+
@@ -0,0 +1,227 @@
+import atexit
+import os
+import threading
+from typing import Dict, List, Optional
+from config.settings import settings
+from config.constants import DEFAULT_USER_AGENT
+from utils.logger import logger
+
+
+# 풀 기본값
+DEFAULT_POOL_SIZE = 1
+DEFAULT_MAX_USES = 20  # 이 횟수만큼 사용한 드라이버는 새로 띄움
+
+_driver_path_lock = threading.Lock()
+_driver_path: Optional[str] = None
+
+_pools_lock = threading.Lock()
+_pools: Dict[bool, "DriverPool"] = {}
+
+
+def get_chromedriver_path() -> str:
+    """
+    chromedriver 경로를 반환합니다.
+    ChromeDriverManager().install()은 네트워크를 확인할 수 있으므로 프로세스당 한 번만 호출하고,
+    찾은 경로는 hiworks.chromedriver_path 설정에 저장해 다음 실행에서 바로 사용합니다.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path and os.path.exists(_driver_path):
+            return _driver_path
+        saved_path = settings.get("hiworks.chromedriver_path")
+        if saved_path and os.path.exists(saved_path):
+            _driver_path = saved_path
+            return _driver_path
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        _driver_path = ChromeDriverManager().install()
+        settings.set("hiworks.chromedriver_path", _driver_path)
+        logger.info(f"chromedriver 경로를 저장했습니다: {_driver_path}")
+        return _driver_path
+
+
+def build_chrome_options(headless: bool = True):
+    """로그인용 Chrome 옵션을 만듭니다."""
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={DEFAULT_USER_AGENT}")
+
+    # 헤드리스 모드 설정
+    if headless:
+        chrome_options.add_argument("--headless=new")  # 새로운 헤드리스 모드 사용
+
+    # 추가 성능 최적화 옵션
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-plugins")
+    chrome_options.add_argument("--disable-images")  # 이미지 로딩 비활성화로 속도 향상
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    # 연결 안정성을 위한 추가 옵션
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--allow-running-insecure-content")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    return chrome_options
+
+
+def launch_driver(headless: bool = True):
+    """Chrome WebDriver를 새로 띄웁니다."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    service = Service(get_chromedriver_path())
+    driver = webdriver.Chrome(service=service, options=build_chrome_options(headless))
+    # 자동화 감지 방지
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class DriverPool:
+    """
+    미리 띄워 둔 Chrome WebDriver를 로그인마다 빌려주고 돌려받는 풀.
+
+    돌려받은 드라이버는 쿠키/스토리지를 지우고 빈 페이지로 초기화한 뒤 재사용하며,
+    max_uses번 사용했거나 초기화에 실패한(죽은) 드라이버는 종료하고 새로 띄웁니다.
+    """
+
+    def __init__(self, headless: bool = True, size: Optional[int] = None, max_uses: Optional[int] = None):
+        self.headless = headless
+        self.size = size or settings.get("hiworks.driver_pool_size", DEFAULT_POOL_SIZE)
+        self.max_uses = max_uses or settings.get("hiworks.driver_max_uses", DEFAULT_MAX_USES)
+        self._condition = threading.Condition()
+        self._idle: List = []
+        self._uses: Dict[int, int] = {}  # id(driver) -> 사용 횟수
+        self._count = 0  # 띄운 드라이버 수 (빌려준 것 포함, 띄우는 중인 것 포함)
+        self._closed = False
+
+    def _launch(self):
+        logger.info(f"Chrome WebDriver를 시작합니다. (헤드리스: {self.headless})")
+        driver = launch_driver(self.headless)
+        self._uses[id(driver)] = 0
+        return driver
+
+    def prewarm(self, count: Optional[int] = None) -> threading.Thread:
+        """드라이버를 백그라운드 스레드에서 미리 띄워 둡니다."""
+        def run():
+            for _ in range(count or self.size):
+                with self._condition:
+                    if self._closed or self._count >= self.size:
+                        return
+                    self._count += 1
+                try:
+                    driver = self._launch()
+                except Exception as e:
+                    logger.warning(f"WebDriver 미리 띄우기 실패: {e}")
+                    with self._condition:
+                        self._count -= 1
+                        self._condition.notify()
+                    return
+                if not self._return_to_idle(driver):
+                    self._discard(driver)  # 띄우는 사이 풀이 닫힘
+                    return
+
+        thread = threading.Thread(target=run, name="webdriver-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def acquire(self, timeout: Optional[float] = None):
+        """드라이버를 빌립니다. 쉬고 있는 드라이버가 없고 풀이 가득 차면 반납될 때까지 기다립니다."""
+        with self._condition:
+            while not self._idle and self._count >= self.size:
+                if not self._condition.wait(timeout):
+                    raise TimeoutError("사용 가능한 WebDriver가 없습니다.")
+            if self._idle:
+                driver = self._idle.pop()
+                self._uses[id(driver)] += 1
+                return driver
+            self._count += 1
+        try:
+            driver = self._launch()
+        except Exception:
+            with self._condition:
+                self._count -= 1
+                self._condition.notify()
+            raise
+        self._uses[id(driver)] += 1
+        return driver
+
+    def release(self, driver, broken: bool = False):
+        """드라이버를 돌려받습니다. 상태를 초기화하지 못했거나 풀이 닫혔으면 종료합니다."""
+        with self._condition:
+            reusable = not broken and not self._closed and self._uses.get(id(driver), 0) < self.max_uses
+        if reusable:
+            try:
+                self._reset(driver)
+                if self._return_to_idle(driver):
+                    return
+            except Exception as e:
+                logger.warning(f"WebDriver 초기화 실패, 새로 띄웁니다: {e}")
+        self._discard(driver)
+
+    def _return_to_idle(self, driver) -> bool:
+        """
+        드라이버를 쉬는 목록에 넣습니다. 그 사이 close()가 호출되었으면 넣지 않고 False를 반환합니다.
+        (닫힌 풀의 쉬는 목록에 남으면 아무도 종료하지 않음)
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            self._idle.append(driver)
+            self._condition.notify()
+            return True
+
+    @staticmethod
+    def _reset(driver):
+        driver.delete_all_cookies()
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass  # about:blank 등 스토리지가 없는 페이지
+        driver.get("about:blank")
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"WebDriver 종료 중 오류: {e}")
+        with self._condition:
+            self._count -= 1
+            self._condition.notify()
+
+    def close(self):
+        """쉬고 있는 드라이버를 모두 종료합니다. 빌려준 드라이버는 반납될 때 종료됩니다."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+
+def get_driver_pool(headless: bool = True) -> DriverPool:
+    """헤드리스 여부별로 공유하는 DriverPool을 반환합니다."""
+    with _pools_lock:
+        pool = _pools.get(headless)
+        if pool is None or pool._closed:
+            pool = DriverPool(headless)
+            _pools[headless] = pool
+        return pool
+
+
+def close_driver_pools():
+    """모든 DriverPool을 종료합니다. (프로그램 종료 시)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+# CLI/동기화 실행처럼 창 종료 이벤트가 없는 경우에도 Chrome/chromedriver가 남지 않도록
+atexit.register(close_driver_pools)
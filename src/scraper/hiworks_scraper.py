@@ -1,77 +1,52 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import logging
 import re
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, List, Iterator, Tuple, Callable
 from config.settings import settings
 from utils.logger import logger
+from utils.tracing import traced, tracer
+from scraper.http_client import create_http_session
+from scraper.http_login import HttpLoginEngine, extract_company_domain
+from scraper.browser_wait import find_first, race_selectors, wait_until
+from scraper.range_planner import plan_date_ranges
+from scraper.schedule_api import UNKNOWN_DOMAIN_ERROR, STREAM_CHUNK_SIZE, build_schedule_request, read_schedule_response
+from schedule.parser import merge_schedules, extract_schedules, filter_schedules_by_range
 import requests
 
 
+# 일정 요청이 중간에 취소되었을 때 반환하는 결과
+CANCELLED_RESULT = {"error": "요청이 취소되었습니다.", "cancelled": True}
+
+
 class HiworksScraper:
     """하이웍스 웹사이트 스크래핑을 위한 클래스"""
     
-    def __init__(self, headless: bool = True):
-        self.driver: Optional[webdriver.Chrome] = None
-        self.wait: Optional[WebDriverWait] = None
+    def __init__(self, headless: bool = True, session_store=None, company_domain: Optional[str] = None):
+        # selenium은 브라우저 로그인이 필요할 때만 불러옵니다 (HTTP 로그인 경로에서는 import하지 않음)
+        self.driver = None  # selenium.webdriver.Chrome
         self.is_logged_in = False
         self.headless = headless
         self.login_url = settings.get("hiworks.login_url", "https://login.office.hiworks.com/")
         self.timeout = settings.get("hiworks.timeout", 30)
-        self.company_domain = None  # 회사 도메인 (예: kevinlab.com, bontemuseum.com)
+        self.company_domain = company_domain  # 회사 도메인 (예: kevinlab.com, bontemuseum.com), 로그인 시 확인한 값으로 갱신
+        self.user_id: Optional[str] = None  # 로그인한 아이디 (일정 캐시를 계정별로 나누는 데 사용)
+        self.use_http_login = settings.get("hiworks.http_login", True)
+        self.session = create_http_session()  # 스크래퍼 수명 동안 재사용하는 HTTP 연결 풀
+        self.session_store = session_store  # 저장된 로그인 세션 재사용 (utils.session_store.SessionStore)
         
+    @traced("driver.setup", "login")
     def setup_driver(self) -> bool:
-        """Chrome WebDriver를 설정합니다."""
+        """WebDriver 풀에서 Chrome WebDriver를 빌려 설정합니다."""
         try:
+            from scraper.driver_pool import get_driver_pool
+
             logger.info("Chrome WebDriver 설정을 시작합니다.")
+            logger.info("헤드리스 모드로 실행됩니다." if self.headless else "브라우저 창이 표시됩니다.")
             
-            # Chrome 옵션 설정
-            chrome_options = Options()
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            # 헤드리스 모드 설정
-            if self.headless:
-                chrome_options.add_argument("--headless=new")  # 새로운 헤드리스 모드 사용
-                logger.info("헤드리스 모드로 실행됩니다.")
-            else:
-                logger.info("브라우저 창이 표시됩니다.")
-            
-            # 추가 성능 최적화 옵션
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-images")  # 이미지 로딩 비활성화로 속도 향상
-            # chrome_options.add_argument("--disable-javascript")  # JavaScript 비활성화 (필요시 주석 해제)
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # 연결 안정성을 위한 추가 옵션
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            
-            # ChromeDriver 자동 설치 및 설정
-            service = Service(ChromeDriverManager().install())
-            
-            # WebDriver 생성
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.implicitly_wait(10)
-            
-            # 자동화 감지 방지
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            # WebDriverWait 설정
-            self.wait = WebDriverWait(self.driver, self.timeout)
+            # 미리 띄워 둔 드라이버가 있으면 재사용 (없으면 풀이 새로 띄움)
+            self.driver = get_driver_pool(self.headless).acquire(timeout=self.timeout)
+            # 요소 대기는 browser_wait가 직접 하므로 암시적 대기는 끔 (없는 후보를 확인할 때마다 멈추지 않도록)
+            self.driver.implicitly_wait(0)
             
             logger.info("Chrome WebDriver 설정이 완료되었습니다.")
             return True
@@ -80,8 +55,11 @@ class HiworksScraper:
             logger.error(f"Chrome WebDriver 설정 중 오류 발생: {e}")
             return False
     
+    @traced("login.navigate", "login")
     def navigate_to_login_page(self) -> bool:
         """하이웍스 로그인 페이지로 이동합니다."""
+        from selenium.webdriver.common.by import By
+
         try:
             logger.info(f"하이웍스 로그인 페이지로 이동합니다: {self.login_url}")
             
@@ -92,9 +70,6 @@ class HiworksScraper:
             # 로그인 페이지로 이동
             self.driver.get(self.login_url)
             
-            # 페이지 로딩 대기
-            time.sleep(3)
-            
             # 현재 URL 확인
             current_url = self.driver.current_url
             logger.info(f"현재 페이지 URL: {current_url}")
@@ -103,26 +78,115 @@ class HiworksScraper:
             page_title = self.driver.title
             logger.info(f"페이지 제목: {page_title}")
             
-            # 로그인 폼이 있는지 확인
-            try:
-                # 로그인 폼 요소 확인 (실제 하이웍스 페이지 구조에 맞게 수정 필요)
-                login_form = self.wait.until(
-                    EC.presence_of_element_located((By.TAG_NAME, "form"))
-                )
-                logger.info("로그인 폼을 찾았습니다.")
-                return True
-                
-            except TimeoutException:
+            # 로그인 폼이 그려질 때까지만 대기 (실제 하이웍스 페이지 구조에 맞게 수정 필요)
+            if race_selectors(self.driver, "login_form", [(By.TAG_NAME, "form")], self.timeout) is None:
                 logger.warning("로그인 폼을 찾을 수 없습니다. 페이지 구조를 확인해주세요.")
                 return False
+            logger.info("로그인 폼을 찾았습니다.")
+            return True
                 
         except Exception as e:
             logger.error(f"로그인 페이지 이동 중 오류 발생: {e}")
             return False
     
+    @traced("login", "login")
     def login(self, user_id: str, user_pw: str) -> bool:
         """
-        하이웍스 2단계 로그인: 아이디 입력 후 제출, 그 다음 비밀번호 입력
+        하이웍스 로그인: 저장된 세션이 유효하면 재사용하고, 아니면 HTTP 로그인을 먼저 시도한 뒤
+        실패하면 Selenium 로그인으로 대체합니다.
+        """
+        self.user_id = user_id
+        if self.restore_session(user_id):
+            return True
+        
+        success = False
+        if self.use_http_login:
+            success = self.login_via_http(user_id, user_pw)
+            if not success:
+                logger.warning("HTTP 로그인에 실패하여 Selenium 로그인으로 전환합니다.")
+        if not success:
+            success = self.login_via_browser(user_id, user_pw)
+        
+        if success:
+            self._sync_driver_cookies()
+            self.save_session(user_id)
+        # 쿠키를 HTTP 세션으로 옮긴 뒤에는 브라우저가 필요 없으므로 바로 풀에 돌려줌
+        self.close_driver()
+        return success
+    
+    @traced("login.restore_session", "login")
+    def restore_session(self, user_id: str) -> bool:
+        """저장된 로그인 세션을 불러와 유효한지 확인합니다."""
+        if not self.session_store:
+            return False
+        
+        session_data = self.session_store.load_session(user_id)
+        if not session_data:
+            return False
+        
+        logger.info("저장된 로그인 세션을 확인하는 중...")
+        for cookie in session_data.get('cookies', []):
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+            )
+        
+        engine = HttpLoginEngine(self.session, timeout=self.timeout)
+        engine.company_domain = session_data.get('company_domain')
+        try:
+            valid = engine.verify_session()
+        except requests.exceptions.RequestException as req_error:
+            logger.warning(f"저장된 세션 확인 중 HTTP 오류: {req_error}")
+            valid = False
+        
+        if not valid:
+            logger.info("저장된 세션이 유효하지 않아 다시 로그인합니다.")
+            self.session.cookies.clear()
+            self.session_store.delete_session()
+            return False
+        
+        self.company_domain = engine.company_domain
+        self.is_logged_in = True
+        logger.info(f"저장된 세션으로 로그인했습니다. 회사 도메인: {self.company_domain}")
+        return True
+    
+    def save_session(self, user_id: str) -> bool:
+        """현재 세션 쿠키와 회사 도메인을 저장합니다."""
+        if not self.session_store or not self.company_domain:
+            return False
+        return self.session_store.save_session(user_id, self._export_cookies(), self.company_domain)
+    
+    def _export_cookies(self) -> List[Dict[str, Any]]:
+        """세션 쿠키를 저장 가능한 dict 목록으로 변환합니다."""
+        return [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+            for c in self.session.cookies
+        ]
+    
+    def _sync_driver_cookies(self):
+        """Selenium으로 로그인한 경우 브라우저 쿠키를 HTTP 세션으로 복사합니다."""
+        if not self.driver:
+            return
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+            )
+    
+    @traced("login.http", "login")
+    def login_via_http(self, user_id: str, user_pw: str) -> bool:
+        """브라우저 없이 HTTP 요청만으로 로그인합니다."""
+        engine = HttpLoginEngine(self.session, timeout=self.timeout)
+        if not engine.login(user_id, user_pw):
+            return False
+        self.company_domain = engine.company_domain or self.company_domain
+        self.is_logged_in = True
+        return True
+    
+    @traced("login.browser", "login")
+    def login_via_browser(self, user_id: str, user_pw: str) -> bool:
+        """
+        하이웍스 2단계 로그인 (Selenium): 아이디 입력 후 제출, 그 다음 비밀번호 입력
         """
         try:
             logger.info("2단계 로그인 프로세스를 시작합니다.")
@@ -143,10 +207,8 @@ class HiworksScraper:
                 logger.error("비밀번호 입력 및 로그인 실패")
                 return False
             
-            # 로그인 성공 여부 확인
+            # 로그인 성공 여부 확인 (_input_password_and_login에서 페이지 전환까지 기다림)
             logger.info("로그인 성공 여부를 확인하는 중...")
-            time.sleep(3)  # 페이지 로딩 대기
-            
             current_url = self.driver.current_url
             page_title = self.driver.title
             logger.info(f"로그인 후 URL: {current_url}")
@@ -165,28 +227,35 @@ class HiworksScraper:
             logger.error(f"로그인 자동화 중 오류: {e}")
             return False
     
+    @staticmethod
+    def _password_selectors() -> List[Tuple[str, str]]:
+        """비밀번호 입력 필드 후보 선택자"""
+        from selenium.webdriver.common.by import By
+        return [
+            (By.NAME, "password"),
+            (By.ID, "password"),
+            (By.CSS_SELECTOR, "input[type='password']"),
+            (By.XPATH, "//input[@type='password']"),
+            (By.CSS_SELECTOR, ".password-input"),
+            (By.CSS_SELECTOR, "#userPw"),
+            (By.NAME, "userPw"),
+        ]
+    
+    @traced("login.username", "login")
     def _input_username_and_submit(self, user_id: str) -> bool:
         """아이디 입력 및 제출 (1단계)"""
+        from selenium.webdriver.common.by import By
+
         try:
             logger.info("아이디 입력란을 찾는 중...")
-            id_input = None
             
-            # 여러 방법으로 아이디 입력란 찾기
+            # 여러 방법으로 아이디 입력란 찾기 (모든 후보를 동시에 확인)
             selectors = [
                 (By.CSS_SELECTOR, "[id^='mantine-']"),  # mantine- 패턴
                 (By.CSS_SELECTOR, "input[type='text'], input[type='email']"),  # type
                 (By.XPATH, "//input[@placeholder and (contains(@placeholder, '아이디') or contains(@placeholder, 'ID') or contains(@placeholder, '이메일') or contains(@placeholder, 'email'))]"),  # placeholder
             ]
-            
-            for selector_type, selector_value in selectors:
-                try:
-                    id_input = self.wait.until(
-                        EC.presence_of_element_located((selector_type, selector_value))
-                    )
-                    logger.info(f"아이디 입력란을 {selector_type}: {selector_value}로 찾았습니다.")
-                    break
-                except Exception:
-                    continue
+            id_input = race_selectors(self.driver, "username_input", selectors, self.timeout)
             
             if not id_input:
                 logger.error("모든 방법으로 아이디 입력란을 찾을 수 없습니다.")
@@ -199,7 +268,6 @@ class HiworksScraper:
             
             # 제출 버튼 찾기 및 클릭
             logger.info("아이디 제출 버튼을 찾는 중...")
-            submit_btn = None
             
             # 여러 방법으로 제출 버튼 찾기
             submit_selectors = [
@@ -210,17 +278,9 @@ class HiworksScraper:
                 (By.XPATH, "//button[contains(text(), '진행')]"),
                 (By.CSS_SELECTOR, "button[type='submit']"),
             ]
+            submit_btn = race_selectors(self.driver, "username_submit", submit_selectors, self.timeout, clickable=True)
             
-            for selector_type, selector_value in submit_selectors:
-                try:
-                    submit_btn = self.wait.until(
-                        EC.element_to_be_clickable((selector_type, selector_value))
-                    )
-                    logger.info(f"제출 버튼을 {selector_type}: {selector_value}로 찾았습니다.")
-                    break
-                except Exception:
-                    continue
-            
+            before_url = self.driver.current_url
             if not submit_btn:
                 # 폼 submit 시도
                 try:
@@ -234,9 +294,16 @@ class HiworksScraper:
                 submit_btn.click()
                 logger.info("제출 버튼 클릭 완료")
             
-            # 페이지 전환 대기
+            # 페이지 전환 대기: URL이 바뀌거나 비밀번호 입력란이 보이면 바로 다음 단계로
             logger.info("페이지 전환을 기다리는 중...")
-            time.sleep(2)
+            password_selectors = self._password_selectors()
+            transitioned = wait_until(
+                self.driver,
+                lambda d: d.current_url != before_url or find_first(d, password_selectors, clickable=True),
+                self.timeout,
+            )
+            if not transitioned:
+                logger.warning("아이디 제출 후 페이지가 바뀌지 않았습니다.")
             
             return True
             
@@ -244,60 +311,31 @@ class HiworksScraper:
             logger.error(f"아이디 입력 및 제출 중 오류: {e}")
             return False
     
+    @traced("login.password", "login")
     def _input_password_and_login(self, user_pw: str) -> bool:
         """비밀번호를 입력하고 로그인합니다."""
+        from selenium.webdriver.common.by import By
+
         try:
-            logger.info("비밀번호 입력 페이지에서 회사 도메인을 추출합니다.")
-            
-            # 현재 URL에서 회사 도메인 추출
-            current_url = self.driver.current_url
-            logger.info(f"현재 URL: {current_url}")
-            
-            # URL 패턴: https://login.office.hiworks.com/company.com/
-            if "login.office.hiworks.com" in current_url:
-                # URL에서 회사 도메인 부분 추출
-                url_parts = current_url.split("login.office.hiworks.com/")
-                if len(url_parts) > 1:
-                    company_part = url_parts[1].split("/")[0]  # 첫 번째 슬래시까지
-                    if company_part and "." in company_part:  # 유효한 도메인인지 확인
-                        self.company_domain = company_part
-                        logger.info(f"회사 도메인 추출 완료: {self.company_domain}")
-                    else:
-                        logger.warning(f"유효하지 않은 회사 도메인: {company_part}")
-                else:
-                    logger.warning("URL에서 회사 도메인을 추출할 수 없습니다.")
-            else:
-                logger.warning("예상한 로그인 URL 패턴이 아닙니다.")
-            
-            # 기존 비밀번호 입력 로직
+            # 비밀번호 입력 필드 찾기 (모든 후보를 동시에 확인)
             logger.info("비밀번호 입력을 시작합니다.")
-            
-            # 비밀번호 입력 필드 찾기
-            password_selectors = [
-                (By.NAME, "password"),
-                (By.ID, "password"),
-                (By.CSS_SELECTOR, "input[type='password']"),
-                (By.XPATH, "//input[@type='password']"),
-                (By.CSS_SELECTOR, ".password-input"),
-                (By.CSS_SELECTOR, "#userPw"),
-                (By.NAME, "userPw"),
-            ]
-            
-            password_field = None
-            for selector_type, selector_value in password_selectors:
-                try:
-                    password_field = self.wait.until(
-                        EC.presence_of_element_located((selector_type, selector_value))
-                    )
-                    logger.info(f"비밀번호 필드를 찾았습니다: {selector_type, selector_value}")
-                    break
-                except TimeoutException:
-                    continue
+            password_field = race_selectors(self.driver, "password_input", self._password_selectors(), self.timeout)
             
             if not password_field:
                 logger.error("비밀번호 입력 필드를 찾을 수 없습니다.")
                 return False
             
+            # 비밀번호 입력 페이지의 URL에서 회사 도메인 추출
+            # URL 패턴: https://login.office.hiworks.com/company.com/
+            current_url = self.driver.current_url
+            logger.info(f"현재 URL: {current_url}")
+            company_domain = extract_company_domain(current_url)
+            if company_domain:
+                self.company_domain = company_domain
+                logger.info(f"회사 도메인 추출 완료: {self.company_domain}")
+            else:
+                logger.warning("URL에서 회사 도메인을 추출할 수 없습니다.")
+            
             # 기존 내용 지우기
             password_field.clear()
             
@@ -315,17 +353,7 @@ class HiworksScraper:
                 (By.CSS_SELECTOR, "#loginBtn"),
                 (By.CSS_SELECTOR, ".btn-login"),
             ]
-            
-            login_button = None
-            for selector_type, selector_value in login_button_selectors:
-                try:
-                    login_button = self.wait.until(
-                        EC.element_to_be_clickable((selector_type, selector_value))
-                    )
-                    logger.info(f"로그인 버튼을 찾았습니다: {selector_value}")
-                    break
-                except TimeoutException:
-                    continue
+            login_button = race_selectors(self.driver, "login_button", login_button_selectors, self.timeout, clickable=True)
             
             if not login_button:
                 logger.error("로그인 버튼을 찾을 수 없습니다.")
@@ -335,8 +363,19 @@ class HiworksScraper:
             login_button.click()
             logger.info("로그인 버튼을 클릭했습니다.")
             
-            # 로그인 성공 확인
-            time.sleep(3)  # 페이지 로딩 대기
+            # 로그인 페이지를 벗어나거나(성공) 오류 메시지가 보일 때(실패)까지 대기
+            error_selectors = [
+                (By.CSS_SELECTOR, "[role='alert']"),
+                (By.CSS_SELECTOR, ".mantine-InputWrapper-error"),
+            ]
+            outcome = wait_until(
+                self.driver,
+                lambda d: "left" if "login" not in d.current_url.lower()
+                else ("error" if find_first(d, error_selectors, clickable=True) else None),
+                self.timeout,
+            )
+            if outcome == "error":
+                logger.error("로그인 페이지에 오류 메시지가 표시되었습니다.")
             
             # 로그인 성공 여부 확인
             current_url = self.driver.current_url
@@ -367,95 +406,166 @@ class HiworksScraper:
     
 
     
-    def close_driver(self):
-        """WebDriver를 종료합니다."""
+    def close_driver(self, broken: bool = False):
+        """WebDriver를 풀에 반납합니다. broken이면 재사용하지 않고 종료합니다."""
         if self.driver:
             try:
-                self.driver.quit()
-                logger.info("WebDriver가 종료되었습니다.")
+                from scraper.driver_pool import get_driver_pool
+                get_driver_pool(self.headless).release(self.driver, broken=broken)
+                logger.info("WebDriver를 반납했습니다.")
             except Exception as e:
-                logger.error(f"WebDriver 종료 중 오류: {e}")
+                logger.error(f"WebDriver 반납 중 오류: {e}")
             finally:
                 self.driver = None
-                self.wait = None
+    
+    def close(self):
+        """WebDriver와 HTTP 연결 풀을 모두 종료합니다."""
+        self.close_driver()
+        self.session.close()
     
     
     def fetch_schedule_json(self, start_date: str, end_date: str) -> dict:
-        """Selenium 세션 쿠키로 하이웍스 일정 JSON을 직접 받아온다."""
+        """로그인 세션 쿠키로 하이웍스 일정 JSON을 직접 받아온다."""
         # 회사 도메인 확인 및 설정
         if not self.company_domain:
-            logger.warning("회사 도메인이 설정되지 않았습니다. 기본값 'kevinlab.com'을 사용합니다.")
-            self.company_domain = "kevinlab.com"
+            logger.error("회사 도메인이 설정되지 않아 일정을 요청할 수 없습니다.")
+            return dict(UNKNOWN_DOMAIN_ERROR)
         
-        url = f"https://calendar.office.hiworks.com/{self.company_domain}/schedule/json/get_schedule_new"
-        payload = {
-            "accesstype": "S",
-            "syncflag": "N",
-            "hid": "",
-            "birthday_show_flag": "N",
-            "id": "calendar",
-            "start": start_date,
-            "end": end_date
-        }
-        headers = {
-            "User-Agent": "Mozilla/5.0",
-            "Referer": f"https://calendar.office.hiworks.com/{self.company_domain}/schedule/schedulemain"
-        }
+        url, payload, headers = build_schedule_request(self.company_domain, start_date, end_date)
         
         try:
-            session = requests.Session()
-            # Selenium 쿠키를 requests로 복사
-            for cookie in self.driver.get_cookies():
-                session.cookies.set(cookie['name'], cookie['value'])
-            
-            logger.info(f"일정 JSON 요청: {url}")
-            logger.info(f"회사 도메인: {self.company_domain}")
-            logger.info(f"요청 데이터: {payload}")
-            
-            resp = session.post(url, data=payload, headers=headers)
-            resp.raise_for_status()
-            
-            # 응답 내용 확인
-            response_text = resp.text.strip()
-            logger.info(f"응답 상태 코드: {resp.status_code}")
-            logger.info(f"응답 내용 길이: {len(response_text)}")
-            logger.info(f"응답 내용 (처음 200자): {response_text[:200]}")
-            
-            # 빈 응답 체크
-            if not response_text:
-                logger.warning("빈 응답을 받았습니다.")
-                return {"error": "빈 응답", "data": []}
-            
-            # 세션 만료 체크 (HTML 응답인지 확인)
-            if response_text.startswith('<!DOCTYPE html') or '다시 로그인' in response_text:
-                logger.warning("세션이 만료되었습니다. 다시 로그인을 시도합니다.")
-                return {"error": "세션 만료", "need_relogin": True}
-            
-            # JSON 파싱 시도
-            try:
-                json_data = resp.json()
-                logger.info(f"JSON 파싱 성공: {type(json_data)}")
-                return json_data
-            except ValueError as json_error:
-                logger.error(f"JSON 파싱 실패: {json_error}")
-                logger.error(f"응답 내용: {response_text}")
-                return {"error": f"JSON 파싱 실패: {json_error}", "raw_response": response_text}
+            # 쿠키는 로그인 직후 한 번만 세션으로 동기화됨
+            session = self.session
+            
+            logger.info("일정 JSON 요청: %s (%s ~ %s)", url, start_date, end_date)
+            logger.debug("요청 데이터: %s", payload)
+            
+            # 본문을 문자열로 모으지 않고 받는 대로 해석 (앞부분으로 로그인 HTML 여부를 먼저 판단)
+            with tracer.span("http.schedule", "fetch", start=start_date, end=end_date) as span, \
+                    session.post(url, data=payload, headers=headers, stream=True) as resp:
+                resp.raise_for_status()
+                logger.debug("응답 상태 코드: %s", resp.status_code)
+                result = read_schedule_response(resp.iter_content(STREAM_CHUNK_SIZE), resp.encoding, span)
+            if isinstance(result, dict) and "error" in result:
+                logger.log_web_action("get_schedule_new", url, "failed", result["error"])
+            else:
+                logger.log_web_action("get_schedule_new", url)
+            if isinstance(result, dict) and result.get("need_relogin") and self.session_store:
+                self.session_store.delete_session()
+            return result
                 
         except requests.exceptions.RequestException as req_error:
-            logger.error(f"HTTP 요청 오류: {req_error}")
+            logger.log_web_action("get_schedule_new", url, "failed", f"HTTP 요청 오류: {req_error}")
             return {"error": f"HTTP 요청 오류: {req_error}"}
         except Exception as e:
             logger.error(f"일정 JSON 요청 중 예상치 못한 오류: {e}")
             return {"error": f"예상치 못한 오류: {e}"}
     
+    def iter_schedule_chunks(self, start_date: str, end_date: str, unit: Optional[str] = None,
+                             max_workers: Optional[int] = None) -> Iterator[Tuple[Tuple[str, str], Any]]:
+        """
+        조회 기간을 월/주 단위로 나누어 병렬로 요청하고, 완료되는 순서대로 ((시작일, 종료일), 응답)을 반환합니다.
+        """
+        unit = unit or settings.get("hiworks.chunk_unit", "month")
+        windows = plan_date_ranges(start_date, end_date, unit)
+        logger.info("일정 구간 분할: %d개 구간 (%s)", len(windows), unit)
+        return self.iter_schedule_windows(windows, max_workers)
+    
+    def iter_schedule_windows(self, windows: List[Tuple[str, str]],
+                              max_workers: Optional[int] = None) -> Iterator[Tuple[Tuple[str, str], Any]]:
+        """주어진 구간들을 병렬로 요청하고 완료되는 순서대로 ((시작일, 종료일), 응답)을 반환합니다."""
+        if not windows:
+            return
+        max_workers = max_workers or settings.get("hiworks.max_workers", 4)
+        logger.info("일정 구간 %d개 요청, 동시 요청 %d개", len(windows), max_workers)
+        
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(windows)))
+        try:
+            futures = {
+                executor.submit(self.fetch_schedule_json, window_start, window_end): (window_start, window_end)
+                for window_start, window_end in windows
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # 중간에 중단되면 아직 시작하지 않은 요청은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def fetch_schedule_range(self, start_date: str, end_date: str, unit: Optional[str] = None,
+                             max_workers: Optional[int] = None, cache=None,
+                             on_chunk: Optional[Callable[[Tuple[str, str], Any, int, int], Any]] = None) -> Any:
+        """
+        긴 기간의 일정을 구간별로 병렬 요청한 뒤 ID 기준으로 중복을 제거하여 합칩니다.
+        한 구간이라도 실패하면 해당 오류 응답을 그대로 반환합니다.
+        cache(schedule.cache.ScheduleCache)를 지정하면 캐시에 없거나 오래된 구간만 요청합니다.
+        on_chunk(구간, 응답, 완료 구간 수, 전체 구간 수)는 구간 응답을 받을 때마다 호출되며,
+        False를 반환하면 남은 요청을 취소합니다.
+        """
+        unit = unit or settings.get("hiworks.chunk_unit", "month")
+        with tracer.span("fetch.range", "fetch", start=start_date, end=end_date, unit=unit, cached=cache is not None) as span:
+            if cache is not None:
+                result = self._fetch_schedule_range_cached(start_date, end_date, unit, max_workers, cache, on_chunk)
+            else:
+                result = self._fetch_schedule_range(start_date, end_date, unit, max_workers, on_chunk)
+            if not (isinstance(result, dict) and "error" in result):
+                span.set(rows=len(extract_schedules(result)))
+            return result
+    
+    def _fetch_schedule_range(self, start_date: str, end_date: str, unit: str, max_workers: Optional[int],
+                              on_chunk: Optional[Callable[[Tuple[str, str], Any, int, int], Any]]) -> Any:
+        """캐시 없이 모든 구간을 요청합니다."""
+        windows = plan_date_ranges(start_date, end_date, unit)
+        chunks = []
+        for done, (window, result) in enumerate(self.iter_schedule_windows(windows, max_workers), 1):
+            if isinstance(result, dict) and "error" in result:
+                logger.error(f"구간 요청 실패 ({window[0]} ~ {window[1]}): {result.get('error')}")
+                return result
+            chunks.append(result)
+            if on_chunk and on_chunk(window, result, done, len(windows)) is False:
+                logger.info("일정 요청이 취소되었습니다.")
+                return dict(CANCELLED_RESULT)
+        
+        # 한 구간이면 원본 응답을 그대로 반환
+        if len(chunks) == 1:
+            return chunks[0]
+        
+        merged = merge_schedules(chunks)
+        logger.info("구간별 일정 병합 완료: %d개", len(merged))
+        return merged
+    
+    def _fetch_schedule_range_cached(self, start_date: str, end_date: str, unit: str,
+                                     max_workers: Optional[int], cache, on_chunk=None) -> Any:
+        """달력 단위 구간으로 캐시를 조회하고 빠진 구간만 받아와 채웁니다."""
+        if not self.company_domain or not self.user_id:
+            logger.error("회사 도메인 또는 로그인 아이디를 알 수 없어 일정 캐시를 사용할 수 없습니다.")
+            return dict(UNKNOWN_DOMAIN_ERROR)
+        
+        windows = plan_date_ranges(start_date, end_date, unit, align=True)
+        stale_windows = cache.get_stale_windows(self.user_id, self.company_domain, windows)
+        logger.info("일정 캐시 조회: 전체 %d개 구간 중 %d개 구간 요청 필요", len(windows), len(stale_windows))
+        
+        for done, (window, result) in enumerate(self.iter_schedule_windows(stale_windows, max_workers), 1):
+            if isinstance(result, dict) and "error" in result:
+                logger.error(f"구간 요청 실패 ({window[0]} ~ {window[1]}): {result.get('error')}")
+                return result
+            cache.store_window(self.user_id, self.company_domain, window, extract_schedules(result))
+            if on_chunk and on_chunk(window, result, done, len(stale_windows)) is False:
+                logger.info("일정 요청이 취소되었습니다.")
+                return dict(CANCELLED_RESULT)
+        
+        merged = merge_schedules([cache.load_windows(self.user_id, self.company_domain, windows)])
+        return filter_schedules_by_range(merged, start_date, end_date)
+    
     def fetch_schedule_after_login(self, user_id: str, user_pw: str, start_date: str, end_date: str) -> dict:
         """로그인 후 곧바로 POST로 일정 JSON만 받아오기 (스케줄 페이지 이동 없이)."""
         if not self.login(user_id, user_pw):
             return {"error": "로그인 실패"}
         try:
-            logger.info(f"로그인 후 POST로 일정 JSON 요청: {start_date} ~ {end_date}")
+            logger.info("로그인 후 POST로 일정 JSON 요청: %s ~ %s", start_date, end_date)
             json_data = self.fetch_schedule_json(start_date, end_date)
-            logger.info(f"일정 JSON 응답: {str(json_data)[:200]} ...")
+            # 응답 전체를 문자열로 만드는 비용이 크므로 DEBUG일 때만
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug("일정 JSON 응답: %s ...", str(json_data)[:200])
             return json_data
         except Exception as e:
             logger.error(f"일정 JSON 요청 중 오류: {e}")
@@ -467,4 +577,4 @@ class HiworksScraper:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료"""
-        self.close_driver() 
\ No newline at end of file
+        self.close() 
\ No newline at end of file
@@ -0,0 +1,63 @@
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config.settings import settings
+from config.constants import DEFAULT_USER_AGENT, DEFAULT_TIMEOUT, MAX_RETRY_COUNT
+from utils.logger import logger
+
+
+class PooledSession(requests.Session):
+    """기본 타임아웃이 적용되는 keep-alive 연결 풀 세션"""
+
+    def __init__(self, timeout=None):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        # 요청마다 타임아웃을 지정하지 않으면 설정값을 사용
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().request(method, url, **kwargs)
+
+
+def create_http_session(pool_connections: Optional[int] = None,
+                        pool_maxsize: Optional[int] = None) -> PooledSession:
+    """
+    하이웍스 요청용 HTTP 세션을 생성합니다.
+
+    연결 풀은 세션이 살아있는 동안 재사용되므로 요청마다 TCP/TLS 연결을 새로 맺지 않습니다.
+    """
+    pool_connections = pool_connections or settings.get("hiworks.pool_connections", 4)
+    pool_maxsize = pool_maxsize or settings.get("hiworks.pool_maxsize", 8)
+    read_timeout = settings.get("hiworks.timeout", DEFAULT_TIMEOUT)
+    connect_timeout = settings.get("hiworks.connect_timeout", 10)
+    retry_count = settings.get("hiworks.retry_count", MAX_RETRY_COUNT)
+
+    # 연결 오류와 일시적인 서버 오류만 재시도 (POST는 재시도하지 않음)
+    retry = Retry(
+        total=retry_count,
+        connect=retry_count,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,  # 연결 풀을 유지할 호스트 수
+        pool_maxsize=pool_maxsize,  # 호스트당 최대 연결 수
+        max_retries=retry,
+    )
+
+    session = PooledSession(timeout=(connect_timeout, read_timeout))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+
+    logger.info(f"HTTP 연결 풀 생성: 호스트 {pool_connections}개, 호스트당 {pool_maxsize}개 연결, "
+                f"타임아웃 {connect_timeout}/{read_timeout}초")
+    return session
@@ -0,0 +1,201 @@
+import re
+from typing import Optional, Dict, Any
+import requests
+from config.settings import settings
+from config.constants import HIWORKS_LOGIN_URL, HIWORKS_AUTH_API_URL, HIWORKS_CALENDAR_URL
+from utils.logger import logger
+
+
+# 로그인 URL 패턴: https://login.office.hiworks.com/company.com/
+COMPANY_DOMAIN_PATTERN = re.compile(r"login\.office\.hiworks\.com/([^/?#]+)")
+
+# 응답 JSON에서 회사 도메인/리다이렉트 주소를 찾을 때 사용하는 키 (앞의 키일수록 우선)
+COMPANY_DOMAIN_KEYS = ("company_domain", "office_domain")
+REDIRECT_KEYS = ("redirect_url", "redirect_uri", "location", "url")
+GENERIC_DOMAIN_KEY = "domain"  # 쿠키/CDN 정보에도 쓰이는 이름이라 다른 키가 없을 때만 사용
+
+# 회사 도메인을 찾는 위치: 응답 최상위와 그 안의 data 객체 (더 깊은 곳은 보지 않음)
+RESPONSE_DATA_KEY = "data"
+
+
+def extract_company_domain(url: str) -> Optional[str]:
+    """로그인 URL에서 회사 도메인을 추출합니다. 유효하지 않으면 None을 반환합니다."""
+    if not url:
+        return None
+    match = COMPANY_DOMAIN_PATTERN.search(url)
+    if not match:
+        return None
+    company_part = match.group(1)
+    if "." not in company_part:  # 유효한 도메인인지 확인
+        return None
+    return company_part
+
+
+def find_company_domain(data: Any) -> Optional[str]:
+    """
+    로그인 API 응답(JSON)에서 회사 도메인을 찾습니다.
+    응답 최상위와 data 객체만 확인하며, company_domain/office_domain → 리다이렉트 주소 → domain 순으로 사용합니다.
+    """
+    if not isinstance(data, dict):
+        return None
+    scopes = [data]
+    if isinstance(data.get(RESPONSE_DATA_KEY), dict):
+        scopes.append(data[RESPONSE_DATA_KEY])
+
+    for key in COMPANY_DOMAIN_KEYS:
+        for scope in scopes:
+            domain = _domain_value(scope.get(key))
+            if domain:
+                return domain
+    for key in REDIRECT_KEYS:
+        for scope in scopes:
+            domain = extract_company_domain(scope.get(key) or "")
+            if domain:
+                return domain
+    for scope in scopes:
+        domain = _domain_value(scope.get(GENERIC_DOMAIN_KEY))
+        if domain:
+            return domain
+    return None
+
+
+def _domain_value(value: Any) -> Optional[str]:
+    if isinstance(value, str) and "." in value:
+        return value.strip("/")
+    return None
+
+
+def build_identify_payload(user_id: str) -> Dict[str, Any]:
+    """1단계(아이디 확인) 요청 데이터를 생성합니다."""
+    return {"id": user_id}
+
+
+def build_login_payload(user_id: str, user_pw: str) -> Dict[str, Any]:
+    """2단계(비밀번호 확인) 요청 데이터를 생성합니다."""
+    return {"id": user_id, "password": user_pw, "ip_security_level": "1"}
+
+
+def get_login_endpoints() -> Dict[str, str]:
+    """설정에서 로그인 페이지와 로그인 API 주소를 읽어옵니다."""
+    auth_api_url = settings.get("hiworks.auth_api_url", HIWORKS_AUTH_API_URL).rstrip("/")
+    return {
+        "login_page": settings.get("hiworks.login_url", HIWORKS_LOGIN_URL),
+        "identify": auth_api_url + settings.get("hiworks.identify_path", "/office-web/identify"),
+        "login": auth_api_url + settings.get("hiworks.login_path", "/office-web/login"),
+    }
+
+
+def get_calendar_url() -> str:
+    """설정에서 일정(캘린더) 서버 주소를 읽어옵니다."""
+    return settings.get("hiworks.calendar_url", HIWORKS_CALENDAR_URL).rstrip("/")
+
+
+def get_session_check_url(company_domain: str) -> str:
+    """로그인 여부 확인에 사용하는 일정 페이지 주소를 반환합니다."""
+    return f"{get_calendar_url()}/{company_domain}/schedule/schedulemain"
+
+
+def is_login_page(url: str) -> bool:
+    """URL이 로그인 페이지인지 확인합니다."""
+    return "login" in (url or "").lower()
+
+
+class HttpLoginEngine:
+    """브라우저 없이 HTTP 요청만으로 하이웍스 2단계 로그인을 수행하는 클래스"""
+
+    def __init__(self, session: requests.Session, timeout: Optional[int] = None):
+        self.session = session
+        self.timeout = timeout or settings.get("hiworks.timeout", 30)
+        self.endpoints = get_login_endpoints()
+        self.login_url = self.endpoints["login_page"]
+        self.company_domain: Optional[str] = None
+
+    def login(self, user_id: str, user_pw: str) -> bool:
+        """
+        하이웍스 2단계 로그인: 아이디 확인(회사 도메인 확인) 후 비밀번호 로그인
+        """
+        try:
+            logger.info("HTTP 2단계 로그인 프로세스를 시작합니다.")
+
+            # 로그인 페이지의 초기 쿠키 수집
+            self.session.get(self.login_url, timeout=self.timeout)
+
+            logger.info("1단계: 아이디 확인 및 회사 도메인 확인")
+            if not self._identify(user_id):
+                logger.error("아이디 확인 실패")
+                return False
+
+            logger.info("2단계: 비밀번호 로그인")
+            if not self._authenticate(user_id, user_pw):
+                logger.error("비밀번호 로그인 실패")
+                return False
+
+            return self.verify_session()
+
+        except requests.exceptions.RequestException as req_error:
+            logger.error(f"HTTP 로그인 요청 오류: {req_error}")
+            return False
+        except Exception as e:
+            logger.error(f"HTTP 로그인 중 오류: {e}")
+            return False
+
+    def _identify(self, user_id: str) -> bool:
+        """아이디를 제출하고 응답에서 회사 도메인을 찾습니다. (1단계)"""
+        resp = self.session.post(
+            self.endpoints["identify"],
+            json=build_identify_payload(user_id),
+            headers={"Referer": self.login_url},
+            timeout=self.timeout,
+        )
+        logger.debug("아이디 확인 응답 상태 코드: %s", resp.status_code)
+        if resp.status_code >= 400:
+            return False
+
+        data = self._json_or_none(resp)
+        domain = find_company_domain(data) or extract_company_domain(resp.url)
+        if not domain:
+            # 이메일 아이디의 @ 뒤는 회사 도메인과 다를 수 있으므로 추측하지 않고 Selenium 로그인에 맡김
+            logger.warning("응답에서 회사 도메인을 찾을 수 없습니다.")
+            return False
+
+        self.company_domain = domain
+        logger.info(f"회사 도메인 추출 완료: {self.company_domain}")
+        return True
+
+    def _authenticate(self, user_id: str, user_pw: str) -> bool:
+        """비밀번호를 제출하여 세션 쿠키를 발급받습니다. (2단계)"""
+        resp = self.session.post(
+            self.endpoints["login"],
+            json=build_login_payload(user_id, user_pw),
+            headers={"Referer": f"{self.login_url.rstrip('/')}/{self.company_domain}/"},
+            timeout=self.timeout,
+        )
+        logger.debug("로그인 응답 상태 코드: %s", resp.status_code)
+        if resp.status_code >= 400:
+            return False
+
+        # 로그인 응답에 다른 회사 도메인이 있으면 그 값을 우선 사용
+        domain = find_company_domain(self._json_or_none(resp))
+        if domain:
+            self.company_domain = domain
+        return True
+
+    def verify_session(self) -> bool:
+        """일정 페이지에 접근해 로그인 페이지로 리다이렉트되지 않는지 확인합니다."""
+        if not self.company_domain:
+            return False
+        resp = self.session.get(get_session_check_url(self.company_domain), timeout=self.timeout, allow_redirects=True)
+        logger.debug("세션 확인 URL: %s (상태 코드: %s)", resp.url, resp.status_code)
+        if resp.status_code >= 400 or is_login_page(resp.url):
+            logger.warning("세션 확인 실패: 로그인 페이지로 이동되었습니다.")
+            return False
+        logger.info("HTTP 로그인이 성공했습니다!")
+        return True
+
+    @staticmethod
+    def _json_or_none(resp: requests.Response) -> Any:
+        """응답을 JSON으로 파싱하고 실패하면 None을 반환합니다."""
+        try:
+            return resp.json()
+        except ValueError:
+            return None
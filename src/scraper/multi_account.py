@@ -0,0 +1,100 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+from config.settings import settings
+from utils.logger import logger
+from scraper.hiworks_scraper import HiworksScraper
+from schedule.parser import extract_schedules
+
+
+# 일정에 붙이는 계정 태그 키
+ACCOUNT_KEY = "account"
+COMPANY_DOMAIN_KEY = "company_domain"
+
+
+class MultiAccountCollector:
+    """
+    등록된 여러 계정을 각자의 HTTP 세션으로 로그인시키고 같은 기간의 일정을 병렬로 모으는 수집기.
+
+    계정마다 HiworksScraper와 계정별 SessionStore를 따로 사용하므로 세션이 섞이지 않으며,
+    전체 시간은 계정 수의 합이 아니라 가장 느린 계정에 가까워집니다.
+    """
+
+    def __init__(self, accounts: List[Dict[str, Any]], credential_manager=None,
+                 max_accounts: Optional[int] = None, max_workers: Optional[int] = None):
+        self.accounts = accounts
+        self.credential_manager = credential_manager
+        self.max_accounts = max_accounts or settings.get("hiworks.max_accounts", 4)  # 동시에 처리할 계정 수
+        self.max_workers = max_workers  # 계정 하나의 구간별 동시 요청 수 (None이면 hiworks.max_workers)
+
+    def _session_store(self, account: Dict[str, Any]):
+        if self.credential_manager is None:
+            return None
+        from utils.session_store import SessionStore
+        return SessionStore(self.credential_manager, account_name=account['name'])
+
+    def collect_account(self, account: Dict[str, Any], start_date: str, end_date: str,
+                        unit: Optional[str] = None, cache=None) -> Dict[str, Any]:
+        """
+        계정 하나로 로그인하여 일정을 받아옵니다.
+        반환값: {"account", "company_domain", "data", "elapsed"} 또는 실패 시 {"account", "error"}
+        """
+        name = account['name']
+        started = time.perf_counter()
+        scraper = HiworksScraper(headless=True, session_store=self._session_store(account),
+                                 company_domain=account.get('company_domain'))
+        try:
+            if not scraper.login(account['username'], account['password']):
+                return {"account": name, "error": "로그인 실패"}
+            result = scraper.fetch_schedule_range(start_date, end_date, unit=unit,
+                                                  max_workers=self.max_workers, cache=cache)
+            if isinstance(result, dict) and "error" in result:
+                return {"account": name, "error": result.get("error")}
+            elapsed = time.perf_counter() - started
+            schedules = extract_schedules(result)
+            logger.info(f"[{name}] 일정 {len(schedules)}개 수집 완료 ({elapsed:.2f}초)")
+            return {"account": name, "company_domain": scraper.company_domain, "data": schedules, "elapsed": elapsed}
+        except Exception as e:
+            logger.error(f"[{name}] 일정 수집 중 오류: {e}")
+            return {"account": name, "error": str(e)}
+        finally:
+            scraper.close()
+
+    def collect(self, start_date: str, end_date: str, unit: Optional[str] = None, cache=None) -> Dict[str, Any]:
+        """
+        모든 계정의 일정을 병렬로 모아 하나의 목록으로 합칩니다.
+        각 일정에는 "account"(계정 이름)와 "company_domain" 태그가 붙으며, 계정별 결과는 "accounts"에 담깁니다.
+        반환값: {"data": [...], "accounts": {이름: {"count", "company_domain", "elapsed"} 또는 {"error"}}}
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_accounts, len(self.accounts) or 1))) as executor:
+            futures = [
+                executor.submit(self.collect_account, account, start_date, end_date, unit, cache)
+                for account in self.accounts
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result['account']] = result
+
+        # 등록 순서대로 합치며, 회사가 다르면 ID가 겹칠 수 있으므로 중복 제거는 하지 않음
+        merged = []
+        summary = {}
+        for account in self.accounts:
+            result = results[account['name']]
+            if "error" in result:
+                logger.error(f"[{account['name']}] 일정 수집 실패: {result['error']}")
+                summary[account['name']] = {"error": result['error']}
+                continue
+            for schedule in result['data']:
+                tagged = dict(schedule)
+                tagged[ACCOUNT_KEY] = account['name']
+                tagged[COMPANY_DOMAIN_KEY] = result['company_domain']
+                merged.append(tagged)
+            summary[account['name']] = {
+                "count": len(result['data']),
+                "company_domain": result['company_domain'],
+                "elapsed": round(result['elapsed'], 3),
+            }
+        logger.info(f"{len(self.accounts)}개 계정 일정 수집 완료: {len(merged)}개 ({time.perf_counter() - started:.2f}초)")
+        return {"data": merged, "accounts": summary}
@@ -0,0 +1,57 @@
+import datetime
+from typing import List, Tuple
+from config.constants import DEFAULT_DATE_FORMAT
+
+
+# 지원하는 구간 단위
+RANGE_UNITS = ("month", "week")
+
+
+def _parse_date(value) -> datetime.date:
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(value, DEFAULT_DATE_FORMAT).date()
+
+
+def _unit_start(day: datetime.date, unit: str) -> datetime.date:
+    """day가 속한 구간(월/주)의 첫날을 반환합니다."""
+    if unit == "week":
+        return day - datetime.timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def _next_unit_start(day: datetime.date, unit: str) -> datetime.date:
+    """day가 속한 구간의 다음 구간 첫날을 반환합니다."""
+    if unit == "week":
+        return _unit_start(day, unit) + datetime.timedelta(days=7)
+    if day.month == 12:
+        return datetime.date(day.year + 1, 1, 1)
+    return datetime.date(day.year, day.month + 1, 1)
+
+
+def plan_date_ranges(start_date, end_date, unit: str = "month",
+                     align: bool = False) -> List[Tuple[str, str]]:
+    """
+    조회 기간을 월/주 단위 구간으로 나눕니다.
+
+    align=False면 첫/마지막 구간을 조회 기간에 맞춰 자르고,
+    align=True면 달력 단위(월 1일~말일, 월~일요일) 전체 구간을 반환합니다.
+    """
+    if unit not in RANGE_UNITS:
+        raise ValueError(f"지원하지 않는 구간 단위: {unit}")
+
+    start = _parse_date(start_date)
+    end = _parse_date(end_date)
+    if start > end:
+        raise ValueError(f"시작일이 종료일보다 늦습니다: {start} ~ {end}")
+
+    windows = []
+    current = _unit_start(start, unit) if align else start
+    while current <= end:
+        next_start = _next_unit_start(current, unit)
+        window_end = next_start - datetime.timedelta(days=1)
+        if not align:
+            window_end = min(window_end, end)
+        windows.append((current.strftime(DEFAULT_DATE_FORMAT), window_end.strftime(DEFAULT_DATE_FORMAT)))
+        current = next_start
+    return windows
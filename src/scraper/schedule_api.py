@@ -0,0 +1,318 @@
+import codecs
+import json
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from scraper.http_login import get_calendar_url
+from schedule.parser import SCHEDULE_LIST_KEYS
+from utils.logger import logger
+
+
+# 회사 도메인을 알 수 없을 때의 오류 (다른 회사의 일정을 요청하지 않도록 추측하지 않음)
+UNKNOWN_DOMAIN_ERROR = {"error": "회사 도메인을 알 수 없습니다. 다시 로그인하세요.", "need_relogin": True}
+
+# 응답 본문을 읽는 단위 (바이트)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 처리한 앞부분을 버퍼에서 잘라내는 기준 (문자 수)
+_TRIM_THRESHOLD = 64 * 1024
+
+_WHITESPACE_CHARS = " \t\n\r"
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+_VALUE_TERMINATORS = " \t\n\r,:]}"
+
+
+def build_schedule_request(company_domain: str, start_date: str, end_date: str) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+    """get_schedule_new 요청의 (URL, 요청 데이터, 헤더)를 생성합니다."""
+    calendar_url = get_calendar_url()
+    url = f"{calendar_url}/{company_domain}/schedule/json/get_schedule_new"
+    payload = {
+        "accesstype": "S",
+        "syncflag": "N",
+        "hid": "",
+        "birthday_show_flag": "N",
+        "id": "calendar",
+        "start": start_date,
+        "end": end_date
+    }
+    headers = {
+        "Referer": f"{calendar_url}/{company_domain}/schedule/schedulemain"
+    }
+    return url, payload, headers
+
+
+def is_session_expired(response_text: str) -> bool:
+    """응답이 JSON 대신 로그인 HTML 페이지인지 확인합니다."""
+    return response_text.startswith('<!DOCTYPE html') or '다시 로그인' in response_text
+
+
+def parse_schedule_response(response_text: str) -> Any:
+    """
+    get_schedule_new 응답 본문을 해석합니다.
+    빈 응답, 세션 만료, JSON 파싱 실패 시 "error" 키가 있는 dict를 반환합니다.
+    """
+    response_text = response_text.strip()
+    logger.info("응답 내용 길이: %d", len(response_text))
+    logger.debug("응답 내용 (처음 200자): %s", response_text[:200])
+
+    # 빈 응답 체크
+    if not response_text:
+        logger.warning("빈 응답을 받았습니다.")
+        return {"error": "빈 응답", "data": []}
+
+    # 세션 만료 체크 (HTML 응답인지 확인)
+    if is_session_expired(response_text):
+        logger.warning("세션이 만료되었습니다. 다시 로그인을 시도합니다.")
+        return {"error": "세션 만료", "need_relogin": True}
+
+    # JSON 파싱 시도
+    try:
+        json_data = json.loads(response_text)
+        logger.debug("JSON 파싱 성공: %s", type(json_data))
+        return json_data
+    except ValueError as json_error:
+        logger.error(f"JSON 파싱 실패: {json_error}")
+        logger.error(f"응답 내용: {response_text}")
+        return {"error": f"JSON 파싱 실패: {json_error}", "raw_response": response_text}
+
+
+class _NeedMoreData(Exception):
+    """버퍼에 값이 아직 다 들어오지 않음"""
+
+
+class ScheduleStreamParser:
+    """
+    get_schedule_new 응답 본문을 받는 대로 해석하는 증분 파서.
+
+    feed()에 본문 조각을 넣으면 그때까지 완성된 일정 항목을 반환하므로 본문 전체 문자열을 만들지 않습니다.
+    최상위가 배열이면 그 원소를, 객체이면 SCHEDULE_LIST_KEYS 중 처음 나오는 배열의 원소를 일정 항목으로 보고,
+    나머지 최상위 키는 meta에 모읍니다. 첫 글자가 '['/'{'가 아니면(로그인 HTML, 빈 응답 등)
+    본문을 끝까지 모아 parse_schedule_response로 해석합니다.
+    """
+
+    def __init__(self, encoding: Optional[str] = None):
+        self._decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+        self._buffer = ""
+        self._pos = 0
+        self._retry_remaining = 0  # 값 해석에 실패했을 때 다시 시도할 남은 버퍼 길이
+        self._eof = False
+        self._state = "start"
+        self._fallback: List[str] = []  # JSON이 아닌 본문
+        self.meta: Dict[str, Any] = {}
+        self.list_key: Optional[str] = None  # None이고 is_array면 최상위 배열
+        self.is_array = False
+        self.error: Optional[Dict[str, Any]] = None
+        self.length = 0  # 받은 문자 수
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Any]:
+        """본문 조각을 추가하고 새로 완성된 일정 항목을 반환합니다."""
+        text = chunk if isinstance(chunk, str) else self._decoder.decode(chunk)
+        return self._consume(text)
+
+    def close(self) -> List[Any]:
+        """본문 끝. 남은 항목을 반환하며, 본문이 중간에 끊겼으면 error를 설정합니다."""
+        text = self._decoder.decode(b"", final=True)
+        self._eof = True
+        items = self._consume(text)
+        if self.error is None and self._state not in ("done", "fallback"):
+            self._fail("응답이 중간에 끊겼습니다.")
+        return items
+
+    def build_response(self, items: List[Any]) -> Any:
+        """모은 일정 항목으로 parse_schedule_response와 같은 형태의 결과를 만듭니다."""
+        if self.error is not None:
+            return self.error
+        if self._state == "fallback":
+            return parse_schedule_response("".join(self._fallback))
+        logger.info("응답 내용 길이: %d, 일정 항목 %d개", self.length, len(items))
+        if self.is_array:
+            return items
+        response = dict(self.meta)
+        if self.list_key is not None:
+            response[self.list_key] = items
+        return response
+
+    def _fail(self, message: str):
+        snippet = self._buffer[self._pos:self._pos + 200]
+        logger.error(f"JSON 파싱 실패: {message} (위치 {self.length - len(self._buffer) + self._pos}: {snippet!r})")
+        self.error = {"error": f"JSON 파싱 실패: {message}", "raw_response": snippet}
+        self._state = "done"
+
+    def _consume(self, text: str) -> List[Any]:
+        self.length += len(text)
+        if self.error is not None:
+            return []
+        if self._state == "fallback":
+            self._fallback.append(text)
+            return []
+        self._buffer += text
+        items: List[Any] = []
+        try:
+            while self._step(items):
+                self._retry_remaining = 0
+        except _NeedMoreData:
+            pass
+        except ValueError as e:
+            self._fail(str(e))
+        if self._pos > _TRIM_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        return items
+
+    def _skip_whitespace(self, pos: int) -> int:
+        pos = _WHITESPACE.match(self._buffer, pos).end()
+        if pos >= len(self._buffer):
+            if self._eof:
+                raise ValueError("예상하지 못한 응답 끝")
+            raise _NeedMoreData
+        return pos
+
+    def _decode(self, pos: int) -> Tuple[Any, int]:
+        """pos에서 JSON 값 하나를 해석합니다. 값이 버퍼 끝에 걸쳐 있으면 데이터를 더 기다립니다."""
+        remaining = len(self._buffer) - pos
+        if not self._eof and remaining < self._retry_remaining:
+            raise _NeedMoreData  # 큰 값을 조각마다 처음부터 다시 해석하지 않도록 버퍼가 두 배가 될 때까지 대기
+        try:
+            value, end = _JSON_DECODER.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            self._retry_remaining = remaining * 2
+            raise _NeedMoreData
+        if not self._eof and (end >= len(self._buffer) or self._buffer[end] not in _VALUE_TERMINATORS):
+            # 숫자는 조각 경계에서 잘릴 수 있으므로("12" + "3.5") 값 뒤에 구분 문자가 온 것을 확인한 뒤 확정
+            self._retry_remaining = remaining + 1
+            raise _NeedMoreData
+        return value, end
+
+    def _expect(self, pos: int, chars: str) -> Tuple[str, int]:
+        pos = self._skip_whitespace(pos)
+        char = self._buffer[pos]
+        if char not in chars:
+            raise ValueError(f"'{chars}' 중 하나가 필요하지만 {char!r}이(가) 있습니다.")
+        return char, pos + 1
+
+    def _step(self, items: List[Any]) -> bool:
+        """상태 하나를 처리합니다. 버퍼를 다 쓰면 _NeedMoreData가 발생하며, 위치는 한 단계가 끝날 때만 갱신됩니다."""
+        state = self._state
+        if state == "done":
+            if _WHITESPACE.match(self._buffer, self._pos).end() < len(self._buffer):
+                raise ValueError("JSON 값 뒤에 추가 데이터가 있습니다.")
+            self._pos = len(self._buffer)
+            return False
+
+        if state == "start":
+            pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if pos >= len(self._buffer):
+                if not self._eof:
+                    raise _NeedMoreData
+                self._state = "fallback"  # 빈 응답
+                return False
+            char = self._buffer[pos]
+            if char == "[":
+                self.is_array = True
+                self._state, self._pos = "items_first", pos + 1
+            elif char == "{":
+                self._state, self._pos = "key_first", pos + 1
+            else:
+                logger.debug("JSON이 아닌 응답 (처음 200자): %s", self._buffer[pos:pos + 200])
+                self._fallback.append(self._buffer[pos:])
+                self._buffer, self._pos = "", 0
+                self._state = "fallback"
+                return False
+            return True
+
+        if state in ("key_first", "key"):
+            pos = self._skip_whitespace(self._pos)
+            if state == "key_first" and self._buffer[pos] == "}":
+                self._state, self._pos = "done", pos + 1
+                return True
+            _, pos = self._expect(pos, '"')
+            key, pos = self._decode(pos - 1)
+            _, pos = self._expect(pos, ":")
+            pos = self._skip_whitespace(pos)
+            if self.list_key is None and key in SCHEDULE_LIST_KEYS and self._buffer[pos] == "[":
+                self.list_key = key
+                self._state, self._pos = "items_first", pos + 1
+            else:
+                self.meta[key], pos = self._decode(pos)
+                self._state, self._pos = "key_next", pos
+            return True
+
+        if state == "key_next":
+            char, pos = self._expect(self._pos, ",}")
+            self._state, self._pos = ("key" if char == "," else "done"), pos
+            return True
+
+        if state in ("items_first", "item"):
+            pos = self._skip_whitespace(self._pos)
+            if state == "items_first" and self._buffer[pos] == "]":
+                self._end_items(pos + 1)
+                return True
+            item, pos = self._decode(pos)
+            items.append(item)
+            self._state, self._pos = "item_next", pos
+            self._scan_items(items)
+            return True
+
+        if state == "item_next":
+            char, pos = self._expect(self._pos, ",]")
+            if char == ",":
+                self._state, self._pos = "item", pos
+            else:
+                self._end_items(pos)
+            return True
+        return False
+
+    def _scan_items(self, items: List[Any]):
+        """
+        버퍼에 완성되어 있는 다음 항목들을 상태 전이 없이 한 번에 해석합니다. (일정 배열의 빠른 경로)
+        배열 끝, 버퍼 끝, 해석할 수 없는 값을 만나면 멈추고 나머지는 _step이 처리합니다.
+        """
+        buffer = self._buffer
+        length = len(buffer)
+        scan = _JSON_DECODER.scan_once
+        skip = _WHITESPACE.match
+        pos = self._pos
+        while True:
+            if pos < length and buffer[pos] in _WHITESPACE_CHARS:
+                pos = skip(buffer, pos).end()
+            if pos >= length or buffer[pos] != ",":
+                return
+            pos += 1
+            if pos < length and buffer[pos] in _WHITESPACE_CHARS:
+                pos = skip(buffer, pos).end()
+            try:
+                item, end = scan(buffer, pos)
+            except (StopIteration, ValueError):
+                return
+            if end >= length or buffer[end] not in _VALUE_TERMINATORS:
+                return
+            items.append(item)
+            pos = self._pos = end
+
+    def _end_items(self, pos: int):
+        self._state = "done" if self.is_array else "key_next"
+        self._pos = pos
+
+
+def read_schedule_response(chunks: Iterable[Union[bytes, str]], encoding: Optional[str] = None, span=None) -> Any:
+    """
+    get_schedule_new 응답 본문을 조각 단위로 읽어 해석합니다. (requests의 iter_content 등)
+    결과와 오류 형태는 parse_schedule_response와 같습니다.
+    span(utils.tracing.Span)을 주면 받은 바이트 수, 해석에 쓴 시간, 일정 항목 수를 기록합니다.
+    """
+    parser = ScheduleStreamParser(encoding)
+    items: List[Any] = []
+    received = 0
+    parse_seconds = 0.0
+    for chunk in chunks:
+        received += len(chunk)
+        started = time.perf_counter()
+        items.extend(parser.feed(chunk))
+        parse_seconds += time.perf_counter() - started
+    items.extend(parser.close())
+    if span is not None:
+        span.set(bytes=received, parse_seconds=round(parse_seconds, 6), items=len(items))
+    return parser.build_response(items)
@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+from typing import Optional, Dict, Any, List
+from utils.credential_manager import CredentialManager
+from utils.logger import logger
+
+
+class AccountRegistry:
+    """
+    여러 하이웍스 계정(회사)의 자격 증명을 암호화하여 보관하는 레지스트리.
+
+    계정마다 이름, 아이디, 비밀번호, 회사 도메인(선택), 사용 여부를 저장하며
+    CredentialManager와 같은 Fernet 키로 data/accounts.enc에 암호화합니다.
+    """
+
+    def __init__(self, credential_manager: Optional[CredentialManager] = None, data_dir=None):
+        self.credential_manager = credential_manager or CredentialManager(data_dir)
+        self.cipher = self.credential_manager.cipher
+        self.accounts_file = os.path.join(self.credential_manager.data_dir, "accounts.enc")
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.accounts_file):
+            return {}
+        with open(self.accounts_file, 'rb') as f:
+            encrypted_data = f.read()
+        return json.loads(self.cipher.decrypt(encrypted_data).decode('utf-8'))
+
+    def _save(self, accounts: Dict[str, Dict[str, Any]]):
+        json_data = json.dumps(accounts, ensure_ascii=False)
+        with open(self.accounts_file, 'wb') as f:
+            f.write(self.cipher.encrypt(json_data.encode('utf-8')))
+
+    def list_accounts(self, enabled_only: bool = False) -> List[Dict[str, Any]]:
+        """등록된 계정 목록을 반환합니다. 불러오지 못하면 빈 목록을 반환합니다."""
+        try:
+            with self._lock:
+                accounts = list(self._load().values())
+        except Exception as e:
+            logger.error(f"계정 목록 로드 실패: {e}")
+            return []
+        if enabled_only:
+            accounts = [account for account in accounts if account.get('enabled', True)]
+        return accounts
+
+    def get_account(self, name: str) -> Optional[Dict[str, Any]]:
+        for account in self.list_accounts():
+            if account['name'] == name:
+                return account
+        return None
+
+    def save_account(self, name: str, username: str, password: str,
+                     company_domain: Optional[str] = None, enabled: bool = True) -> bool:
+        """계정을 추가하거나 같은 이름의 계정을 덮어씁니다."""
+        try:
+            with self._lock:
+                accounts = self._load()
+                accounts[name] = {
+                    'name': name,
+                    'username': username,
+                    'password': password,
+                    'company_domain': company_domain,
+                    'enabled': enabled,
+                }
+                self._save(accounts)
+            logger.info(f"계정이 저장되었습니다: {name} ({username})")
+            return True
+        except Exception as e:
+            logger.error(f"계정 저장 실패: {e}")
+            return False
+
+    def delete_account(self, name: str) -> bool:
+        """계정을 삭제합니다. 없는 계정이면 False를 반환합니다."""
+        try:
+            with self._lock:
+                accounts = self._load()
+                if accounts.pop(name, None) is None:
+                    return False
+                self._save(accounts)
+            logger.info(f"계정이 삭제되었습니다: {name}")
+            return True
+        except Exception as e:
+            logger.error(f"계정 삭제 실패: {e}")
+            return False
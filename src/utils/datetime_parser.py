@@ -0,0 +1,176 @@
+import datetime
+from array import array
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Sequence
+from utils.logger import logger
+
+
+# 시작/종료 일시가 없거나 해석할 수 없을 때 사용하는 값
+MISSING_TIMESTAMP = -(2 ** 63)
+
+# 일정 시작/종료 문자열 형식 (자주 쓰이는 순서)
+SCHEDULE_DATETIME_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+# 표시용 일시 형식
+DISPLAY_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# 숫자 일시(epoch)가 이 값보다 크면 밀리초로 봄 (초 단위로는 5138년 이후)
+EPOCH_MILLIS_THRESHOLD = 10 ** 11
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+# 형식별 (문자열 길이, 날짜/시간 구분자, 초 포함 여부) - strptime 없이 자리수로 해석
+_FIXED_LAYOUTS = {
+    "%Y-%m-%dT%H:%M:%S": (19, "T", True),
+    "%Y-%m-%dT%H:%M": (16, "T", False),
+    "%Y-%m-%d %H:%M:%S": (19, " ", True),
+    "%Y-%m-%d %H:%M": (16, " ", False),
+    "%Y-%m-%d": (10, None, False),
+}
+
+
+@lru_cache(maxsize=4096)
+def _days_since_epoch(year: int, month: int, day: int) -> int:
+    return datetime.date(year, month, day).toordinal() - _EPOCH_ORDINAL
+
+
+def _parse_fixed(value: str, fmt: str) -> int:
+    """고정 자리수 형식을 슬라이스로 해석합니다. 형식이 맞지 않으면 ValueError가 발생합니다."""
+    length, separator, with_seconds = _FIXED_LAYOUTS[fmt]
+    if len(value) != length or value[4] != '-' or value[7] != '-':
+        raise ValueError(value)
+    days = _days_since_epoch(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    if separator is None:
+        return days * 86400
+    if value[10] != separator or value[13] != ':' or (with_seconds and value[16] != ':'):
+        raise ValueError(value)
+    hour, minute = int(value[11:13]), int(value[14:16])
+    second = int(value[17:19]) if with_seconds else 0
+    if hour > 23 or minute > 59 or second > 59:
+        raise ValueError(value)
+    return days * 86400 + hour * 3600 + minute * 60 + second
+
+
+def _parse_with_format(value: str, fmt: str) -> int:
+    if fmt in _FIXED_LAYOUTS:
+        try:
+            return _parse_fixed(value, fmt)
+        except ValueError:
+            pass  # 자리수가 맞지 않는 값("2024-1-5 9:00" 등)은 strptime으로 해석
+    parsed = datetime.datetime.strptime(value, fmt)
+    return (parsed - _EPOCH) // datetime.timedelta(seconds=1)
+
+
+def _is_epoch(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_epoch(value: Any) -> int:
+    """
+    숫자 epoch(초 또는 밀리초)를 문자열 일시와 같은 기준(현지 시각, 시간대 변환 없음)의 초로 바꿉니다.
+    범위를 벗어나면 MISSING_TIMESTAMP를 반환합니다.
+    """
+    seconds = value / 1000 if abs(value) > EPOCH_MILLIS_THRESHOLD else value
+    try:
+        local = datetime.datetime.fromtimestamp(seconds)
+    except (OverflowError, OSError, ValueError):
+        return MISSING_TIMESTAMP
+    return (local - _EPOCH) // datetime.timedelta(seconds=1)
+
+
+def detect_format(values: Iterable[Any], formats: Sequence[str] = SCHEDULE_DATETIME_FORMATS) -> Optional[str]:
+    """
+    처음 나오는 일시 문자열(비어 있지 않은 값)을 해석할 수 있는 첫 형식을 반환합니다.
+    숫자(epoch)는 형식이 없으므로 건너뛰며, 첫 문자열을 해석하지 못하면 None을 반환합니다.
+    """
+    for value in values:
+        if not value or _is_epoch(value):
+            continue
+        text = str(value)
+        for fmt in formats:
+            try:
+                _parse_with_format(text, fmt)
+                return fmt
+            except ValueError:
+                continue
+        return None
+    return None
+
+
+class TimestampParser:
+    """
+    일시 문자열을 epoch 초(시간대 변환 없음)로 변환하는 파서.
+
+    배치마다 첫 값으로 형식을 한 번 감지한 뒤 그 형식으로 해석하고, 같은 문자열은 메모이즈합니다.
+    감지한 형식과 다른 값만 전체 형식 목록으로 다시 시도합니다. 숫자 값은 epoch(초/밀리초)로 해석합니다.
+    """
+
+    def __init__(self, fmt: Optional[str] = None, formats: Sequence[str] = SCHEDULE_DATETIME_FORMATS):
+        self.format = fmt
+        self.formats = formats
+        self._cache: Dict[str, int] = {}
+
+    def detect(self, values: Iterable[Any]) -> Optional[str]:
+        """배치의 형식을 감지하여 기본 형식으로 사용합니다."""
+        self.format = detect_format(values, self.formats) or self.format
+        return self.format
+
+    def parse(self, value: Any) -> int:
+        if not value:
+            return MISSING_TIMESTAMP
+        if _is_epoch(value):
+            return _parse_epoch(value)
+        text = str(value)
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+
+        timestamp = MISSING_TIMESTAMP
+        if self.format is not None:
+            try:
+                timestamp = _parse_with_format(text, self.format)
+            except ValueError:
+                timestamp = MISSING_TIMESTAMP
+        if timestamp == MISSING_TIMESTAMP:
+            for fmt in self.formats:
+                if fmt == self.format:
+                    continue
+                try:
+                    timestamp = _parse_with_format(text, fmt)
+                    break
+                except ValueError:
+                    continue
+
+        self._cache[text] = timestamp
+        return timestamp
+
+    def parse_column(self, values: Sequence[Any]) -> array:
+        """
+        값 목록 전체를 epoch 초 배열로 변환합니다. 형식은 이 목록의 첫 값으로 한 번 감지합니다.
+        해석하지 못한 값은 MISSING_TIMESTAMP가 되며 개수와 예시를 경고로 남깁니다.
+        """
+        self.detect(values)
+        timestamps = array('q', map(self.parse, values))
+        failed = [value for value, timestamp in zip(values, timestamps) if value and timestamp == MISSING_TIMESTAMP]
+        if failed:
+            logger.warning("일시 %d개를 해석하지 못했습니다. (예: %r)", len(failed), failed[0])
+        return timestamps
+
+
+def parse_timestamp(value: Any) -> int:
+    """일시 문자열 하나를 epoch 초로 변환합니다. 해석할 수 없으면 MISSING_TIMESTAMP를 반환합니다."""
+    return TimestampParser().parse(value)
+
+
+def parse_timestamp_column(values: Sequence[Any]) -> array:
+    """일시 문자열 목록을 epoch 초 배열로 한 번에 변환합니다."""
+    return TimestampParser().parse_column(values)
+
+
+@lru_cache(maxsize=8192)
+def format_timestamp(timestamp: int) -> str:
+    """epoch 초를 "YYYY-MM-DD HH:MM" 문자열로 변환합니다."""
+    if timestamp == MISSING_TIMESTAMP:
+        return ''
+    return (_EPOCH + datetime.timedelta(seconds=timestamp)).strftime(DISPLAY_DATETIME_FORMAT)
@@ -0,0 +1,47 @@
+import re
+from html.entities import html5
+from typing import Any
+
+
+# 하이웍스 화면과 동일하게 표시하기 위해 표준 변환보다 우선 적용하는 엔티티
+HTML_ENTITIES = {
+    '&nbsp;': ' ',
+    '&#39;': "'",
+}
+
+# 숫자 엔티티(&#60;, &#x3C;)와 이름 엔티티(&lt;)를 한 번에 찾는 패턴
+ENTITY_PATTERN = re.compile(r'&(?:#(\d+)|#[xX]([0-9a-fA-F]+)|([A-Za-z][A-Za-z0-9]*));')
+
+
+def _replace_entity(match):
+    entity = match.group(0)
+    override = HTML_ENTITIES.get(entity)
+    if override is not None:
+        return override
+    decimal, hexadecimal, name = match.groups()
+    try:
+        if decimal is not None:
+            return chr(int(decimal))
+        if hexadecimal is not None:
+            return chr(int(hexadecimal, 16))
+    except (ValueError, OverflowError):  # 유니코드 범위를 벗어난 숫자 엔티티는 그대로 둠
+        return entity
+    return html5.get(name + ';', entity)
+
+
+def decode_html_entities(text):
+    """HTML 엔티티를 실제 문자로 변환합니다. '&'가 없는 문자열은 그대로 반환합니다."""
+    if not text or '&' not in text:
+        return text
+    return ENTITY_PATTERN.sub(_replace_entity, text)
+
+
+def decode_json_html_entities(obj: Any) -> Any:
+    """JSON 객체 내의 모든 문자열에서 HTML 엔티티를 변환합니다."""
+    if isinstance(obj, str):
+        return decode_html_entities(obj)
+    if isinstance(obj, dict):
+        return {k: decode_json_html_entities(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [decode_json_html_entities(item) for item in obj]
+    return obj
@@ -0,0 +1,31 @@
+import importlib
+import threading
+from typing import Iterable
+from utils.logger import logger
+
+
+# 첫 화면 표시 전에 import하지 않는 무거운 모듈 (처음 사용하는 곳에서 불러옴)
+DEFERRED_MODULES = ("openpyxl", "selenium", "webdriver_manager", "requests")
+
+# 창이 표시된 뒤 백그라운드에서 미리 불러올 모듈 (자주 쓰는 순서)
+PREWARM_MODULES = ("requests", "scraper.hiworks_scraper", "export.registry", "openpyxl")
+
+
+def prewarm_modules(names: Iterable[str] = PREWARM_MODULES) -> threading.Thread:
+    """
+    모듈을 데몬 스레드에서 미리 import합니다.
+    설치되지 않은 모듈은 건너뛰며, 실제로 사용할 때 다시 import해도 이미 로드된 모듈을 사용합니다.
+    """
+    names = tuple(names)
+
+    def run():
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                logger.debug(f"모듈 미리 불러오기 건너뜀: {name} ({e})")
+        logger.debug(f"모듈 미리 불러오기 완료: {', '.join(names)}")
+
+    thread = threading.Thread(target=run, name="module-prewarm", daemon=True)
+    thread.start()
+    return thread
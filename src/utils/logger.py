@@ -1,7 +1,9 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from typing import Optional
 from config.settings import settings
 
@@ -22,11 +24,40 @@ def get_app_log_dir():
     return log_dir
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """
+    레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러.
+    같은 프로세스의 QueueListener만 읽으므로 %-스타일 인자 결합과 포맷은 백그라운드 스레드에서 합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _create_file_handler(log_file: str) -> logging.Handler:
+    """logging.rotation 설정에 따라 크기(size) 또는 시간(time) 기준으로 교체되는 파일 핸들러를 만듭니다."""
+    backup_count = settings.get("logging.backup_count", 5)
+    if settings.get("logging.rotation", "size") == "time":
+        return TimedRotatingFileHandler(
+            log_file, when=settings.get("logging.when", "midnight"),
+            backupCount=backup_count, encoding='utf-8', delay=True
+        )
+    return RotatingFileHandler(
+        log_file, maxBytes=settings.get("logging.max_bytes", 10 * 1024 * 1024),
+        backupCount=backup_count, encoding='utf-8', delay=True
+    )
+
+
 class Logger:
-    """애플리케이션 로깅을 관리하는 클래스"""
+    """
+    애플리케이션 로깅을 관리하는 클래스.
+    호출한 스레드는 레코드를 큐에 넣기만 하고, 콘솔/파일 쓰기는 QueueListener 스레드가 처리합니다.
+    메시지는 %-스타일 인자로 넘기면(logger.info("요청: %s", url)) 실제로 기록될 때만 만들어집니다.
+    """
     
     def __init__(self, name: str = "hiworks_schedule"):
         self.name = name
+        self.listener: Optional[QueueListener] = None
         self.logger = self._setup_logger()
     
     def _setup_logger(self) -> logging.Logger:
@@ -50,54 +81,67 @@ class Logger:
         # 콘솔 핸들러 설정
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers = [console_handler]
         
-        # 파일 핸들러 설정
+        # 파일 핸들러 설정 (하루 한 파일 대신 크기/시간 기준으로 교체)
         try:
             log_path = get_app_log_dir()
             if not os.path.exists(log_path):
                 os.makedirs(log_path, exist_ok=True)
             
-            log_file = os.path.join(log_path, f"{self.name}_{datetime.now().strftime('%Y%m%d')}.log")
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler = _create_file_handler(os.path.join(log_path, f"{self.name}.log"))
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             # 로그 파일 생성 실패 시 콘솔만 사용
             print(f"로그 파일 생성 실패: {e}")
         
+        # 기록은 백그라운드 스레드에서 (종료 시 남은 레코드를 모두 쓰고 멈춤)
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(_DeferredQueueHandler(log_queue))
+        logger.propagate = False
+        self.listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.shutdown)
+        
         return logger
     
-    def debug(self, message: str):
+    def shutdown(self):
+        """큐에 남은 로그를 모두 기록하고 백그라운드 스레드를 멈춥니다."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+    
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 레벨이 기록되는지 확인합니다. 만들기 비싼 메시지는 이것으로 먼저 확인하세요."""
+        return self.logger.isEnabledFor(level)
+    
+    def debug(self, message: str, *args):
         """디버그 로그를 기록합니다."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """정보 로그를 기록합니다."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """경고 로그를 기록합니다."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """에러 로그를 기록합니다."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """치명적 오류 로그를 기록합니다."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
     
     def log_web_action(self, action: str, url: str, status: str = "success", error: Optional[str] = None):
         """웹 액션 로그를 기록합니다."""
-        message = f"Web Action: {action} | URL: {url} | Status: {status}"
-        if error:
-            message += f" | Error: {error}"
-        
         if status == "success":
-            self.info(message)
+            self.info("Web Action: %s | URL: %s | Status: %s", action, url, status)
         else:
-            self.error(message)
+            self.error("Web Action: %s | URL: %s | Status: %s | Error: %s", action, url, status, error)
 
 
 # 전역 로거 인스턴스
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import time
+from typing import Optional, Dict, Any, List
+from config.settings import settings
+from utils.credential_manager import CredentialManager
+from utils.logger import logger
+
+# 세션 만료 추정치 기본값 (초)
+DEFAULT_SESSION_MAX_AGE = 8 * 60 * 60
+
+
+def session_file_suffix(account_name: str) -> str:
+    """계정 이름을 파일 이름에 쓸 수 있는 문자열로 바꿉니다."""
+    return hashlib.sha1(account_name.encode('utf-8')).hexdigest()[:12]
+
+
+class SessionStore:
+    """로그인 세션(쿠키, 회사 도메인)을 암호화하여 디스크에 보관하는 클래스"""
+
+    def __init__(self, credential_manager: Optional[CredentialManager] = None, data_dir=None,
+                 account_name: Optional[str] = None):
+        # 자격 증명과 동일한 Fernet 키로 암호화
+        self.credential_manager = credential_manager or CredentialManager(data_dir)
+        self.cipher = self.credential_manager.cipher
+        # 계정 레지스트리의 계정은 계정별 파일에 세션을 따로 보관
+        file_name = f"session_{session_file_suffix(account_name)}.enc" if account_name else "session.enc"
+        self.session_file = os.path.join(self.credential_manager.data_dir, file_name)
+        self.max_age = settings.get("hiworks.session_max_age", DEFAULT_SESSION_MAX_AGE)
+
+    def save_session(self, username: str, cookies: List[Dict[str, Any]], company_domain: str) -> bool:
+        """세션 쿠키와 회사 도메인을 암호화하여 저장합니다."""
+        try:
+            saved_at = time.time()
+            session_data = {
+                'username': username,
+                'company_domain': company_domain,
+                'cookies': cookies,
+                'saved_at': saved_at,
+                'expires_at': saved_at + self.max_age,
+            }
+            json_data = json.dumps(session_data, ensure_ascii=False)
+            encrypted_data = self.cipher.encrypt(json_data.encode('utf-8'))
+
+            with open(self.session_file, 'wb') as f:
+                f.write(encrypted_data)
+
+            logger.info(f"로그인 세션이 저장되었습니다. 사용자: {username}, 쿠키 {len(cookies)}개")
+            return True
+
+        except Exception as e:
+            logger.error(f"로그인 세션 저장 실패: {e}")
+            return False
+
+    def load_session(self, username: str) -> Optional[Dict[str, Any]]:
+        """저장된 세션을 로드합니다. 사용자가 다르거나 만료되었으면 None을 반환합니다."""
+        try:
+            if not os.path.exists(self.session_file):
+                return None
+
+            with open(self.session_file, 'rb') as f:
+                encrypted_data = f.read()
+
+            session_data = json.loads(self.cipher.decrypt(encrypted_data).decode('utf-8'))
+
+            if session_data.get('username') != username:
+                logger.info("저장된 세션의 사용자가 달라 사용하지 않습니다.")
+                return None
+
+            if session_data.get('expires_at', 0) <= time.time():
+                logger.info("저장된 세션이 만료되었습니다.")
+                self.delete_session()
+                return None
+
+            return session_data
+
+        except Exception as e:
+            logger.error(f"로그인 세션 로드 실패: {e}")
+            return None
+
+    def delete_session(self) -> bool:
+        """저장된 세션을 삭제합니다."""
+        try:
+            if os.path.exists(self.session_file):
+                os.remove(self.session_file)
+                logger.info("저장된 로그인 세션이 삭제되었습니다.")
+                return True
+            return False
+
+        except Exception as e:
+            logger.error(f"로그인 세션 삭제 실패: {e}")
+            return False
@@ -0,0 +1,157 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from config.settings import settings
+
+
+# 내보내기 형식
+TRACE_FORMAT_JSON = "json"
+TRACE_FORMAT_CHROME = "chrome"
+TRACE_FORMATS = (TRACE_FORMAT_CHROME, TRACE_FORMAT_JSON)
+
+# 메모리에 보관할 최대 구간 수 (오래된 것부터 버림)
+DEFAULT_MAX_SPANS = 10000
+
+
+class Span:
+    """측정 구간 하나. 바이트 수, 행 수 같은 값은 attrs에 담습니다."""
+    __slots__ = ("name", "category", "start", "duration", "thread_id", "thread_name", "attrs")
+
+    def __init__(self, name: str, category: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.start = time.perf_counter()
+        self.duration: Optional[float] = None  # 끝나기 전에는 None
+        current = threading.current_thread()
+        self.thread_id = current.ident
+        self.thread_name = current.name
+        self.attrs = attrs
+
+    def set(self, **attrs: Any):
+        """구간에 값을 기록합니다. (예: span.set(bytes=..., rows=...))"""
+        self.attrs.update(attrs)
+
+    def add(self, key: str, amount: float):
+        """누적 값을 더합니다. (예: 조각마다 받은 바이트 수)"""
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+
+class Tracer:
+    """
+    실행 구간별 소요 시간과 크기 정보를 모으는 추적기.
+    with tracer.span("http.schedule", bytes=...) as span: 형태로 측정하며,
+    모은 구간은 요약(summary), JSON, Chrome trace(chrome://tracing, Perfetto) 형식으로 내보낼 수 있습니다.
+    """
+
+    def __init__(self, max_spans: Optional[int] = None, enabled: Optional[bool] = None):
+        self.enabled = settings.get("diagnostics.tracing", True) if enabled is None else enabled
+        self._spans = deque(maxlen=max_spans or settings.get("diagnostics.max_spans", DEFAULT_MAX_SPANS))
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()  # trace 시간 기준점
+        self._origin_wall = time.time()
+
+    @contextmanager
+    def span(self, name: str, category: str = "app", **attrs: Any) -> Iterator[Span]:
+        """구간을 측정합니다. 예외가 나면 error 속성에 기록하고 다시 발생시킵니다."""
+        span = Span(name, category, attrs)
+        try:
+            yield span
+        except BaseException as e:
+            span.attrs["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration = time.perf_counter() - span.start
+            if self.enabled:
+                with self._lock:
+                    self._spans.append(span)
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """구간 이름별 횟수, 합계/평균/최대 시간(초)과 숫자 속성 합계를 총 시간이 긴 순서로 반환합니다."""
+        groups: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans():
+            group = groups.setdefault(span.name, {
+                "name": span.name, "category": span.category, "count": 0,
+                "total": 0.0, "max": 0.0, "errors": 0, "totals": {},
+            })
+            group["count"] += 1
+            group["total"] += span.duration
+            group["max"] = max(group["max"], span.duration)
+            if "error" in span.attrs:
+                group["errors"] += 1
+            for key, value in span.attrs.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    group["totals"][key] = group["totals"].get(key, 0) + value
+        for group in groups.values():
+            group["avg"] = group["total"] / group["count"]
+        return sorted(groups.values(), key=lambda group: group["total"], reverse=True)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """구간 목록 (시작 시각은 추적기 생성 시점 기준 초)"""
+        return [
+            {
+                "name": span.name, "category": span.category,
+                "start": round(span.start - self._origin, 6), "duration": round(span.duration, 6),
+                "thread": span.thread_name, "attrs": span.attrs,
+            }
+            for span in self.spans()
+        ]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace event 형식 ("X" 완료 이벤트, 마이크로초 단위)"""
+        pid = os.getpid()
+        events = []
+        thread_names = {}
+        for span in self.spans():
+            thread_names[span.thread_id] = span.thread_name
+            events.append({
+                "name": span.name, "cat": span.category, "ph": "X",
+                "ts": round((span.start - self._origin) * 1e6, 1), "dur": round(span.duration * 1e6, 1),
+                "pid": pid, "tid": span.thread_id, "args": span.attrs,
+            })
+        for thread_id, thread_name in thread_names.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                           "args": {"name": thread_name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"started_at": self._origin_wall}}
+
+    def dump(self, file_path: str, format_name: str = TRACE_FORMAT_CHROME) -> int:
+        """구간을 파일로 저장하고 저장한 구간 수를 반환합니다."""
+        if format_name not in TRACE_FORMATS:
+            raise ValueError(f"지원하지 않는 trace 형식입니다: {format_name}")
+        data = self.to_chrome_trace() if format_name == TRACE_FORMAT_CHROME else {
+            "started_at": self._origin_wall, "summary": self.summary(), "spans": self.to_records(),
+        }
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1, default=str)
+        return len(self._spans)
+
+
+# 전역 추적기 인스턴스
+tracer = Tracer()
+
+
+def traced(name: str, category: str = "app") -> Callable:
+    """함수 호출 전체를 구간으로 측정하는 데코레이터. bool을 반환하면 ok 속성에 기록합니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(name, category) as span:
+                result = func(*args, **kwargs)
+                if isinstance(result, bool):
+                    span.set(ok=result)
+                return result
+        return wrapper
+    return decorator